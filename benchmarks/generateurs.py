@@ -0,0 +1,91 @@
+"""
+Générateurs reproductibles d'automates et de corpus pour les mesures.
+Chaque générateur prend une graine : deux appels avec les mêmes paramètres
+produisent exactement le même objet.
+"""
+
+import os
+import random
+import sys
+from typing import List, Optional, Sequence, Set
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "prototype"))
+
+from Automate import AFDC, AFND, AFNS  # noqa: E402
+from Mot import Mot  # noqa: E402
+from Langage import Langage  # noqa: E402
+
+ALPHABET_DEFAUT = "ab"
+
+
+def _etats(nb_etats: int) -> List[str]:
+    """Noms des états q0, q1, ..."""
+    return [f"q{i}" for i in range(nb_etats)]
+
+
+def _finaux(etats: List[str], proportion: float, generateur: random.Random) -> Set[str]:
+    """Tire les états finaux (au moins un)."""
+    finaux = {etat for etat in etats if generateur.random() < proportion}
+    return finaux or {generateur.choice(etats)}
+
+
+def afd_aleatoire(nb_etats: int, alphabet: Sequence[str] = ALPHABET_DEFAUT, densite: float = 0.9,
+                  proportion_finaux: float = 0.3, graine: int = 0) -> AFDC:
+    """
+    AFD aléatoire : chaque couple (état, symbole) a une transition avec la
+    probabilité `densite` (les autres vont implicitement au puits).
+    """
+    generateur = random.Random(graine)
+    etats = _etats(nb_etats)
+    automate = AFDC(set(alphabet), set(etats), etats[0], _finaux(etats, proportion_finaux, generateur))
+    automate.ajouter_transitions((source, symbole, generateur.choice(etats))
+                                 for source in etats for symbole in alphabet
+                                 if generateur.random() < densite)
+    return automate
+
+
+def _aretes_aleatoires(etats: List[str], alphabet: Sequence[str], densite: float,
+                       generateur: random.Random) -> Set[tuple]:
+    """Tire en moyenne `densite` transitions par couple (état, symbole)."""
+    nombre = int(len(etats) * len(alphabet) * densite)
+    return {(generateur.choice(etats), generateur.choice(alphabet), generateur.choice(etats))
+            for _ in range(nombre)}
+
+
+def afn_aleatoire(nb_etats: int, alphabet: Sequence[str] = ALPHABET_DEFAUT, densite: float = 1.5,
+                  proportion_finaux: float = 0.3, graine: int = 0) -> AFND:
+    """AFN aléatoire avec en moyenne `densite` cibles par couple (état, symbole)."""
+    generateur = random.Random(graine)
+    etats = _etats(nb_etats)
+    automate = AFND(set(alphabet), set(etats), etats[0], _finaux(etats, proportion_finaux, generateur))
+    automate.ajouter_transitions(sorted(_aretes_aleatoires(etats, alphabet, densite, generateur)))
+    return automate
+
+
+def afns_aleatoire(nb_etats: int, alphabet: Sequence[str] = ALPHABET_DEFAUT, densite: float = 1.5,
+                   densite_epsilon: float = 0.3, proportion_finaux: float = 0.3, graine: int = 0) -> AFNS:
+    """ε-AFN aléatoire : comme `afn_aleatoire`, plus `densite_epsilon` ε-transitions par état."""
+    generateur = random.Random(graine)
+    etats = _etats(nb_etats)
+    automate = AFNS(set(alphabet), set(etats), etats[0], _finaux(etats, proportion_finaux, generateur))
+    aretes = _aretes_aleatoires(etats, alphabet, densite, generateur)
+    aretes.update((generateur.choice(etats), automate.epsilon, generateur.choice(etats))
+                  for _ in range(int(nb_etats * densite_epsilon)))
+    automate.ajouter_transitions(sorted(aretes))
+    return automate
+
+
+def corpus_aleatoire(nb_mots: int, alphabet: Sequence[str] = ALPHABET_DEFAUT, longueur_min: int = 0,
+                     longueur_max: int = 32, graine: int = 0) -> List[str]:
+    """Mots aléatoires de longueurs uniformes dans [longueur_min, longueur_max]."""
+    generateur = random.Random(graine)
+    return [''.join(generateur.choices(alphabet, k=generateur.randint(longueur_min, longueur_max)))
+            for _ in range(nb_mots)]
+
+
+def langage_aleatoire(nb_mots: int, alphabet: Sequence[str] = ALPHABET_DEFAUT, longueur_max: int = 12,
+                      stockage: str = "ensemble", graine: int = 0,
+                      alphabet_langage: Optional[Set[str]] = None) -> Langage:
+    """Langage fini d'au plus `nb_mots` mots aléatoires, dans le stockage demandé."""
+    mots = corpus_aleatoire(nb_mots, alphabet, 0, longueur_max, graine)
+    return Langage({Mot(mot) for mot in mots}, alphabet_langage or set(alphabet), stockage)
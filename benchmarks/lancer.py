@@ -0,0 +1,225 @@
+"""
+Mesure des chemins de reconnaissance et des opérations sur les langages.
+
+    python benchmarks/lancer.py --tailles 10 100 1000 --sortie mesures.json
+    python benchmarks/lancer.py --reference mesures.json
+
+Chaque cas est exécuté `--repetitions` fois ; le résultat JSON conserve le
+minimum et la médiane des durées. Avec --reference, les médianes sont
+comparées à une exécution précédente et le code de sortie vaut 1 si un cas
+ralentit au-delà du seuil.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# generateurs ajoute prototype/ au chemin d'import
+from generateurs import (afd_aleatoire, afn_aleatoire, afns_aleatoire, corpus_aleatoire,
+                         langage_aleatoire)
+from Automate import Automate, np
+from Mot import Mot
+from Langage import LangageReconnaissable
+
+FORMAT = 1
+
+
+def chronometrer(fonction: Callable[[], Any], repetitions: int) -> Dict[str, float]:
+    """Exécute la fonction `repetitions` fois et retourne le minimum et la médiane (secondes)."""
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - debut)
+    return {"min_s": min(durees), "mediane_s": statistics.median(durees)}
+
+
+class Campagne:
+    """Accumule les mesures d'une exécution."""
+
+    def __init__(self, repetitions: int, bavard: bool = True) -> None:
+        self.repetitions = repetitions
+        self.bavard = bavard
+        self.resultats: List[Dict[str, Any]] = []
+
+    def mesurer(self, cas: str, parametres: Dict[str, Any], operations: int,
+                fonction: Callable[[], Any]) -> None:
+        """Mesure un cas ; `operations` est le nombre d'opérations élémentaires par exécution."""
+        mesure = chronometrer(fonction, self.repetitions)
+        mesure["par_operation_us"] = mesure["mediane_s"] / max(operations, 1) * 1e6
+        self.resultats.append({"cas": cas, "parametres": parametres, "operations": operations, **mesure})
+        if self.bavard:
+            details = ", ".join(f"{cle}={valeur}" for cle, valeur in parametres.items())
+            print(f"{cas:<40} {details:<40} {mesure['par_operation_us']:>12.2f} µs/op", file=sys.stderr)
+
+
+def _reconnaitre_tout(automate: Automate, mots: List[str]) -> Callable[[], None]:
+    def executer() -> None:
+        for mot in mots:
+            automate.reconnaitre_mot(mot)
+    return executer
+
+
+def _avec_chemin(automate: Automate, mots: List[str]) -> Callable[[], None]:
+    def executer() -> None:
+        for mot in mots:
+            automate.reconnaitre_mot_avec_chemin(mot)
+    return executer
+
+
+def mesurer_automates(campagne: Campagne, taille: int, mots: List[str], mots_chemin: List[str],
+                      graine: int) -> None:
+    """Mesure la reconnaissance par AFD, AFN et ε-AFN d'une taille donnée."""
+    afd = afd_aleatoire(taille, graine=graine)
+    campagne.mesurer("AFDC.reconnaitre_mot", {"etats": taille}, len(mots), _reconnaitre_tout(afd, mots))
+    if np is not None:
+        campagne.mesurer("AFDC.reconnaitre_mots", {"etats": taille}, len(mots),
+                         lambda: afd.reconnaitre_mots(mots))
+    campagne.mesurer("AFDC.reconnaitre_mot_avec_chemin", {"etats": taille}, len(mots_chemin),
+                     _avec_chemin(afd, mots_chemin))
+
+    for nom, automate in (("AFND", afn_aleatoire(taille, graine=graine)),
+                          ("AFNS", afns_aleatoire(taille, graine=graine))):
+        for moteur in automate.MOTEURS:
+            automate.choisir_moteur(moteur)
+            campagne.mesurer(f"{nom}.reconnaitre_mot", {"etats": taille, "moteur": moteur}, len(mots),
+                             _reconnaitre_tout(automate, mots))
+        automate.choisir_moteur("ensembles")
+        campagne.mesurer(f"{nom}.reconnaitre_mot_avec_chemin", {"etats": taille}, len(mots_chemin),
+                         _avec_chemin(automate, mots_chemin))
+
+        if nom == "AFNS":
+            etats = sorted(automate.etats)
+            groupes = [set(etats[i::7]) for i in range(7)]
+
+            def fermetures_a_froid(afns=automate) -> None:
+                afns._fermetures = None
+                afns.fermetures_epsilon()
+
+            def fermetures(afns=automate) -> None:
+                for groupe in groupes:
+                    afns.fermeture_epsilon(groupe)
+
+            campagne.mesurer("AFNS.fermetures_epsilon", {"etats": taille}, 1, fermetures_a_froid)
+            campagne.mesurer("AFNS.fermeture_epsilon", {"etats": taille}, len(groupes), fermetures)
+
+
+def mesurer_langages(campagne: Campagne, taille: int, graine: int) -> None:
+    """Mesure les opérations sur des langages finis de `taille` mots, pour chaque stockage."""
+    # La concaténation produit jusqu'à taille² mots : ses opérandes sont plafonnés
+    petite = min(taille, 300)
+    requetes = corpus_aleatoire(1000, longueur_max=12, graine=graine + 1)
+    for stockage in ("ensemble", "trie"):
+        gauche = langage_aleatoire(taille, stockage=stockage, graine=graine)
+        droite = langage_aleatoire(taille, stockage=stockage, graine=graine + 2)
+        petit_gauche = langage_aleatoire(petite, stockage=stockage, graine=graine)
+        petit_droite = langage_aleatoire(petite, longueur_max=4, stockage=stockage, graine=graine + 2)
+        parametres = {"mots": taille, "stockage": stockage}
+        campagne.mesurer("Langage.contient", parametres, len(requetes),
+                         lambda: [gauche.contient(mot) for mot in requetes])
+        campagne.mesurer("Langage.union", parametres, 1, lambda: gauche + droite)
+        campagne.mesurer("Langage.concatenation", {"mots": petite, "stockage": stockage}, 1,
+                         lambda: petit_gauche * petit_droite)
+        campagne.mesurer("Langage.quotient", {"mots": petite, "stockage": stockage}, 1,
+                         lambda: petit_gauche.quotient_de_langages(petit_droite))
+        campagne.mesurer("Langage.enumerer", parametres, 1, lambda: list(gauche.enumerer()))
+
+    etoile = langage_aleatoire(min(taille, 50), longueur_max=4, graine=graine).iteration_sur_langages()
+    campagne.mesurer("LangageReconnaissable.contient", {"mots": min(taille, 50)}, len(requetes),
+                     lambda: [etoile.contient(mot) for mot in requetes])
+    for moteur in LangageReconnaissable.MOTEURS_REGEX:
+        regex = LangageReconnaissable()
+        regex.regex_vers_langage("(a|b)*abb(a|b)*", determiniser=True, moteur=moteur)
+        campagne.mesurer("LangageReconnaissable.contient_regex", {"moteur": moteur}, len(requetes),
+                         lambda: [regex.contient(Mot(mot)) for mot in requetes])
+
+    # Expression longue : une chaîne de milliers de facteurs ne doit épuiser la pile d'aucun moteur
+    facteurs = 2000
+    mot_long = Mot("ab" * facteurs * 2)
+    for moteur in LangageReconnaissable.MOTEURS_REGEX:
+        def contient_longue(moteur=moteur) -> None:
+            regex = LangageReconnaissable()
+            regex.regex_vers_langage("(" + "ab" * facteurs + ")*", moteur=moteur)
+            if not regex.contient(mot_long):
+                raise AssertionError(f"Expression longue mal reconnue par le moteur {moteur}")
+        campagne.mesurer("LangageReconnaissable.regex_longue", {"moteur": moteur, "facteurs": facteurs},
+                         len(mot_long.contenu), contient_longue)
+
+
+def comparer(resultats: List[Dict[str, Any]], reference: Dict[str, Any], seuil: float) -> bool:
+    """Affiche les écarts de médiane avec une exécution de référence ; retourne True si un cas régresse."""
+    def cle(resultat: Dict[str, Any]) -> str:
+        return resultat["cas"] + json.dumps(resultat["parametres"], sort_keys=True)
+
+    anciens = {cle(resultat): resultat for resultat in reference["resultats"]}
+    regression = False
+    for resultat in resultats:
+        ancien = anciens.get(cle(resultat))
+        if ancien is None or ancien["mediane_s"] == 0:
+            continue
+        rapport = resultat["mediane_s"] / ancien["mediane_s"]
+        marque = ""
+        if rapport > seuil:
+            marque = "  <-- régression"
+            regression = True
+        parametres = json.dumps(resultat["parametres"], sort_keys=True)
+        print(f"{resultat['cas']:<40} {parametres:<45} x{rapport:.2f}{marque}", file=sys.stderr)
+    return regression
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée : lance la campagne, écrit le JSON et compare éventuellement."""
+    parseur = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parseur.add_argument("--tailles", type=int, nargs="+", default=[10, 100, 1000],
+                         help="nombres d'états des automates et de mots des langages")
+    parseur.add_argument("--mots", type=int, default=2000, help="taille du corpus de reconnaissance")
+    parseur.add_argument("--longueur", type=int, default=32, help="longueur maximale des mots du corpus")
+    parseur.add_argument("--repetitions", type=int, default=5)
+    parseur.add_argument("--graine", type=int, default=0)
+    parseur.add_argument("--sortie", default="-", help="fichier JSON des résultats (- pour la sortie standard)")
+    parseur.add_argument("--reference", help="fichier JSON d'une exécution précédente à comparer")
+    parseur.add_argument("--seuil", type=float, default=1.2, help="rapport de médianes signalé comme régression")
+    parseur.add_argument("--silencieux", action="store_true")
+    options = parseur.parse_args(arguments)
+
+    campagne = Campagne(options.repetitions, not options.silencieux)
+    mots = corpus_aleatoire(options.mots, longueur_max=options.longueur, graine=options.graine)
+    # Le chemin complet est coûteux : il est mesuré sur un corpus réduit
+    mots_chemin = mots[:max(options.mots // 10, 1)]
+    for taille in options.tailles:
+        mesurer_automates(campagne, taille, mots, mots_chemin, options.graine)
+        mesurer_langages(campagne, taille, options.graine)
+
+    document = {
+        "format": FORMAT,
+        "contexte": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "plateforme": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "options": {cle: valeur for cle, valeur in vars(options).items() if cle not in ("sortie", "reference")},
+        "resultats": campagne.resultats,
+    }
+    texte = json.dumps(document, indent=2, ensure_ascii=False)
+    if options.sortie == "-":
+        print(texte)
+    else:
+        with open(options.sortie, "w", encoding="utf-8") as fichier:
+            fichier.write(texte + "\n")
+
+    if options.reference:
+        with open(options.reference, encoding="utf-8") as fichier:
+            reference = json.load(fichier)
+        if comparer(campagne.resultats, reference, options.seuil):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
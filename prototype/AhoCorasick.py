@@ -0,0 +1,156 @@
+"""
+Module implémentant l'automate d'Aho-Corasick d'un dictionnaire de mots.
+Le trie des mots (fonction de transition « goto »), ses liens d'échec et ses
+liens de sortie sont aplatis en tableaux d'entiers ; les liens d'échec sont
+intégrés à une table dense (état, symbole), si bien qu'un texte est parcouru
+en O(|texte| + nombre d'occurrences), quelle que soit la taille du dictionnaire.
+"""
+
+import codecs
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Automate de recherche simultanée de tous les mots d'un dictionnaire.
+    L'état 0 est la racine ; le mot vide est ignoré.
+    """
+
+    def __init__(self, mots: Iterable[str]) -> None:
+        """
+        Construit l'automate.
+
+        Args:
+            mots: Mots du dictionnaire (les doublons et le mot vide sont ignorés)
+        """
+        self.mots: List[str] = sorted({mot for mot in mots if mot})
+        self.symboles = sorted({symbole for mot in self.mots for symbole in mot})
+        self.indice_symbole = {symbole: j for j, symbole in enumerate(self.symboles)}
+        self.nb_symboles = k = len(self.symboles)
+        self.longueurs = array('i', (len(mot) for mot in self.mots))
+
+        # Trie : fils de chaque nœud et numéro du mot qui s'y termine (-1 sinon)
+        fils: List[Dict[int, int]] = [{}]
+        sortie = array('i', [-1])
+        for numero, mot in enumerate(self.mots):
+            noeud = 0
+            for symbole in mot:
+                j = self.indice_symbole[symbole]
+                suivant = fils[noeud].get(j)
+                if suivant is None:
+                    suivant = fils[noeud][j] = len(fils)
+                    fils.append({})
+                    sortie.append(-1)
+                noeud = suivant
+            sortie[noeud] = numero
+
+        # Parcours en largeur : l'échec d'un nœud est moins profond, donc déjà traité
+        nb_etats = len(fils)
+        table = array('i', [0]) * (nb_etats * k)
+        echec = array('i', [0]) * nb_etats
+        lien_sortie = array('i', [-1]) * nb_etats
+        file = [0]
+        for noeud in file:
+            base = noeud * k
+            base_echec = echec[noeud] * k
+            for j in range(k):
+                enfant = fils[noeud].get(j)
+                if enfant is None:
+                    table[base + j] = table[base_echec + j] if noeud else 0
+                    continue
+                table[base + j] = enfant
+                repli = table[base_echec + j] if noeud else 0
+                echec[enfant] = repli
+                lien_sortie[enfant] = repli if sortie[repli] >= 0 else lien_sortie[repli]
+                file.append(enfant)
+
+        self.nb_etats = nb_etats
+        self.table = table
+        self.echec = echec
+        self.sortie = sortie
+        self.lien_sortie = lien_sortie
+
+    def __len__(self) -> int:
+        """Nombre de mots du dictionnaire."""
+        return len(self.mots)
+
+    def flux(self) -> 'RechercheFlux':
+        """Retourne une recherche incrémentale, au début du texte."""
+        return RechercheFlux(self)
+
+    def rechercher(self, texte: str) -> Iterator[Tuple[int, str]]:
+        """
+        Produit les occurrences (position de début, mot) de tous les mots du
+        dictionnaire dans le texte, par position de fin puis du plus long au
+        plus court.
+        """
+        return RechercheFlux(self).rechercher(texte)
+
+    def rechercher_fichier(self, chemin: str, taille_bloc: int = 1 << 20,
+                           encodage: str = "utf-8") -> Iterator[Tuple[int, str]]:
+        """
+        Produit les occurrences dans un fichier lu par blocs de `taille_bloc`
+        octets ; les positions sont comptées en caractères décodés.
+        """
+        recherche = RechercheFlux(self)
+        decodeur = codecs.getincrementaldecoder(encodage)()
+        with open(chemin, "rb") as fichier:
+            while True:
+                bloc = fichier.read(taille_bloc)
+                if not bloc:
+                    break
+                yield from recherche.rechercher(decodeur.decode(bloc))
+        yield from recherche.rechercher(decodeur.decode(b"", final=True))
+
+
+class RechercheFlux:
+    """
+    Recherche incrémentale dans un texte fourni par morceaux : seuls l'état
+    courant et le nombre de caractères déjà lus sont conservés, de sorte
+    qu'une occurrence à cheval sur deux morceaux est trouvée.
+    """
+
+    def __init__(self, automate: AhoCorasick) -> None:
+        """
+        Initialise la recherche au début du texte.
+
+        Args:
+            automate: Automate d'Aho-Corasick du dictionnaire
+        """
+        self.automate = automate
+        self.etat = 0
+        self.position = 0
+
+    def feed(self, chunk: str) -> List[Tuple[int, str]]:
+        """Lit un morceau du texte et retourne les occurrences qui s'y terminent."""
+        return list(self.rechercher(chunk))
+
+    def rechercher(self, morceau: str) -> Iterator[Tuple[int, str]]:
+        """
+        Produit les occurrences se terminant dans le morceau, avec leurs
+        positions dans le texte entier ; le morceau doit être consommé en
+        entier avant le suivant.
+        """
+        automate = self.automate
+        table = automate.table
+        k = automate.nb_symboles
+        indice = automate.indice_symbole
+        sortie = automate.sortie
+        lien_sortie = automate.lien_sortie
+        longueurs = automate.longueurs
+        mots = automate.mots
+        etat = self.etat
+        debut = self.position
+        for decalage, symbole in enumerate(morceau, debut + 1):
+            j = indice.get(symbole)
+            etat = 0 if j is None else table[etat * k + j]
+            noeud = etat if sortie[etat] >= 0 else lien_sortie[etat]
+            if noeud >= 0:
+                self.etat, self.position = etat, decalage
+                while noeud >= 0:
+                    numero = sortie[noeud]
+                    yield decalage - longueurs[numero], mots[numero]
+                    noeud = lien_sortie[noeud]
+        self.etat = etat
+        self.position = debut + len(morceau)
@@ -1,9 +1,889 @@
-from typing import Set, Dict, List, Optional ,Tuple
+import codecs
+import mmap
+import random
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, Set, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from Instrumentation import INSTRUMENTATION
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seule la reconnaissance par lots en profite
+    np = None
+
+
+class TableTransitions:
+    """
+    Forme compilée d'un automate déterministe : table dense d'entiers indexée
+    par (état, symbole), complétée par un état puits absorbant.
+    """
+
+    def __init__(self, etats: List[str], symboles: List[str], table: array,
+                 initial: int, finaux: bytearray) -> None:
+        """
+        Initialise une table compilée.
+
+        Args:
+            etats: Noms des états, dans l'ordre de leur numérotation
+            symboles: Symboles de l'alphabet, dans l'ordre de leur numérotation
+            table: Tableau plat de taille (len(etats) + 1) * len(symboles)
+            initial: Numéro de l'état initial
+            finaux: Octet non nul pour chaque état final (puits compris)
+        """
+        self.etats = etats
+        self.symboles = symboles
+        self.indice_etat = {etat: i for i, etat in enumerate(etats)}
+        self.indice_symbole = {symbole: j for j, symbole in enumerate(symboles)}
+        self.nb_symboles = len(symboles)
+        self.puits = len(etats)
+        self.table = table
+        self.initial = initial
+        self.finaux = finaux
+
+    @classmethod
+    def depuis_automate(cls, automate: 'Automate') -> 'TableTransitions':
+        """Compile un automate déterministe (les transitions absentes vont au puits)."""
+        etats = sorted(automate.etats)
+        symboles = sorted(automate.alphabet)
+        indice = {etat: i for i, etat in enumerate(etats)}
+        k = len(symboles)
+        puits = len(etats)
+        table = array('i', [puits]) * ((puits + 1) * k)
+        for i, etat in enumerate(etats):
+            ligne = automate.transitions[etat]
+            base = i * k
+            for j, symbole in enumerate(symboles):
+                cibles = ligne.get(symbole)
+                if not cibles:
+                    continue
+                if len(cibles) > 1:
+                    raise ValueError(f"Transition non déterministe depuis {etat} par {symbole}")
+                table[base + j] = indice[next(iter(cibles))]
+        finaux = bytearray(puits + 1)
+        for etat in automate.etats_finaux:
+            finaux[indice[etat]] = 1
+        return cls(etats, symboles, table, indice[automate.etat_initial], finaux)
+
+    def avancer(self, etat: int, mot: str) -> int:
+        """Lit le mot depuis l'état numéro `etat` et retourne le numéro d'arrivée."""
+        table = self.table
+        k = self.nb_symboles
+        indice = self.indice_symbole
+        puits = self.puits
+        for symbole in mot:
+            j = indice.get(symbole)
+            if j is None:
+                return puits
+            etat = table[etat * k + j]
+            if etat == puits:
+                return puits
+        return etat
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Forme sérialisée compacte : les index dérivés ne sont pas transmis et
+        les vues sur un fichier projeté (voir Sauvegarde) sont recopiées.
+        """
+        etat = dict(self.__dict__)
+        del etat["indice_etat"], etat["indice_symbole"]
+        if isinstance(self.table, memoryview):
+            etat["table"] = array('i', self.table)
+        if isinstance(self.finaux, memoryview):
+            etat["finaux"] = bytearray(self.finaux)
+        return etat
+
+    def __setstate__(self, etat: Dict[str, Any]) -> None:
+        self.__dict__.update(etat)
+        self.indice_etat = {nom: i for i, nom in enumerate(self.etats)}
+        self.indice_symbole = {symbole: j for j, symbole in enumerate(self.symboles)}
+
+    def complementaire(self, symboles: Optional[List[str]] = None, nom_puits: str = "⊥") -> 'TableTransitions':
+        """
+        Retourne la table du complémentaire en une passe linéaire : le puits
+        devient un état réel (nommé `nom_puits`) et les états finaux sont
+        échangés. Des symboles supplémentaires mènent tous à ce puits.
+        """
+        k = self.nb_symboles
+        puits = self.puits
+        symboles = sorted(set(self.symboles) | set(symboles or ()))
+        if symboles == self.symboles:
+            table = self.table[:] if isinstance(self.table, array) else array('i', self.table)
+        else:
+            # Nouvelles colonnes : recopie ligne à ligne vers la nouvelle disposition
+            colonnes = [self.indice_symbole.get(symbole) for symbole in symboles]
+            table = array('i', [puits]) * ((puits + 1) * len(symboles))
+            for etat in range(puits + 1):
+                base, nouvelle_base = etat * k, etat * len(symboles)
+                for j, colonne in enumerate(colonnes):
+                    if colonne is not None:
+                        table[nouvelle_base + j] = self.table[base + colonne]
+        # Ligne du nouveau puits, inaccessible puisque l'ancien puits boucle sur lui-même
+        table.extend(array('i', [puits + 1]) * len(symboles))
+        finaux = bytearray(1 - final for final in self.finaux)
+        finaux.append(0)
+        return TableTransitions(self.etats + [nom_puits], symboles, table, self.initial, finaux)
+
+    def suivant(self, etat: int, symbole: str) -> int:
+        """Retourne le numéro de l'état atteint en lisant un symbole (le puits s'il est inconnu)."""
+        j = self.indice_symbole.get(symbole)
+        return self.puits if j is None else self.table[etat * self.nb_symboles + j]
+
+    def accepte(self, etat: int) -> bool:
+        """Indique si l'état numéro `etat` est final."""
+        return self.finaux[etat] != 0
+
+    def reconnaitre(self, mot: str) -> bool:
+        """Reconnaît un mot en parcourant la table."""
+        if INSTRUMENTATION.actif:
+            return self._reconnaitre_mesure(mot)
+        return self.finaux[self.avancer(self.initial, mot)] != 0
+
+    def _reconnaitre_mesure(self, mot: str) -> bool:
+        """Comme `reconnaitre`, en comptant une transition par symbole lu avant le puits (un seul état actif)."""
+        etat = self.initial
+        suivies = 0
+        for symbole in mot:
+            etat = self.suivant(etat, symbole)
+            suivies += 1
+            if etat == self.puits:
+                break
+        INSTRUMENTATION.compter("transitions_suivies", suivies)
+        INSTRUMENTATION.maximum("etats_actifs", 1)
+        return self.finaux[etat] != 0
+
+    def encoder(self, mots: Sequence[str]) -> 'np.ndarray':
+        """
+        Encode des mots en une matrice NumPy d'indices de symboles, complétée
+        par -1 ; un caractère hors alphabet est codé par nb_symboles.
+        """
+        k = self.nb_symboles
+        longueurs = np.fromiter((len(mot) for mot in mots), dtype=np.int64, count=len(mots))
+        largeur = int(longueurs.max()) if len(mots) else 0
+        codes = np.full((len(mots), largeur), -1, dtype=np.int32)
+        total = int(longueurs.sum())
+        if not total:
+            return codes
+        
+        # Conversion vectorisée : points de code -> indices des symboles d'un caractère
+        points = np.frombuffer(''.join(mots).encode('utf-32-le'), dtype='<u4')
+        simples = sorted((ord(symbole), j) for j, symbole in enumerate(self.symboles) if len(symbole) == 1)
+        indices = np.full(total, k, dtype=np.int32)
+        if simples:
+            references = np.array([point for point, _ in simples], dtype='<u4')
+            numeros = np.array([j for _, j in simples], dtype=np.int32)
+            positions = np.minimum(np.searchsorted(references, points), len(simples) - 1)
+            connus = references[positions] == points
+            indices[connus] = numeros[positions[connus]]
+        
+        lignes = np.repeat(np.arange(len(mots)), longueurs)
+        debuts = np.cumsum(longueurs) - longueurs
+        colonnes = np.arange(total) - np.repeat(debuts, longueurs)
+        codes[lignes, colonnes] = indices
+        return codes
+
+    def reconnaitre_encodes(self, codes: 'np.ndarray') -> 'np.ndarray':
+        """
+        Fait avancer tous les mots encodés d'une position à la fois dans la
+        table et retourne le tableau booléen des mots reconnus.
+        """
+        k = self.nb_symboles
+        taille = self.puits + 1
+        # Colonne k : symbole inconnu (vers le puits) ; colonne k + 1 (= -1) : bourrage
+        etendue = np.empty((taille, k + 2), dtype=np.int32)
+        etendue[:, :k] = np.frombuffer(self.table, dtype=np.intc).reshape(taille, k)
+        etendue[:, k] = self.puits
+        etendue[:, k + 1] = np.arange(taille, dtype=np.int32)
+        
+        codes = np.asarray(codes)
+        etats = np.full(codes.shape[0], self.initial, dtype=np.int32)
+        for colonne in codes.T:
+            etats = etendue[etats, colonne]
+        return np.frombuffer(self.finaux, dtype=np.uint8)[etats] != 0
+
+
+class TableBitset:
+    """
+    Forme compilée d'un automate non déterministe : les états sont numérotés
+    et un ensemble d'états actifs est un masque d'entier (bit i = état i).
+    """
+
+    def __init__(self, etats: List[str], successeurs: Dict[str, List[int]],
+                 initial: int, finaux: int) -> None:
+        """
+        Initialise une table de masques.
+
+        Args:
+            etats: Noms des états, dans l'ordre de leur numérotation
+            successeurs: Pour chaque symbole, le masque des successeurs de chaque état
+            initial: Masque des états actifs au départ
+            finaux: Masque des états finaux
+        """
+        self.etats = etats
+        self.indice_etat = {etat: i for i, etat in enumerate(etats)}
+        self.successeurs = successeurs
+        self.initial = initial
+        self.finaux = finaux
+
+    @classmethod
+    def depuis_automate(cls, automate: 'Automate') -> 'TableBitset':
+        """Compile un automate ; les ε-fermetures sont intégrées aux masques."""
+        etats = sorted(automate.etats)
+        indice = {etat: i for i, etat in enumerate(etats)}
+        epsilon = getattr(automate, 'epsilon', None)
+
+        def masque(ensemble: Set[str]) -> int:
+            resultat = 0
+            for etat in ensemble:
+                resultat |= 1 << indice[etat]
+            return resultat
+
+        def fermer(ensemble: Set[str]) -> Set[str]:
+            return automate.fermeture_epsilon(ensemble) if epsilon is not None else ensemble
+
+        successeurs = {}
+        for symbole in automate.alphabet:
+            if symbole == epsilon:
+                continue
+            successeurs[symbole] = [
+                masque(fermer(automate.transitions[etat].get(symbole, set())))
+                for etat in etats
+            ]
+        initial = masque(fermer({automate.etat_initial}))
+        return cls(etats, successeurs, initial, masque(automate.etats_finaux))
+
+    def suivant(self, actifs: int, symbole: str) -> int:
+        """Retourne le masque des successeurs de `actifs` par un symbole."""
+        ligne = self.successeurs.get(symbole)
+        if ligne is None:
+            return 0
+        suivants = 0
+        while actifs:
+            bas = actifs & -actifs
+            suivants |= ligne[bas.bit_length() - 1]
+            actifs ^= bas
+        return suivants
+
+    def avancer(self, actifs: int, mot: str) -> int:
+        """Lit le mot depuis le masque `actifs` et retourne le masque d'arrivée."""
+        successeurs = self.successeurs
+        for symbole in mot:
+            ligne = successeurs.get(symbole)
+            if ligne is None:
+                return 0
+            suivants = 0
+            while actifs:
+                bas = actifs & -actifs
+                suivants |= ligne[bas.bit_length() - 1]
+                actifs ^= bas
+            if not suivants:
+                return 0
+            actifs = suivants
+        return actifs
+
+    def avancer_mesure(self, actifs: int, mot: str) -> int:
+        """
+        Comme `avancer`, en enregistrant chaque pas pour l'instrumentation :
+        transitions suivies (successeurs des états actifs) et états actifs.
+        """
+        successeurs = self.successeurs
+        for symbole in mot:
+            ligne = successeurs.get(symbole)
+            if ligne is None:
+                return 0
+            suivants = 0
+            transitions = 0
+            while actifs:
+                bas = actifs & -actifs
+                cibles = ligne[bas.bit_length() - 1]
+                suivants |= cibles
+                transitions += bin(cibles).count("1")
+                actifs ^= bas
+            INSTRUMENTATION.pas_simulation(transitions, bin(suivants).count("1"))
+            if not suivants:
+                return 0
+            actifs = suivants
+        return actifs
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Forme sérialisée compacte : l'index des états n'est pas transmis."""
+        etat = dict(self.__dict__)
+        del etat["indice_etat"]
+        return etat
+
+    def __setstate__(self, etat: Dict[str, Any]) -> None:
+        self.__dict__.update(etat)
+        self.indice_etat = {nom: i for i, nom in enumerate(self.etats)}
+
+    def accepte(self, actifs: int) -> bool:
+        """Indique si le masque `actifs` contient un état final."""
+        return (actifs & self.finaux) != 0
+
+    def vivant(self, actifs: int) -> bool:
+        """Indique si l'ensemble d'états `actifs` est non vide."""
+        return actifs != 0
+
+    def mort(self) -> int:
+        """Retourne l'ensemble d'états vide."""
+        return 0
+
+    def reconnaitre(self, mot: str) -> bool:
+        """Reconnaît un mot par simulation sur les masques."""
+        if INSTRUMENTATION.actif:
+            return (self.avancer_mesure(self.initial, mot) & self.finaux) != 0
+        return (self.avancer(self.initial, mot) & self.finaux) != 0
+
+    def _voisins(self) -> List[int]:
+        """Pour chaque état, le masque de ses successeurs tous symboles confondus."""
+        voisins = [0] * len(self.etats)
+        for ligne in self.successeurs.values():
+            for i, masque in enumerate(ligne):
+                voisins[i] |= masque
+        return voisins
+
+    def coaccessibles(self) -> int:
+        """Retourne le masque des états depuis lesquels un état final est atteignable."""
+        predecesseurs: List[List[int]] = [[] for _ in self.etats]
+        for i, masque in enumerate(self._voisins()):
+            while masque:
+                bas = masque & -masque
+                predecesseurs[bas.bit_length() - 1].append(i)
+                masque ^= bas
+        utiles = self.finaux
+        pile = [i for i in range(len(self.etats)) if self.finaux >> i & 1]
+        while pile:
+            for i in predecesseurs[pile.pop()]:
+                if not utiles >> i & 1:
+                    utiles |= 1 << i
+                    pile.append(i)
+        return utiles
+
+    def est_fini(self) -> bool:
+        """
+        Indique si le langage reconnu est fini : aucun cycle ne passe par un
+        état à la fois accessible et co-accessible.
+        """
+        utiles = self.coaccessibles()
+        voisins = [masque & utiles for masque in self._voisins()]
+        # Parcours en profondeur itératif : 1 = en cours, 2 = terminé
+        couleur = [0] * len(self.etats)
+        depart = self.initial & utiles
+        racines = [i for i in range(depart.bit_length()) if depart >> i & 1]
+        for racine in racines:
+            if couleur[racine]:
+                continue
+            couleur[racine] = 1
+            pile = [(racine, voisins[racine])]
+            while pile:
+                etat, restants = pile[-1]
+                if not restants:
+                    couleur[etat] = 2
+                    pile.pop()
+                    continue
+                bas = restants & -restants
+                pile[-1] = (etat, restants ^ bas)
+                cible = bas.bit_length() - 1
+                if couleur[cible] == 1:
+                    return False
+                if not couleur[cible]:
+                    couleur[cible] = 1
+                    pile.append((cible, voisins[cible]))
+        return True
+
+    def enumerer(self, longueur_max: Optional[int] = None,
+                 limite: Optional[int] = None) -> Iterator[str]:
+        """
+        Produit les mots reconnus dans l'ordre hiérarchique (longueur puis ordre
+        lexicographique des symboles), sans doublon, par un parcours en largeur
+        où chaque préfixe vivant porte son ensemble d'états.
+        """
+        if limite is not None and limite <= 0:
+            return
+        utiles = self.coaccessibles()
+        symboles = sorted(self.successeurs)
+        niveau = [("", self.initial & utiles)] if self.initial & utiles else []
+        longueur = 0
+        produits = 0
+        while niveau:
+            for mot, masque in niveau:
+                if masque & self.finaux:
+                    yield mot
+                    produits += 1
+                    if limite is not None and produits >= limite:
+                        return
+            if longueur_max is not None and longueur >= longueur_max:
+                return
+            suivant = []
+            for mot, masque in niveau:
+                for symbole in symboles:
+                    cible = self.suivant(masque, symbole) & utiles
+                    if cible:
+                        suivant.append((mot + symbole, cible))
+            niveau = suivant
+            longueur += 1
+
+
+class DeterminisationParesseuse:
+    """
+    Déterminisation à la volée, dans l'esprit de RE2 : un état déterministe est
+    un masque d'états de l'AFN, créé la première fois qu'un mot l'atteint, et
+    ses transitions sont mémorisées. Le cache est borné par un budget mémoire ;
+    quand il déborde, il est vidé et la fin du mot est lue par simulation AFN.
+    """
+    
+    BUDGET_DEFAUT = 1 << 20
+    # Estimations (en octets) du coût d'un état et d'une transition mémorisés
+    COUT_ETAT = 120
+    COUT_TRANSITION = 40
+
+    def __init__(self, table: TableBitset, budget_memoire: int = BUDGET_DEFAUT) -> None:
+        """
+        Initialise le déterminiseur.
+
+        Args:
+            table: Table de masques de l'AFN à déterminiser
+            budget_memoire: Taille maximale estimée du cache, en octets
+        """
+        self.table = table
+        self.budget_memoire = budget_memoire
+        self.memoire = 0
+        self._etats: Dict[int, Dict[str, int]] = {}
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.replis = 0
+
+    def _cout_etat(self, masque: int) -> int:
+        """Estime la place occupée par un nouvel état déterministe."""
+        return self.COUT_ETAT + sys.getsizeof(masque)
+
+    def vider(self) -> None:
+        """Évince tous les états déterministes du cache."""
+        if self._etats:
+            self.evictions += 1
+        self._etats = {}
+        self.memoire = 0
+
+    def reconnaitre(self, mot: str) -> bool:
+        """Reconnaît un mot en complétant le cache au fil de la lecture."""
+        table = self.table
+        etats = self._etats
+        courant = table.initial
+        transitions = etats.get(courant)
+        if transitions is None:
+            cout = self._cout_etat(courant)
+            if self.memoire + cout > self.budget_memoire:
+                self.replis += 1
+                return table.reconnaitre(mot)
+            transitions = etats[courant] = {}
+            self.memoire += cout
+        
+        # Instrumentation : une transition déterministe par symbole, autant d'états actifs que de bits
+        mesure = INSTRUMENTATION.actif
+        succes = 0
+        for position, symbole in enumerate(mot):
+            cible = transitions.get(symbole)
+            if cible is not None:
+                succes += 1
+            else:
+                self.echecs += 1
+                cible = table.suivant(courant, symbole)
+                cout = self.COUT_TRANSITION
+                if cible not in etats:
+                    cout += self._cout_etat(cible)
+                if self.memoire + cout > self.budget_memoire:
+                    self.succes += succes
+                    self.vider()
+                    self.replis += 1
+                    if mesure:
+                        INSTRUMENTATION.pas_simulation(1, bin(cible).count("1"))
+                        return (table.avancer_mesure(cible, mot[position + 1:]) & table.finaux) != 0
+                    return (table.avancer(cible, mot[position + 1:]) & table.finaux) != 0
+                transitions[symbole] = cible
+                if cible not in etats:
+                    etats[cible] = {}
+                self.memoire += cout
+            courant = cible
+            if mesure:
+                INSTRUMENTATION.pas_simulation(1, bin(courant).count("1"))
+            if not courant:
+                break
+            transitions = etats[courant]
+        
+        self.succes += succes
+        return (courant & table.finaux) != 0
+
+    def statistiques(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache."""
+        return {
+            "succes": self.succes,
+            "echecs": self.echecs,
+            "evictions": self.evictions,
+            "replis": self.replis,
+            "etats": len(self._etats),
+            "memoire": self.memoire,
+        }
+
+
+def _multiplier_matrices(gauche: Any, droite: Any, modulo: Optional[int]) -> Any:
+    """Produit de deux matrices d'entiers (NumPy objet si disponible, listes sinon)."""
+    if np is not None:
+        produit = gauche.dot(droite)
+        return produit % modulo if modulo else produit
+    colonnes = list(zip(*droite))
+    produit = [[sum(x * y for x, y in zip(ligne, colonne)) for colonne in colonnes] for ligne in gauche]
+    if modulo:
+        produit = [[valeur % modulo for valeur in ligne] for ligne in produit]
+    return produit
+
+
+def _puissance_matrice(matrice: List[List[int]], exposant: int, modulo: Optional[int]) -> Any:
+    """Exponentiation rapide d'une matrice carrée d'entiers."""
+    taille = len(matrice)
+    identite = [[int(i == j) for j in range(taille)] for i in range(taille)]
+    if np is not None:
+        # dtype objet : entiers Python exacts, sans débordement
+        matrice = np.array(matrice, dtype=object).reshape(taille, taille)
+        identite = np.array(identite, dtype=object).reshape(taille, taille)
+    resultat = identite
+    while exposant:
+        if exposant & 1:
+            resultat = _multiplier_matrices(resultat, matrice, modulo)
+        exposant >>= 1
+        if exposant:
+            matrice = _multiplier_matrices(matrice, matrice, modulo)
+    return resultat
+
+
+class CompteurMots:
+    """
+    Dénombrement des mots acceptés par un automate déterministe, par
+    exponentiation rapide de la matrice d'adjacence de l'automate émondé
+    (coût O(|Q|³ log n) au lieu d'une énumération), et tirage uniforme d'un
+    mot accepté de longueur donnée.
+    """
+
+    def __init__(self, table: TableTransitions) -> None:
+        """Émonde la table compilée : seuls les états accessibles et co-accessibles restent."""
+        k = table.nb_symboles
+        taille = table.puits + 1
+        accessibles = {table.initial}
+        pile = [table.initial]
+        predecesseurs: List[List[int]] = [[] for _ in range(taille)]
+        while pile:
+            etat = pile.pop()
+            for j in range(k):
+                cible = table.table[etat * k + j]
+                predecesseurs[cible].append(etat)
+                if cible not in accessibles:
+                    accessibles.add(cible)
+                    pile.append(cible)
+        coaccessibles = {etat for etat in accessibles if table.finaux[etat]}
+        pile = list(coaccessibles)
+        while pile:
+            for source in predecesseurs[pile.pop()]:
+                if source not in coaccessibles:
+                    coaccessibles.add(source)
+                    pile.append(source)
+        
+        utiles = sorted(coaccessibles)
+        numero = {etat: i for i, etat in enumerate(utiles)}
+        self.successeurs: List[List[Tuple[str, int]]] = [
+            [(symbole, numero[table.table[etat * k + j]])
+             for j, symbole in enumerate(table.symboles) if table.table[etat * k + j] in numero]
+            for etat in utiles
+        ]
+        self.finaux = [table.finaux[etat] != 0 for etat in utiles]
+        self.initial = numero.get(table.initial)
+
+    def matrice(self) -> List[List[int]]:
+        """Matrice d'adjacence : nombre de symboles menant de l'état i à l'état j."""
+        taille = len(self.successeurs)
+        matrice = [[0] * taille for _ in range(taille)]
+        for i, transitions in enumerate(self.successeurs):
+            for _, cible in transitions:
+                matrice[i][cible] += 1
+        return matrice
+
+    def compter(self, longueur: int, jusqu_a: bool = False, modulo: Optional[int] = None) -> int:
+        """
+        Compte les mots acceptés de longueur exactement `longueur`, ou de
+        longueur au plus `longueur` si `jusqu_a` (modulo `modulo` si donné).
+        """
+        if self.initial is None or longueur < 0:
+            return 0
+        matrice = self.matrice()
+        taille = len(matrice)
+        if jusqu_a:
+            # Matrice augmentée [[M, f], [0, 1]] : le coin de A^(n+1) vaut la somme des M^i f
+            for i, ligne in enumerate(matrice):
+                ligne.append(int(self.finaux[i]))
+            matrice.append([0] * taille + [1])
+            puissance = _puissance_matrice(matrice, longueur + 1, modulo)
+            return int(puissance[self.initial][taille])
+        puissance = _puissance_matrice(matrice, longueur, modulo)
+        total = sum(puissance[self.initial][j] for j in range(taille) if self.finaux[j])
+        return int(total % modulo) if modulo else int(total)
+
+    def echantillonner(self, longueur: int, generateur: Optional[random.Random] = None) -> Optional[str]:
+        """
+        Tire uniformément un mot accepté de longueur donnée (None s'il n'en
+        existe pas), à partir des vecteurs M^l f pour l = 0..longueur.
+        """
+        if self.initial is None or longueur < 0:
+            return None
+        generateur = generateur or random
+        comptes = [[int(final) for final in self.finaux]]
+        for _ in range(longueur):
+            precedent = comptes[-1]
+            comptes.append([sum(precedent[cible] for _, cible in transitions)
+                            for transitions in self.successeurs])
+        if not comptes[longueur][self.initial]:
+            return None
+        
+        mot = []
+        etat = self.initial
+        for reste in range(longueur, 0, -1):
+            tirage = generateur.randrange(comptes[reste][etat])
+            for symbole, cible in self.successeurs[etat]:
+                tirage -= comptes[reste - 1][cible]
+                if tirage < 0:
+                    mot.append(symbole)
+                    etat = cible
+                    break
+        return ''.join(mot)
+
+
+class ReconnaisseurFlux:
+    """
+    Reconnaissance incrémentale d'un mot fourni par morceaux (chaînes ou
+    octets décodés au fil de l'eau). Seul l'état courant, ou l'ensemble
+    d'états courant sous forme de masque, est conservé entre deux morceaux.
+    """
+
+    def __init__(self, automate: 'Automate', encodage: str = "utf-8") -> None:
+        """
+        Initialise le reconnaisseur au début du mot.
+
+        Args:
+            automate: Automate de référence (AFDC, AFND ou AFNS)
+            encodage: Encodage des morceaux fournis sous forme d'octets
+        """
+        if isinstance(automate, AFDC):
+            self._forme = automate.compiler()
+        else:
+            self._forme = automate.compiler_bitset()
+        self._deterministe = isinstance(self._forme, TableTransitions)
+        self._courant = self._forme.initial
+        self._decodeur = codecs.getincrementaldecoder(encodage)()
+
+    def _bloque(self) -> bool:
+        """Indique qu'aucune suite ne peut plus faire accepter le mot."""
+        if self._deterministe:
+            return self._courant == self._forme.puits
+        return not self._courant
+
+    def feed(self, chunk: Union[str, bytes]) -> None:
+        """Lit un morceau du mot."""
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            chunk = self._decodeur.decode(chunk)
+        if chunk and not self._bloque():
+            self._courant = self._forme.avancer(self._courant, chunk)
+
+    def etat(self) -> Union[Optional[str], Set[str]]:
+        """
+        Retourne l'état courant (None dans le puits) pour un automate
+        déterministe, l'ensemble des états actifs sinon.
+        """
+        if self._deterministe:
+            return None if self._bloque() else self._forme.etats[self._courant]
+        etats = self._forme.etats
+        return {etats[i] for i in range(self._courant.bit_length()) if self._courant >> i & 1}
+
+    def accepte(self) -> bool:
+        """Indique si le mot lu jusqu'ici est reconnu."""
+        octets_en_attente = self._decodeur.getstate()[0]
+        return not octets_en_attente and self._forme.accepte(self._courant)
+
+    def consommer_fichier(self, chemin: str, taille_bloc: int = 1 << 20,
+                          utiliser_mmap: bool = False) -> 'ReconnaisseurFlux':
+        """
+        Lit tout le contenu d'un fichier comme suite du mot, par blocs de
+        `taille_bloc` octets (lectures tamponnées ou projection mémoire).
+        """
+        with open(chemin, "rb") as fichier:
+            if utiliser_mmap:
+                if fichier.seek(0, 2) == 0:
+                    return self
+                with mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as carte:
+                    vue = memoryview(carte)
+                    try:
+                        for debut in range(0, len(carte), taille_bloc):
+                            self.feed(vue[debut:debut + taille_bloc])
+                            if self._bloque():
+                                break
+                    finally:
+                        vue.release()
+            else:
+                while not self._bloque():
+                    bloc = fichier.read(taille_bloc)
+                    if not bloc:
+                        break
+                    self.feed(bloc)
+        return self
+
+
+def explorer_deterministe(simulateur: Any, symboles: List[str], prefixe: str) -> 'AFDC':
+    """
+    Construit l'AFDC complet des états accessibles d'un simulateur déterministe
+    (objet offrant `initial`, `suivant(etat, symbole)` et `accepte(etat)`),
+    en nommant les états prefixe0, prefixe1, ...
+    """
+    numeros = {simulateur.initial: 0}
+    a_traiter = [simulateur.initial]
+    aretes = []
+    for etat in a_traiter:
+        for symbole in symboles:
+            cible = simulateur.suivant(etat, symbole)
+            if cible not in numeros:
+                numeros[cible] = len(numeros)
+                a_traiter.append(cible)
+            aretes.append((numeros[etat], symbole, numeros[cible]))
+    
+    finaux = {f"{prefixe}{numero}" for etat, numero in numeros.items() if simulateur.accepte(etat)}
+    afdc = AFDC(set(symboles), {f"{prefixe}{numero}" for numero in numeros.values()}, f"{prefixe}0", finaux)
+    for source, symbole, cible in aretes:
+        afdc.ajouter_transition(f"{prefixe}{source}", symbole, f"{prefixe}{cible}")
+    return afdc
+
+
+def equivalence_hopcroft_karp(gauche: Any, droite: Any, symboles: List[str], depart_gauche: Any = None,
+                              depart_droite: Any = None) -> Tuple[bool, Optional[str]]:
+    """
+    Teste l'équivalence de deux simulateurs déterministes (objets offrant
+    `initial`, `suivant(etat, symbole)` et `accepte(etat)`) depuis leurs états
+    initiaux ou les états de départ donnés, par l'algorithme de Hopcroft et
+    Karp : les couples d'états supposés équivalents sont fusionnés dans une
+    structure union-find, en temps quasi linéaire. Le parcours en largeur
+    garantit que le mot distinguant retourné est de longueur minimale.
+    Retourne (True, None) ou (False, mot distinguant).
+    """
+    parents: Dict[Any, Any] = {}
+    rangs: Dict[Any, int] = {}
+    
+    def trouver(element: Any) -> Any:
+        racine = element
+        while parents.get(racine, racine) != racine:
+            racine = parents[racine]
+        while element != racine:
+            parents[element], element = racine, parents[element]
+        return racine
+    
+    def unir(premier: Any, second: Any) -> bool:
+        """Fusionne deux classes ; retourne False si elles étaient déjà confondues."""
+        premier, second = trouver(premier), trouver(second)
+        if premier == second:
+            return False
+        if rangs.get(premier, 0) < rangs.get(second, 0):
+            premier, second = second, premier
+        parents[second] = premier
+        if rangs.get(premier, 0) == rangs.get(second, 0):
+            rangs[premier] = rangs.get(premier, 0) + 1
+        return True
+    
+    # Les états sont étiquetés par leur côté pour partager une seule structure
+    depart = ((0, gauche.initial if depart_gauche is None else depart_gauche),
+              (1, droite.initial if depart_droite is None else depart_droite))
+    unir(*depart)
+    file = [depart]
+    origines: List[Tuple[int, str]] = [(-1, "")]
+    for position, ((_, etat_gauche), (_, etat_droit)) in enumerate(file):
+        if gauche.accepte(etat_gauche) != droite.accepte(etat_droit):
+            symboles_lus = []
+            while position > 0:
+                position, symbole = origines[position]
+                symboles_lus.append(symbole)
+            return False, ''.join(reversed(symboles_lus))
+        for symbole in symboles:
+            couple = ((0, gauche.suivant(etat_gauche, symbole)), (1, droite.suivant(etat_droit, symbole)))
+            if unir(*couple):
+                file.append(couple)
+                origines.append((position, symbole))
+    return True, None
+
+
+def _est_simulateur(objet: Any) -> bool:
+    """Indique si l'objet se simule lui-même (produit, dérivées...) plutôt que par une table compilée."""
+    return all(hasattr(objet, nom) for nom in ("initial", "suivant", "accepte", "vivant", "mort"))
+
+
+def _simulateur_deterministe(automate: Any) -> Any:
+    """
+    Simulateur déterministe d'un automate : table dense pour un AFDC, masques
+    d'états (déterminisation à la volée) pour un AFN, l'objet lui-même pour
+    un simulateur paresseux (produit, automate des dérivées).
+    """
+    if _est_simulateur(automate):
+        return automate
+    return automate.compiler() if isinstance(automate, AFDC) else automate.compiler_bitset()
+
+
+def _symboles_communs(premier: Any, second: Any) -> List[str]:
+    """Symboles (hors ε) des deux alphabets réunis."""
+    return sorted((set(premier.alphabet) | set(second.alphabet)) - {'ε'})
+
+
+def _equivalents(automate: Any, autre: Any) -> Tuple[bool, Optional[str]]:
+    return equivalence_hopcroft_karp(_simulateur_deterministe(automate), _simulateur_deterministe(autre),
+                                     _symboles_communs(automate, autre))
+
+
+def _mots_equivalents(automate: Any, mot1: str, mot2: str) -> Tuple[bool, Optional[str]]:
+    simulateur = _simulateur_deterministe(automate)
+    arrivees = []
+    for mot in (mot1, mot2):
+        etat = simulateur.initial
+        for symbole in mot:
+            etat = simulateur.suivant(etat, symbole)
+        arrivees.append(etat)
+    return equivalence_hopcroft_karp(simulateur, simulateur, _symboles_communs(automate, automate), *arrivees)
+
+
+class EtatsFinaux(set):
+    """
+    Ensemble des états finaux d'un automate. Chaque modification en place
+    incrémente `version`, ce qui signale à l'automate que ses formes
+    compilées (qui portent les états finaux) sont périmées.
+    """
+
+    def __init__(self, etats: Iterable[str] = ()) -> None:
+        super().__init__(etats)
+        self.version = 0
+
+
+def _mutatrice(nom: str) -> Any:
+    methode = getattr(set, nom)
+
+    def enveloppe(self: EtatsFinaux, *args: Any) -> Any:
+        resultat = methode(self, *args)
+        self.version += 1
+        return resultat
+    enveloppe.__name__ = nom
+    return enveloppe
+
+
+for _nom in ("add", "discard", "remove", "pop", "clear", "update", "difference_update",
+             "intersection_update", "symmetric_difference_update", "__ior__", "__iand__", "__isub__", "__ixor__"):
+    setattr(EtatsFinaux, _nom, _mutatrice(_nom))
+
 
 class Automate:
     """Classe de base pour tous les types d'automates."""
     
-    def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, etats_finaux: Set[str]):
+    MOTEURS = ("ensembles", "bitset", "paresseux")
+    
+    def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, etats_finaux: Set[str],
+                 moteur: str = "ensembles"):
         self.alphabet = alphabet
         self.etats = etats
         self.etat_initial = etat_initial
@@ -12,6 +892,80 @@ class Automate:
             etat: {symb: set() for symb in alphabet}
             for etat in etats
         }
+        self._initialiser_caches()
+        self.choisir_moteur(moteur)
+    
+    @property
+    def etats_finaux(self) -> Set[str]:
+        """États finaux ; les modifier, en place ou par affectation, périme les formes compilées."""
+        return self._etats_finaux
+    
+    @etats_finaux.setter
+    def etats_finaux(self, etats_finaux: Iterable[str]) -> None:
+        self._etats_finaux = EtatsFinaux(etats_finaux)
+    
+    def _finaux_a_jour(self) -> None:
+        """Oublie les formes compilées si les états finaux ont changé depuis leur calcul."""
+        finaux = self._etats_finaux
+        vus, version = self._finaux_compiles
+        if vus is not finaux or version != finaux.version:
+            self._invalider_caches()
+    
+    def _initialiser_caches(self) -> None:
+        """Crée les emplacements des formes compilées (vides)."""
+        self._finaux_compiles = (self._etats_finaux, self._etats_finaux.version)
+        self._table: Optional[TableTransitions] = None
+        self._bitset: Optional[TableBitset] = None
+        self._paresseux: Optional[DeterminisationParesseuse] = None
+        self._compteur: Optional[CompteurMots] = None
+        self.budget_memoire = DeterminisationParesseuse.BUDGET_DEFAUT
+    
+    def choisir_moteur(self, moteur: str, budget_memoire: Optional[int] = None) -> None:
+        """
+        Choisit le moteur de simulation des AFN : "ensembles", "bitset" ou
+        "paresseux" (déterminisation à la volée, cache borné à budget_memoire octets).
+        """
+        if moteur not in self.MOTEURS:
+            raise ValueError(f"Moteur {moteur} inconnu (disponibles: {', '.join(self.MOTEURS)})")
+        self.moteur = moteur
+        if budget_memoire is not None:
+            self.budget_memoire = budget_memoire
+            self._paresseux = None
+    
+    def _invalider_caches(self) -> None:
+        """Oublie les formes compilées après une modification de l'automate."""
+        self._finaux_compiles = (self._etats_finaux, self._etats_finaux.version)
+        self._table = None
+        self._bitset = None
+        self._paresseux = None
+        self._compteur = None
+    
+    def compiler(self) -> TableTransitions:
+        """Retourne la table compilée (automate déterministe), reconstruite si besoin."""
+        self._finaux_a_jour()
+        if self._table is None:
+            self._table = TableTransitions.depuis_automate(self)
+        return self._table
+    
+    def compiler_bitset(self) -> TableBitset:
+        """Retourne la table de masques de successeurs, reconstruite si besoin."""
+        self._finaux_a_jour()
+        if self._bitset is None:
+            self._bitset = TableBitset.depuis_automate(self)
+        return self._bitset
+    
+    def determinisation_paresseuse(self) -> DeterminisationParesseuse:
+        """Retourne le déterminiseur à la volée de l'automate (et son cache)."""
+        self._finaux_a_jour()
+        if self._paresseux is None:
+            self._paresseux = DeterminisationParesseuse(self.compiler_bitset(), self.budget_memoire)
+        return self._paresseux
+    
+    def _simulateur(self):
+        """Retourne la forme compilée correspondant au moteur choisi."""
+        if self.moteur == "paresseux":
+            return self.determinisation_paresseuse()
+        return self.compiler_bitset()
     
     def ajouter_transition(self, source: str, symbole: str, cible: str) -> None:
         """Ajoute une transition à l'automate."""
@@ -20,6 +974,143 @@ class Automate:
         if source not in self.etats or cible not in self.etats:
             raise ValueError("État source ou cible invalide")
         self.transitions[source][symbole].add(cible)
+        self._invalider_caches()
+    
+    def ajouter_transitions(self, transitions: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Ajoute des transitions en masse. Toutes sont validées avant la première
+        insertion (aucune n'est ajoutée si l'une est invalide) et les formes
+        compilées ne sont invalidées qu'une fois. Retourne le nombre de transitions.
+        """
+        aretes = list(transitions)
+        self._valider_transitions(aretes)
+        lignes = self.transitions
+        for source, symbole, cible in aretes:
+            lignes[source][symbole].add(cible)
+        self._invalider_caches()
+        return len(aretes)
+    
+    def _valider_transitions(self, aretes: List[Tuple[str, str, str]]) -> None:
+        """Vérifie par différences d'ensembles que symboles et états existent."""
+        symboles = {symbole for _, symbole, _ in aretes} - self.alphabet
+        if symboles:
+            raise ValueError(f"Symboles non présents dans l'alphabet : {', '.join(sorted(symboles))}")
+        etats = ({source for source, _, _ in aretes} | {cible for _, _, cible in aretes}) - self.etats
+        if etats:
+            raise ValueError(f"États source ou cible invalides : {', '.join(sorted(etats))}")
+    
+    def determiniser(self) -> 'AFDC':
+        """
+        Retourne l'AFDC complet équivalent, par construction des sous-ensembles
+        limitée aux ensembles d'états accessibles (états nommés d0, d1, ...).
+        """
+        table = self.compiler_bitset()
+        return explorer_deterministe(table, sorted(table.successeurs), "d")
+    
+    def complement(self, alphabet: Optional[Set[str]] = None) -> 'AFDC':
+        """
+        Retourne l'AFDC du complémentaire (sur l'alphabet de l'automate, étendu
+        par `alphabet`) : déterminisation si besoin, complétion par un puits
+        explicite puis échange des états finaux, directement sur la table compilée.
+        """
+        deterministe = self if isinstance(self, AFDC) else self.determiniser()
+        table = deterministe.compiler()
+        nom_puits = "⊥"
+        while nom_puits in deterministe.etats:
+            nom_puits += "'"
+        symboles = sorted(set(alphabet or ()) - {getattr(self, 'epsilon', 'ε')})
+        return AFDC.depuis_table(table.complementaire(symboles, nom_puits))
+    
+    def equivalent(self, autre: Any) -> Tuple[bool, Optional[str]]:
+        """
+        Teste si deux automates (ou produits) reconnaissent le même langage,
+        sans minimisation : Hopcroft-Karp sur les formes déterministes (AFN
+        déterminisés à la volée). Retourne (True, None) ou (False, plus court
+        mot reconnu par un seul des deux).
+        """
+        return _equivalents(self, autre)
+    
+    def mots_equivalents(self, mot1: str, mot2: str) -> Tuple[bool, Optional[str]]:
+        """
+        Teste l'équivalence de Nerode de deux mots : leurs résiduels (langages
+        reconnus depuis les états atteints) sont comparés par Hopcroft-Karp.
+        Retourne (True, None) ou (False, plus court suffixe z tel qu'un seul
+        des mots mot1·z et mot2·z soit reconnu).
+        """
+        return _mots_equivalents(self, mot1, mot2)
+    
+    def compteur_mots(self) -> CompteurMots:
+        """Retourne le compteur de mots de l'automate déterminisé et émondé."""
+        self._finaux_a_jour()
+        if self._compteur is None:
+            deterministe = self if isinstance(self, AFDC) else self.determiniser()
+            self._compteur = CompteurMots(deterministe.compiler())
+        return self._compteur
+    
+    def compter_mots(self, longueur: int, jusqu_a: bool = False, modulo: Optional[int] = None) -> int:
+        """Compte les mots acceptés de longueur donnée (ou au plus donnée si jusqu_a)."""
+        return self.compteur_mots().compter(longueur, jusqu_a, modulo)
+    
+    def echantillonner_mot(self, longueur: int, generateur: Optional[random.Random] = None) -> Optional[str]:
+        """Tire uniformément un mot accepté de longueur donnée (None s'il n'en existe pas)."""
+        return self.compteur_mots().echantillonner(longueur, generateur)
+    
+    def explicite(self) -> 'Automate':
+        """Retourne un automate aux transitions explicites (lui-même)."""
+        return self
+    
+    def intersection(self, autre: Any) -> 'AutomateProduit':
+        """Retourne le produit paresseux reconnaissant l'intersection des langages."""
+        return AutomateProduit(self, autre, "intersection")
+    
+    def union(self, autre: Any) -> 'AutomateProduit':
+        """Retourne le produit paresseux reconnaissant l'union des langages."""
+        return AutomateProduit(self, autre, "union")
+    
+    def miroir(self) -> 'AFNS':
+        """Retourne un AFNS reconnaissant le miroir du langage (transitions inversées)."""
+        initial = "miroir"
+        while initial in self.etats:
+            initial += "'"
+        epsilon = getattr(self, 'epsilon', 'ε')
+        alphabet = self.alphabet - {epsilon}
+        afns = AFNS(set(alphabet), self.etats | {initial}, initial, {self.etat_initial}, self.moteur)
+        for source, ligne in self.transitions.items():
+            for symbole, cibles in ligne.items():
+                for cible in cibles:
+                    afns.ajouter_transition(cible, epsilon if symbole == epsilon else symbole, source)
+        for etat in self.etats_finaux:
+            afns.ajouter_transition(initial, afns.epsilon, etat)
+        return afns
+    
+    def est_fini(self) -> bool:
+        """Indique si l'automate reconnaît un langage fini."""
+        return self.compiler_bitset().est_fini()
+    
+    def enumerer_mots(self, longueur_max: Optional[int] = None,
+                      limite: Optional[int] = None) -> Iterator[str]:
+        """Produit les mots reconnus par ordre hiérarchique, jusqu'à une longueur ou un nombre donnés."""
+        return self.compiler_bitset().enumerer(longueur_max, limite)
+    
+    def reconnaisseur(self, encodage: str = "utf-8") -> ReconnaisseurFlux:
+        """Crée un reconnaisseur incrémental (feed/etat/accepte) pour cet automate."""
+        return ReconnaisseurFlux(self, encodage)
+    
+    def reconnaitre_mots(self, mots: Any) -> Any:
+        """
+        Reconnaît un lot de mots : un itérable de chaînes, ou une matrice NumPy
+        de mots encodés (indices dans l'alphabet trié privé de ε, comme pour
+        l'AFDC déterminisé, complétée par -1). Un code hors alphabet rejette
+        le mot. Retourne un tableau booléen NumPy si disponible, une liste sinon.
+        """
+        if np is not None and isinstance(mots, np.ndarray):
+            symboles = sorted(self.alphabet - {getattr(self, 'epsilon', 'ε')})
+            resultats = [all(code < len(symboles) for code in ligne)
+                         and self.reconnaitre_mot(''.join(symboles[code] for code in ligne if code >= 0))
+                         for ligne in mots.tolist()]
+            return np.array(resultats, dtype=bool)
+        resultats = [self.reconnaitre_mot(mot) for mot in mots]
+        return np.array(resultats, dtype=bool) if np is not None else resultats
     
     
     def obtenir_transitions(self, etat: str, symbole: str) -> Set[str]:
@@ -28,15 +1119,28 @@ class Automate:
     
     def reconnaitre_mot(self, mot: str) -> bool:
         """Version corrigée qui ne modifie pas les transitions"""
+        mesure = INSTRUMENTATION.actif
+        if mesure:
+            INSTRUMENTATION.compter("mots")
+        if self.moteur != "ensembles":
+            if mesure:
+                INSTRUMENTATION.compter("symboles_lus", len(mot))
+            return self._simulateur().reconnaitre(mot)
         etat_courant = {self.etat_initial}
+        epsilon = getattr(self, 'epsilon', None)
         
         for symbole in mot:
-            if symbole not in self.alphabet:
+            # ε n'est pas un symbole d'entrée : les moteurs compilés le rejettent aussi
+            if symbole not in self.alphabet or symbole == epsilon:
                 return False
             
             nouveaux_etats = set()
             for etat in etat_courant:
                 nouveaux_etats.update(self.obtenir_transitions(etat, symbole))
+            if mesure:
+                INSTRUMENTATION.pas_simulation(
+                    sum(len(self.obtenir_transitions(etat, symbole)) for etat in etat_courant),
+                    len(nouveaux_etats))
             
             if not nouveaux_etats:
                 return False
@@ -44,8 +1148,149 @@ class Automate:
         
         return any(etat in self.etats_finaux for etat in etat_courant)
     
-    def reconnaitre_mot_avec_chemin(self, mot: str) -> Tuple[bool, List[Tuple[str, str, str]]]:
-        """Version corrigée avec chemin"""
+    def reconnaitre_mot_avec_chemin(self, mot: str, intervalle_points: Optional[int] = None,
+                                    exploration: bool = False) -> Tuple[bool, List[Tuple[str, str, str]]]:
+        """
+        Reconnaît un mot et retourne un calcul sous forme de transitions
+        (source, symbole, cible), ε-transitions comprises : un calcul acceptant
+        si le mot est reconnu, sinon un calcul acceptant son plus long préfixe
+        reconnu (liste vide s'il n'y en a pas).
+        
+        Chaque pas de la simulation produit deux tableaux parallèles : les
+        états actifs et, pour chacun, un pointeur arrière. La mémoire est donc
+        en O(Σ|actifs|) sur les pas du mot, soit O(|w|) pour un AFD. Avec
+        `intervalle_points` = k, seuls les états actifs de tous les k pas sont
+        conservés et les pointeurs sont recalculés segment par segment lors de
+        la reconstruction : la mémoire passe à O((|w|/k + k)·max|actifs|).
+        
+        Avec `exploration`, retourne à la place toutes les transitions explorées.
+        """
+        if exploration:
+            return self._explorer_chemins(mot)
+        if intervalle_points is not None and intervalle_points < 1:
+            raise ValueError("L'intervalle entre points de reprise doit être positif")
+        
+        # Les états sont numérotés à leur première rencontre : rien n'est alloué pour les autres
+        indice: Dict[str, int] = {}
+        etats: List[str] = []
+        epsilon = getattr(self, 'epsilon', None)
+        adjacences: Dict[str, Dict[int, List[int]]] = {}
+        
+        def numero(etat: str) -> int:
+            rang = indice.get(etat)
+            if rang is None:
+                rang = indice[etat] = len(etats)
+                etats.append(etat)
+            return rang
+        
+        def successeurs(source: int, symbole: str) -> List[int]:
+            """Successeurs d'un état par un symbole, en numéros (mémorisés pour les recalculs)."""
+            par_etat = adjacences.setdefault(symbole, {})
+            cibles = par_etat.get(source)
+            if cibles is None:
+                cibles = par_etat[source] = [
+                    numero(cible) for cible in sorted(self.transitions[etats[source]].get(symbole, ()))]
+            return cibles
+        
+        def couche(precedents: Optional[array], symbole: str = "") -> Tuple[array, array]:
+            """
+            États actifs après un pas et leurs pointeurs arrière : p >= 0 pour le
+            rang du prédécesseur par le symbole dans le pas précédent, -3 - u
+            pour un prédécesseur de rang u du même pas par ε, -2 pour l'état initial.
+            """
+            if precedents is None:
+                actifs = array('i', [numero(self.etat_initial)])
+                retour = array('i', [-2])
+            else:
+                actifs, retour = array('i'), array('i')
+                vus: Set[int] = set()
+                for rang, source in enumerate(precedents):
+                    for cible in successeurs(source, symbole):
+                        if cible not in vus:
+                            vus.add(cible)
+                            actifs.append(cible)
+                            retour.append(rang)
+            if epsilon is not None:
+                # Parcours en largeur : les tableaux s'allongent pendant l'itération
+                vus = set(actifs)
+                rang = 0
+                while rang < len(actifs):
+                    for cible in successeurs(actifs[rang], epsilon):
+                        if cible not in vus:
+                            vus.add(cible)
+                            actifs.append(cible)
+                            retour.append(-3 - rang)
+                    rang += 1
+            return actifs, retour
+        
+        def rang_final(actifs: array) -> Optional[int]:
+            return next((rang for rang, etat in enumerate(actifs) if etats[etat] in self.etats_finaux), None)
+        
+        # Passe avant : couches de tous les pas, ou seulement points de reprise
+        actifs, retour = couche(None)
+        couches_completes: List[Tuple[array, Optional[array]]] = [(actifs, retour)]
+        points = {0: actifs}
+        final = rang_final(actifs)
+        meilleur = None if final is None else (0, final)
+        for i, symbole in enumerate(mot, 1):
+            if symbole not in self.alphabet or symbole == epsilon:
+                break
+            actifs, retour = couche(actifs, symbole)
+            if not actifs:
+                break
+            if intervalle_points is None:
+                couches_completes.append((actifs, retour))
+            elif i % intervalle_points == 0:
+                points[i] = actifs
+            final = rang_final(actifs)
+            if final is not None:
+                meilleur = (i, final)
+        if meilleur is None:
+            return False, []
+        
+        chemin: List[Tuple[str, str, str]] = []
+        
+        def remonter(couches: List[Tuple[array, Optional[array]]], base: int, pas: int, rang: int) -> int:
+            """Suit les pointeurs du pas `pas` jusqu'au pas `base` ; retourne le rang atteint."""
+            while True:
+                actifs, retour = couches[pas - base]
+                precedent = retour[rang]
+                if precedent <= -3:
+                    chemin.append((etats[actifs[-3 - precedent]], epsilon, etats[actifs[rang]]))
+                    rang = -3 - precedent
+                elif precedent >= 0:
+                    source = couches[pas - base - 1][0][precedent]
+                    chemin.append((etats[source], mot[pas - 1], etats[actifs[rang]]))
+                    rang = precedent
+                    pas -= 1
+                    if pas == base and base > 0:
+                        return rang
+                else:
+                    return rang
+        
+        longueur, rang = meilleur
+        if intervalle_points is None:
+            remonter(couches_completes, 0, longueur, rang)
+        else:
+            pas = longueur
+            while True:
+                # Recalcul des couches du segment ]base, pas] depuis son point de reprise
+                base = (pas - 1) // intervalle_points * intervalle_points if pas > 0 else 0
+                if base == 0:
+                    couches: List[Tuple[array, Optional[array]]] = [couche(None)]
+                else:
+                    couches = [(points[base], None)]
+                for i in range(base + 1, pas + 1):
+                    couches.append(couche(couches[-1][0], mot[i - 1]))
+                rang = remonter(couches, base, pas, rang)
+                if base == 0:
+                    break
+                pas = base
+        chemin.reverse()
+        return longueur == len(mot), chemin
+    
+    def _explorer_chemins(self, mot: str) -> Tuple[bool, List[Tuple[str, str, str]]]:
+        """Version corrigée avec chemin : toutes les transitions explorées, pas par pas."""
         chemin = []
         current_states = {self.etat_initial}
         
@@ -65,31 +1310,183 @@ class Automate:
     
     
 class AFDC(Automate):
-    """Automate Fini Déterministe Complet."""
+    """
+    Automate Fini Déterministe Complet.
+    Un AFDC créé depuis une table compilée ne matérialise ses dictionnaires
+    de transitions qu'au premier accès à `transitions`.
+    """
+    
+    @classmethod
+    def depuis_table(cls, table: TableTransitions) -> 'AFDC':
+        """Crée un AFDC directement adossé à une table compilée."""
+        afdc = cls.__new__(cls)
+        afdc.alphabet = set(table.symboles)
+        afdc.etats = set(table.etats)
+        afdc.etat_initial = table.etats[table.initial]
+        afdc.etats_finaux = {etat for i, etat in enumerate(table.etats) if table.finaux[i]}
+        afdc._initialiser_caches()
+        afdc._transitions = None
+        afdc._table = table
+        afdc.choisir_moteur("ensembles")
+        return afdc
+    
+    @property
+    def transitions(self) -> Dict[str, Dict[str, Set[str]]]:
+        """Dictionnaires de transitions, reconstruits depuis la table si besoin."""
+        if self._transitions is None:
+            self._transitions = self._materialiser_transitions()
+        return self._transitions
+    
+    @transitions.setter
+    def transitions(self, transitions: Dict[str, Dict[str, Set[str]]]) -> None:
+        self._transitions = transitions
+    
+    def _materialiser_transitions(self) -> Dict[str, Dict[str, Set[str]]]:
+        """Construit les dictionnaires de transitions depuis la table compilée."""
+        table = self._table
+        k = table.nb_symboles
+        transitions = {}
+        for i, etat in enumerate(table.etats):
+            ligne = {}
+            for j, symbole in enumerate(table.symboles):
+                cible = table.table[i * k + j]
+                ligne[symbole] = {table.etats[cible]} if cible != table.puits else set()
+            transitions[etat] = ligne
+        return transitions
+    
+    def _invalider_caches(self) -> None:
+        """Matérialise les transitions avant d'oublier la table qui les porte."""
+        if self._transitions is None:
+            self._transitions = self._materialiser_transitions()
+        super()._invalider_caches()
     
     def ajouter_transition(self, source: str, symbole: str, cible: str) -> None:
         if len(self.transitions[source][symbole]) > 0:
             raise ValueError("Un ADC ne peut avoir qu'une transition par symbole")
         super().ajouter_transition(source, symbole, cible)
     
+    def _valider_transitions(self, aretes: List[Tuple[str, str, str]]) -> None:
+        """Vérifie en plus qu'aucun couple (source, symbole) n'a deux cibles."""
+        super()._valider_transitions(aretes)
+        cibles: Dict[Tuple[str, str], str] = {}
+        for source, symbole, cible in aretes:
+            existantes = self.transitions[source][symbole]
+            if cibles.setdefault((source, symbole), cible) != cible or (existantes and cible not in existantes):
+                raise ValueError(f"Un ADC ne peut avoir qu'une transition par symbole ({source}, {symbole})")
+    
     def reconnaitre_mot(self, mot: str) -> bool:
-        etat_courant = self.etat_initial
+        """Reconnaît un mot par parcours de la table compilée."""
+        if INSTRUMENTATION.actif:
+            INSTRUMENTATION.compter("mots")
+            INSTRUMENTATION.compter("symboles_lus", len(mot))
+        return self.compiler().reconnaitre(mot)
+    
+    def reconnaitre_mots(self, mots: Any) -> Any:
+        """
+        Reconnaît un lot de mots. Avec NumPy, tous les mots avancent ensemble
+        d'une position par étape grâce à l'indexation vectorisée de la table.
+        """
+        table = self.compiler()
+        if np is None:
+            return [table.reconnaitre(mot) for mot in mots]
+        if not isinstance(mots, np.ndarray):
+            mots = table.encoder(list(mots))
+        return table.reconnaitre_encodes(mots)
+    
+    def minimiser(self) -> 'AFDC':
+        """
+        Retourne l'AFDC minimal complet équivalent, par l'algorithme de Hopcroft
+        (raffinement de partition en O(n·k·log n)). Chaque état du résultat porte
+        le plus petit nom des états qu'il regroupe.
+        """
+        table = self.compiler()
+        k = table.nb_symboles
+        transitions = table.table
         
-        for symbole in mot:
-            if symbole not in self.alphabet:
-                return False
-            next_states = self.obtenir_transitions(etat_courant, symbole)
-            if len(next_states) != 1:
-                return False
-            etat_courant = next(iter(next_states))  # Ne modifie pas l'ensemble
+        # États accessibles (le puits n'y figure que si l'automate est incomplet)
+        accessibles = [table.initial]
+        vus = {table.initial}
+        for etat in accessibles:
+            base = etat * k
+            for j in range(k):
+                cible = transitions[base + j]
+                if cible not in vus:
+                    vus.add(cible)
+                    accessibles.append(cible)
+        
+        inverse: List[Dict[int, List[int]]] = [{} for _ in range(k)]
+        for etat in accessibles:
+            base = etat * k
+            for j in range(k):
+                inverse[j].setdefault(transitions[base + j], []).append(etat)
+        
+        finaux = {etat for etat in accessibles if table.finaux[etat]}
+        autres = vus - finaux
+        blocs: List[Set[int]] = [set(bloc) for bloc in (finaux, autres) if bloc]
+        bloc_de: Dict[int, int] = {}
+        for numero, bloc in enumerate(blocs):
+            for etat in bloc:
+                bloc_de[etat] = numero
         
-        return etat_courant in self.etats_finaux
+        # Un seul des deux blocs initiaux suffit comme séparateur : le plus petit
+        attente = set()
+        if len(blocs) == 2:
+            plus_petit = 0 if len(blocs[0]) <= len(blocs[1]) else 1
+            attente = {(plus_petit, j) for j in range(k)}
+        while attente:
+            separateur, j = attente.pop()
+            touches: Dict[int, List[int]] = {}
+            for cible in blocs[separateur]:
+                for etat in inverse[j].get(cible, ()):
+                    touches.setdefault(bloc_de[etat], []).append(etat)
+            
+            for numero, membres in touches.items():
+                bloc = blocs[numero]
+                if len(membres) == len(bloc):
+                    continue
+                # Le plus petit morceau devient le nouveau bloc
+                nouveau = set(membres)
+                if 2 * len(nouveau) > len(bloc):
+                    nouveau = bloc - nouveau
+                bloc -= nouveau
+                nouveau_numero = len(blocs)
+                blocs.append(nouveau)
+                for etat in nouveau:
+                    bloc_de[etat] = nouveau_numero
+                for symbole in range(k):
+                    attente.add((nouveau_numero, symbole))
+        
+        def nom(numero: int) -> str:
+            reels = [table.etats[etat] for etat in blocs[numero] if etat != table.puits]
+            if reels:
+                return min(reels)
+            puits = "⊥"
+            while puits in self.etats:
+                puits += "'"
+            return puits
+        
+        noms = [nom(numero) for numero in range(len(blocs))]
+        minimal = AFDC(set(self.alphabet), set(noms), noms[bloc_de[table.initial]],
+                       {noms[bloc_de[etat]] for etat in finaux})
+        for numero, bloc in enumerate(blocs):
+            representant = next(iter(bloc))
+            base = representant * k
+            for j, symbole in enumerate(table.symboles):
+                minimal.ajouter_transition(noms[numero], symbole, noms[bloc_de[transitions[base + j]]])
+        return minimal
     
 class AFND(Automate):
     """Automate Fini Non Déterministe."""
     
     def reconnaitre_mot(self, mot: str) -> bool:
         """Reconnaît un mot dans un AFND."""
+        mesure = INSTRUMENTATION.actif
+        if mesure:
+            INSTRUMENTATION.compter("mots")
+        if self.moteur != "ensembles":
+            if mesure:
+                INSTRUMENTATION.compter("symboles_lus", len(mot))
+            return self._simulateur().reconnaitre(mot)
         etat_courant = {self.etat_initial}
         
         for symbole in mot:
@@ -99,6 +1496,9 @@ class AFND(Automate):
             nouveaux_etats = set()
             for etat in etat_courant:
                 nouveaux_etats.update(self.transitions[etat][symbole])
+            if mesure:
+                INSTRUMENTATION.pas_simulation(
+                    sum(len(self.transitions[etat][symbole]) for etat in etat_courant), len(nouveaux_etats))
             
             if not nouveaux_etats:
                 return False
@@ -109,31 +1509,152 @@ class AFND(Automate):
 class AFNS(Automate):
     """Automate Fini Non Déterministe avec ε-transitions."""
     
-    def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, etats_finaux: Set[str]):
-        super().__init__(alphabet, etats, etat_initial, etats_finaux)
+    def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, etats_finaux: Set[str],
+                 moteur: str = "ensembles"):
+        super().__init__(alphabet, etats, etat_initial, etats_finaux, moteur)
         self.epsilon = 'ε'
         self.alphabet.add(self.epsilon)
+        for ligne in self.transitions.values():
+            ligne.setdefault(self.epsilon, set())
+        self._fermetures: Optional[Dict[str, FrozenSet[str]]] = None
     
-    def fermeture_epsilon(self, etats: Set[str]) -> Set[str]:
-        """Calcule la fermeture ε d'un ensemble d'états."""
-        fermeture = set(etats)
-        pile = list(etats)
+    def ajouter_transition(self, source: str, symbole: str, cible: str) -> None:
+        """Ajoute une transition et met à jour les ε-fermetures déjà calculées."""
+        super().ajouter_transition(source, symbole, cible)
+        if symbole == self.epsilon and self._fermetures is not None:
+            self._etendre_fermetures(source, cible)
+    
+    def ajouter_transitions(self, transitions: Iterable[Tuple[str, str, str]]) -> int:
+        """Ajoute des transitions en masse ; les ε-fermetures seront recalculées d'un bloc."""
+        nombre = super().ajouter_transitions(transitions)
+        self._fermetures = None
+        return nombre
+    
+    def _etendre_fermetures(self, source: str, cible: str) -> None:
+        """
+        Répercute l'ajout de l'ε-transition source -> cible : toute fermeture
+        contenant la source gagne l'ancienne fermeture de la cible.
+        """
+        ajout = self._fermetures[cible]
+        remplacees: Dict[int, FrozenSet[str]] = {}
+        for etat, fermeture in self._fermetures.items():
+            if source not in fermeture or ajout <= fermeture:
+                continue
+            cle = id(fermeture)
+            if cle not in remplacees:
+                remplacees[cle] = fermeture | ajout
+            self._fermetures[etat] = remplacees[cle]
+    
+    def fermetures_epsilon(self) -> Dict[str, FrozenSet[str]]:
+        """Retourne la ε-fermeture de chaque état, calculée une seule fois."""
+        if self._fermetures is None:
+            if INSTRUMENTATION.actif:
+                INSTRUMENTATION.compter("fermetures_calculees")
+            self._fermetures = self._calculer_fermetures()
+        return self._fermetures
+    
+    def _calculer_fermetures(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Calcule les ε-fermetures par l'algorithme de Tarjan sur le graphe des
+        ε-transitions : les composantes fortement connexes sortent dans l'ordre
+        topologique inverse, donc les fermetures de leurs successeurs sont
+        déjà connues et les états d'une même composante partagent la leur.
+        """
+        epsilon = self.epsilon
+        index: Dict[str, int] = {}
+        bas: Dict[str, int] = {}
+        pile: List[str] = []
+        sur_pile: Set[str] = set()
+        fermetures: Dict[str, FrozenSet[str]] = {}
         
-        while pile:
-            etat = pile.pop()
-            for etat_cible in self.transitions[etat][self.epsilon]:
-                if etat_cible not in fermeture:
-                    fermeture.add(etat_cible)
-                    pile.append(etat_cible)
+        for racine in self.etats:
+            if racine in index:
+                continue
+            index[racine] = bas[racine] = len(index)
+            pile.append(racine)
+            sur_pile.add(racine)
+            travail = [(racine, iter(self.transitions[racine][epsilon]))]
+            
+            while travail:
+                etat, successeurs = travail[-1]
+                descendu = False
+                for cible in successeurs:
+                    if cible not in index:
+                        index[cible] = bas[cible] = len(index)
+                        pile.append(cible)
+                        sur_pile.add(cible)
+                        travail.append((cible, iter(self.transitions[cible][epsilon])))
+                        descendu = True
+                        break
+                    if cible in sur_pile:
+                        bas[etat] = min(bas[etat], index[cible])
+                if descendu:
+                    continue
+                
+                travail.pop()
+                if travail:
+                    parent = travail[-1][0]
+                    bas[parent] = min(bas[parent], bas[etat])
+                if bas[etat] != index[etat]:
+                    continue
+                
+                # etat est la racine d'une composante fortement connexe
+                composante = []
+                while True:
+                    membre = pile.pop()
+                    sur_pile.discard(membre)
+                    composante.append(membre)
+                    if membre == etat:
+                        break
+                fermeture = set(composante)
+                for membre in composante:
+                    for cible in self.transitions[membre][epsilon]:
+                        if cible in fermetures:
+                            fermeture |= fermetures[cible]
+                partagee = frozenset(fermeture)
+                for membre in composante:
+                    fermetures[membre] = partagee
         
+        return fermetures
+    
+    def fermeture_epsilon(self, etats: Set[str]) -> Set[str]:
+        """Calcule la fermeture ε d'un ensemble d'états."""
+        if INSTRUMENTATION.actif:
+            INSTRUMENTATION.compter("fermetures_demandees")
+        fermetures = self.fermetures_epsilon()
+        fermeture = set()
+        for etat in etats:
+            fermeture |= fermetures[etat]
         return fermeture
     
+    def sans_epsilon(self) -> AFND:
+        """Construit un AFND équivalent sans ε-transitions."""
+        fermetures = self.fermetures_epsilon()
+        alphabet = self.alphabet - {self.epsilon}
+        finaux = {etat for etat in self.etats if fermetures[etat] & self.etats_finaux}
+        afnd = AFND(set(alphabet), set(self.etats), self.etat_initial, finaux, self.moteur)
+        for etat in self.etats:
+            ligne = afnd.transitions[etat]
+            for intermediaire in fermetures[etat]:
+                for symbole in alphabet:
+                    for cible in self.transitions[intermediaire][symbole]:
+                        ligne[symbole] |= fermetures[cible]
+        return afnd
+    
     def reconnaitre_mot(self, mot: str) -> bool:
         """Reconnaît un mot dans un AFNS."""
+        mesure = INSTRUMENTATION.actif
+        if mesure:
+            INSTRUMENTATION.compter("mots")
+        if self.moteur != "ensembles":
+            if mesure:
+                INSTRUMENTATION.compter("symboles_lus", len(mot))
+            return self._simulateur().reconnaitre(mot)
         etat_courant = self.fermeture_epsilon({self.etat_initial})
         
         for symbole in mot:
-            if symbole not in self.alphabet:
+            # Un ε lu dans le mot n'est pas une ε-transition : il rejette le mot, comme dans les tables
+            if symbole not in self.alphabet or symbole == self.epsilon:
                 return False
             
             # Transition normale
@@ -142,9 +1663,159 @@ class AFNS(Automate):
                 nouveaux_etats.update(self.transitions[etat][symbole])
             
             # Fermeture epsilon après transition
+            transitions = sum(len(self.transitions[etat][symbole]) for etat in etat_courant) if mesure else 0
             etat_courant = self.fermeture_epsilon(nouveaux_etats)
+            if mesure:
+                INSTRUMENTATION.pas_simulation(transitions, len(etat_courant))
             
             if not etat_courant:
                 return False
         
-        return any(etat in self.etats_finaux for etat in etat_courant)
\ No newline at end of file
+        return any(etat in self.etats_finaux for etat in etat_courant)
+
+
+class AutomateProduit:
+    """
+    Produit synchronisé paresseux de deux automates (intersection ou union).
+    Un état est un couple d'états des opérandes ; seuls les couples atteints
+    par les mots lus sont calculés, et `construire()` n'explore que les
+    couples accessibles.
+    
+    Un opérande qui se simule lui-même (produit, automate des dérivées) est
+    piloté directement ; un Automate l'est par sa table bitset, compilée au
+    premier usage. Chaque accès à `initial` (début d'une lecture) vérifie
+    que les opérandes n'ont pas été modifiés depuis, et reprend sinon leurs
+    nouvelles formes : un état obtenu avant la modification n'a plus de sens.
+    """
+    
+    MODES = ("intersection", "union")
+    
+    def __init__(self, gauche: Any, droite: Any, mode: str) -> None:
+        """
+        Initialise le produit.
+
+        Args:
+            gauche: Premier opérande (Automate, AutomateProduit ou AutomateDerivees)
+            droite: Second opérande (Automate, AutomateProduit ou AutomateDerivees)
+            mode: "intersection" ou "union"
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Mode {mode} inconnu (disponibles: {', '.join(self.MODES)})")
+        self.gauche = gauche
+        self.droite = droite
+        self.mode = mode
+        self.alphabet = (gauche.alphabet | droite.alphabet) - {'ε'}
+        self._signature: Any = None
+        self._gauche: Any = None
+        self._droite: Any = None
+        self._initial: Tuple[Any, Any] = (None, None)
+        self._mort: Tuple[Any, Any] = (None, None)
+        self._explicite: Optional[AFDC] = None
+    
+    @staticmethod
+    def _forme(operande: Any) -> Tuple[Any, Any]:
+        """Forme simulable d'un opérande et sa signature (qui change si l'opérande est modifié)."""
+        if isinstance(operande, AutomateProduit):
+            return operande, operande._rafraichir()
+        if _est_simulateur(operande):
+            return operande, operande
+        table = operande.compiler_bitset()
+        return table, table
+    
+    def _rafraichir(self) -> Any:
+        """Reprend les formes des opérandes si l'un d'eux a changé ; retourne la signature du produit."""
+        gauche, signature_gauche = self._forme(self.gauche)
+        droite, signature_droite = self._forme(self.droite)
+        signature = (signature_gauche, signature_droite)
+        if self._signature is None or signature[0] is not self._signature[0] \
+                or signature[1] is not self._signature[1]:
+            self._signature = signature
+            self._gauche, self._droite = gauche, droite
+            self._mort = (gauche.mort(), droite.mort())
+            self._initial = self._normaliser((gauche.initial, droite.initial))
+            self._explicite = None
+        return self._signature
+    
+    @property
+    def initial(self) -> Tuple[Any, Any]:
+        """Couple initial (les opérandes sont compilés ou recompilés au besoin)."""
+        self._rafraichir()
+        return self._initial
+    
+    def _normaliser(self, couple: Tuple[Any, Any]) -> Tuple[Any, Any]:
+        """Confond tous les couples sans issue en un unique état mort."""
+        gauche, droite = couple
+        vivant_gauche, vivant_droite = self._gauche.vivant(gauche), self._droite.vivant(droite)
+        if self.mode == "intersection":
+            mort = not (vivant_gauche and vivant_droite)
+        else:
+            mort = not (vivant_gauche or vivant_droite)
+        return self._mort if mort else couple
+    
+    def mort(self) -> Tuple[Any, Any]:
+        """Retourne l'état mort du produit."""
+        self._rafraichir()
+        return self._mort
+    
+    def vivant(self, couple: Tuple[Any, Any]) -> bool:
+        """Indique si un mot peut encore être accepté depuis ce couple."""
+        return couple != self._mort
+    
+    def suivant(self, couple: Tuple[Any, Any], symbole: str) -> Tuple[Any, Any]:
+        """Retourne le couple atteint en lisant un symbole."""
+        gauche, droite = couple
+        return self._normaliser((self._gauche.suivant(gauche, symbole),
+                                 self._droite.suivant(droite, symbole)))
+    
+    def accepte(self, couple: Tuple[Any, Any]) -> bool:
+        """Indique si le couple est final pour le mode du produit."""
+        gauche, droite = couple
+        if self.mode == "intersection":
+            return self._gauche.accepte(gauche) and self._droite.accepte(droite)
+        return self._gauche.accepte(gauche) or self._droite.accepte(droite)
+    
+    def reconnaitre_mot(self, mot: str) -> bool:
+        """Reconnaît un mot en faisant avancer les deux opérandes de concert."""
+        couple = self.initial
+        mort = self._mort
+        for symbole in mot:
+            couple = self.suivant(couple, symbole)
+            if couple == mort:
+                return False
+        return self.accepte(couple)
+    
+    def equivalent(self, autre: Any) -> Tuple[bool, Optional[str]]:
+        """Teste l'équivalence avec un automate ou un produit (voir Automate.equivalent)."""
+        return _equivalents(self, autre)
+    
+    def mots_equivalents(self, mot1: str, mot2: str) -> Tuple[bool, Optional[str]]:
+        """Teste l'équivalence de Nerode de deux mots (voir Automate.mots_equivalents)."""
+        return _mots_equivalents(self, mot1, mot2)
+    
+    def construire(self) -> AFDC:
+        """Retourne l'AFDC des couples accessibles (états nommés p0, p1, ...)."""
+        self._rafraichir()
+        if self._explicite is None:
+            self._explicite = explorer_deterministe(self, sorted(self.alphabet), "p")
+        return self._explicite
+    
+    def explicite(self) -> AFDC:
+        """Retourne l'automate explicite du produit."""
+        return self.construire()
+    
+    def intersection(self, autre: Any) -> 'AutomateProduit':
+        """Retourne le produit paresseux reconnaissant l'intersection des langages."""
+        return AutomateProduit(self, autre, "intersection")
+    
+    def union(self, autre: Any) -> 'AutomateProduit':
+        """Retourne le produit paresseux reconnaissant l'union des langages."""
+        return AutomateProduit(self, autre, "union")
+
+
+# Opérations chronométrées lorsque l'instrumentation est active
+INSTRUMENTATION.chronometrer(Automate, "reconnaitre_mot", "reconnaitre_mot_avec_chemin", "reconnaitre_mots",
+                             "determiniser", "complement", "compter_mots", "est_fini", "equivalent")
+INSTRUMENTATION.chronometrer(AFDC, "reconnaitre_mot", "reconnaitre_mots", "minimiser")
+INSTRUMENTATION.chronometrer(AFND, "reconnaitre_mot")
+INSTRUMENTATION.chronometrer(AFNS, "reconnaitre_mot", "_calculer_fermetures", "sans_epsilon")
+INSTRUMENTATION.chronometrer(AutomateProduit, "reconnaitre_mot", "construire")
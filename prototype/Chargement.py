@@ -0,0 +1,91 @@
+"""
+Module d'import en masse d'automates depuis une liste de transitions.
+Une transition par ligne, au format texte (`source symbole cible`, séparés
+par des blancs, `#` pour les commentaires) ou CSV (`source,symbole,cible`,
+avec une ligne d'en-tête facultative). Le chemin "-" désigne l'entrée standard.
+"""
+
+import csv
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Type, Union
+
+from Automate import AFDC, AFND, AFNS, Automate
+
+FORMATS = ("texte", "csv")
+TYPES: Dict[str, Type[Automate]] = {"AFD": AFDC, "AFN": AFND, "AFNS": AFNS}
+EN_TETE_CSV = ["source", "symbole", "cible"]
+
+
+def _lignes_texte(flux: TextIO) -> Iterator[Tuple[int, List[str]]]:
+    """Produit les champs de chaque ligne utile d'un fichier texte, avec son numéro."""
+    for numero, ligne in enumerate(flux, 1):
+        ligne = ligne.split("#", 1)[0].strip()
+        if ligne:
+            yield numero, ligne.split()
+
+
+def _lignes_csv(flux: TextIO) -> Iterator[Tuple[int, List[str]]]:
+    """Produit les champs de chaque ligne utile d'un fichier CSV, avec son numéro."""
+    for numero, champs in enumerate(csv.reader(flux), 1):
+        champs = [champ.strip() for champ in champs]
+        if not any(champs) or champs[0].startswith("#"):
+            continue
+        if numero == 1 and [champ.lower() for champ in champs] == EN_TETE_CSV:
+            continue
+        yield numero, champs
+
+
+def lire_transitions(source: Union[str, TextIO], format_fichier: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+    """
+    Lit une liste de transitions depuis un chemin, "-" (entrée standard) ou un
+    flux ouvert. Sans format explicite, l'extension .csv désigne le CSV.
+    """
+    if format_fichier is None:
+        format_fichier = "csv" if isinstance(source, str) and source.lower().endswith(".csv") else "texte"
+    if format_fichier not in FORMATS:
+        raise ValueError(f"Format {format_fichier} inconnu (disponibles: {', '.join(FORMATS)})")
+    lecteur = _lignes_csv if format_fichier == "csv" else _lignes_texte
+
+    if not isinstance(source, str):
+        yield from _transitions(lecteur(source))
+    elif source == "-":
+        yield from _transitions(lecteur(sys.stdin))
+    else:
+        with open(source, encoding="utf-8", newline="") as flux:
+            yield from _transitions(lecteur(flux))
+
+
+def _transitions(lignes: Iterable[Tuple[int, List[str]]]) -> Iterator[Tuple[str, str, str]]:
+    """Vérifie que chaque ligne compte exactement trois champs."""
+    for numero, champs in lignes:
+        if len(champs) != 3:
+            raise ValueError(f"Ligne {numero} : 3 champs attendus (source symbole cible), {len(champs)} lus")
+        yield champs[0], champs[1], champs[2]
+
+
+def importer_automate(source: Union[str, TextIO], type_automate: str, initial: str, finaux: Iterable[str],
+                      alphabet: Optional[Set[str]] = None, format_fichier: Optional[str] = None) -> Automate:
+    """
+    Construit un automate depuis une liste de transitions. Les états sont ceux
+    qui apparaissent dans les transitions, l'état initial et les finaux ;
+    l'alphabet, s'il n'est pas donné, est celui des transitions. Toutes les
+    transitions sont validées avant d'être ajoutées en une fois.
+    """
+    classe = TYPES.get(type_automate.upper())
+    if classe is None:
+        raise ValueError(f"Type d'automate {type_automate} inconnu (disponibles: {', '.join(TYPES)})")
+    aretes = list(lire_transitions(source, format_fichier))
+    finaux = set(finaux)
+
+    symboles = {symbole for _, symbole, _ in aretes}
+    if classe is AFNS:
+        symboles.discard('ε')
+    elif 'ε' in symboles:
+        raise ValueError("Les ε-transitions ne sont permises que dans un AFNS")
+    if alphabet is None:
+        alphabet = symboles
+    etats = {depart for depart, _, _ in aretes} | {cible for _, _, cible in aretes} | {initial} | finaux
+
+    automate = classe(set(alphabet), etats, initial, finaux)
+    automate.ajouter_transitions(aretes)
+    return automate
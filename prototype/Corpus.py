@@ -0,0 +1,116 @@
+"""
+Module de reconnaissance parallèle d'un corpus de mots.
+La forme compilée de l'automate est envoyée une seule fois à chaque
+processus, puis les mots circulent par gros lots.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from Automate import AFDC, Automate
+
+# Forme compilée installée dans chaque processus de travail
+_forme: Any = None
+
+
+def _installer_forme(forme: Any) -> None:
+    """Initialise un processus de travail avec la forme compilée."""
+    global _forme
+    _forme = forme
+
+
+def _reconnaitre_lot(mots: List[str]) -> bytes:
+    """Reconnaît un lot dans un processus de travail (un octet 0/1 par mot)."""
+    reconnaitre = _forme.reconnaitre
+    return bytes(reconnaitre(mot) for mot in mots)
+
+
+class RapportCorpus:
+    """Compteurs de débit d'une reconnaissance de corpus."""
+
+    def __init__(self) -> None:
+        self.mots = 0
+        self.acceptes = 0
+        self.duree = 0.0
+
+    def debit(self) -> float:
+        """Retourne le nombre de mots traités par seconde."""
+        return self.mots / self.duree if self.duree > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Représentation textuelle du rapport."""
+        return (f"{self.mots} mots, {self.acceptes} acceptés en {self.duree:.3f} s "
+                f"({self.debit():.0f} mots/s)")
+
+
+def forme_compilee(automate: Automate) -> Any:
+    """Retourne la forme compilée et sérialisable d'un automate."""
+    return automate.compiler() if isinstance(automate, AFDC) else automate.compiler_bitset()
+
+
+def _lire_mots(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Itère sur les mots d'un fichier (un par ligne) ou d'un itérable."""
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as fichier:
+            for ligne in fichier:
+                yield ligne.rstrip("\r\n")
+    else:
+        yield from source
+
+
+def _lots(mots: Iterator[str], taille_lot: int) -> Iterator[List[str]]:
+    """Découpe un flux de mots en lots."""
+    while True:
+        lot = list(islice(mots, taille_lot))
+        if not lot:
+            return
+        yield lot
+
+
+def reconnaitre_corpus(automate: Automate, chemin_ou_iterable: Union[str, Iterable[str]],
+                       workers: Optional[int] = None, taille_lot: int = 10000,
+                       rapport: Optional[RapportCorpus] = None) -> Iterator[Tuple[str, bool]]:
+    """
+    Reconnaît tous les mots d'un corpus et produit les couples (mot, accepté)
+    dans l'ordre d'entrée.
+
+    Args:
+        automate: Automate de référence
+        chemin_ou_iterable: Fichier texte (un mot par ligne) ou itérable de mots
+        workers: Nombre de processus (par défaut le nombre de cœurs ; 1 = sans processus)
+        taille_lot: Nombre de mots envoyés à la fois à un processus
+        rapport: Rapport mis à jour au fil de la reconnaissance
+    """
+    workers = workers or os.cpu_count() or 1
+    rapport = rapport if rapport is not None else RapportCorpus()
+    forme = forme_compilee(automate)
+    lots = _lots(_lire_mots(chemin_ou_iterable), taille_lot)
+    debut = time.perf_counter()
+
+    def publier(lot: List[str], resultats: bytes) -> Iterator[Tuple[str, bool]]:
+        rapport.mots += len(lot)
+        rapport.acceptes += sum(resultats)
+        rapport.duree = time.perf_counter() - debut
+        for mot, accepte in zip(lot, resultats):
+            yield mot, bool(accepte)
+
+    if workers <= 1:
+        for lot in lots:
+            yield from publier(lot, bytes(forme.reconnaitre(mot) for mot in lot))
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_installer_forme, initargs=(forme,)) as executeur:
+        # Fenêtre bornée de lots en cours, pour garder l'ordre sans tout charger
+        en_cours: deque = deque()
+        for lot in lots:
+            en_cours.append((lot, executeur.submit(_reconnaitre_lot, lot)))
+            if len(en_cours) >= 2 * workers:
+                lot_termine, futur = en_cours.popleft()
+                yield from publier(lot_termine, futur.result())
+        while en_cours:
+            lot_termine, futur = en_cours.popleft()
+            yield from publier(lot_termine, futur.result())
@@ -0,0 +1,296 @@
+"""
+Module de reconnaissance des expressions régulières par dérivées de Brzozowski.
+Les expressions sont partagées (hash-consing) et simplifiées dès leur
+construction : union associative, commutative et idempotente, ∅ et ε
+absorbés par la concaténation. La dérivée d'une expression par un symbole
+est mémorisée dans l'expression elle-même, si bien que seuls les états de
+l'AFD des dérivées effectivement atteints par les mots lus sont construits.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Union
+
+from Automate import AFDC, AutomateProduit, explorer_deterministe
+from Regex import EPSILON, Noeud, analyser_regex, symboles_regex
+
+
+class Expression:
+    """
+    Expression régulière partagée : deux expressions égales (à ACI près pour
+    l'union) sont le même objet, donc comparées par identité.
+    """
+
+    __slots__ = ("numero", "genre", "enfants", "symboles", "annulable", "_derivees")
+
+    def __init__(self, numero: int, genre: str, enfants: Tuple['Expression', ...] = (),
+                 symboles: FrozenSet[str] = frozenset(), annulable: bool = False) -> None:
+        """
+        Initialise une expression (réservé à FabriqueExpressions).
+
+        Args:
+            numero: Rang de création dans la fabrique
+            genre: "neant", "vide", "symboles", "union", "concat" ou "etoile"
+            enfants: Sous-expressions
+            symboles: Symboles acceptés (genre "symboles")
+            annulable: Le mot vide appartient-il au langage de l'expression
+        """
+        self.numero = numero
+        self.genre = genre
+        self.enfants = enfants
+        self.symboles = symboles
+        self.annulable = annulable
+        self._derivees: Dict[str, 'Expression'] = {}
+
+    def __repr__(self) -> str:
+        if self.genre == "neant":
+            return "∅"
+        if self.genre == "vide":
+            return EPSILON
+        if self.genre == "symboles":
+            symboles = sorted(self.symboles)
+            return symboles[0] if len(symboles) == 1 else f"[{''.join(symboles)}]"
+        if self.genre == "union":
+            return "(" + "|".join(sorted(repr(enfant) for enfant in self.enfants)) + ")"
+        if self.genre == "concat":
+            return "".join(repr(facteur) for facteur in self.facteurs())
+        return f"({self.enfants[0]!r})*"
+
+    def facteurs(self) -> Tuple['Expression', ...]:
+        """Facteurs d'une chaîne de concaténations (associée à droite), parcourue sans récursion."""
+        facteurs = []
+        courant = self
+        while courant.genre == "concat":
+            facteurs.append(courant.enfants[0])
+            courant = courant.enfants[1]
+        facteurs.append(courant)
+        return tuple(facteurs)
+
+
+class FabriqueExpressions:
+    """
+    Constructeurs intelligents : chaque expression n'est créée qu'une fois
+    (table de partage) et sous forme simplifiée.
+    """
+
+    def __init__(self) -> None:
+        self._table: Dict[Tuple, Expression] = {}
+        self.neant = self._partager(("neant",), lambda numero: Expression(numero, "neant"))
+        self.vide = self._partager(("vide",), lambda numero: Expression(numero, "vide", annulable=True))
+        self.derivations = 0
+
+    def _partager(self, cle: Tuple, creer: Callable[[int], Expression]) -> Expression:
+        """Retourne l'expression partagée de clé `cle`, créée au premier besoin."""
+        expression = self._table.get(cle)
+        if expression is None:
+            expression = self._table[cle] = creer(len(self._table))
+        return expression
+
+    def __len__(self) -> int:
+        """Nombre d'expressions distinctes créées."""
+        return len(self._table)
+
+    def symboles(self, symboles: Iterable[str]) -> Expression:
+        """Un symbole parmi un ensemble (∅ si l'ensemble est vide)."""
+        symboles = frozenset(symboles)
+        if not symboles:
+            return self.neant
+        return self._partager(("symboles", symboles),
+                              lambda numero: Expression(numero, "symboles", symboles=symboles))
+
+    def union(self, branches: Iterable[Expression]) -> Expression:
+        """Union aplatie, sans ∅ ni doublon, indépendante de l'ordre des branches."""
+        elements: Set[Expression] = set()
+        for branche in branches:
+            if branche.genre == "union":
+                elements.update(branche.enfants)
+            elif branche is not self.neant:
+                elements.add(branche)
+        if not elements:
+            return self.neant
+        if len(elements) == 1:
+            return next(iter(elements))
+        # Les enfants sont rangés par ordre de création pour un parcours reproductible
+        enfants = tuple(sorted(elements, key=lambda element: element.numero))
+        return self._partager(("union", frozenset(elements)),
+                              lambda numero: Expression(numero, "union", enfants,
+                                                        annulable=any(enfant.annulable for enfant in enfants)))
+
+    def concat(self, gauche: Expression, droite: Expression) -> Expression:
+        """
+        Concaténation associée à droite ; ∅ est absorbant et ε neutre. Une
+        chaîne à gauche est réassociée facteur par facteur, en boucle.
+        """
+        if gauche is self.neant or droite is self.neant:
+            return self.neant
+        if gauche is self.vide:
+            return droite
+        if droite is self.vide:
+            return gauche
+        resultat = droite
+        for facteur in reversed(gauche.facteurs()):
+            resultat = self._concat_facteur(facteur, resultat)
+        return resultat
+
+    def _concat_facteur(self, tete: Expression, queue: Expression) -> Expression:
+        """Maillon (tete, queue) d'une chaîne, `tete` n'étant ni une concaténation, ni ∅, ni ε."""
+        return self._partager(("concat", tete, queue),
+                              lambda numero: Expression(numero, "concat", (tete, queue),
+                                                        annulable=tete.annulable and queue.annulable))
+
+    def etoile(self, expression: Expression) -> Expression:
+        """Étoile, avec ∅* = ε* = ε et (r*)* = r*."""
+        if expression is self.neant or expression is self.vide:
+            return self.vide
+        if expression.genre == "etoile":
+            return expression
+        return self._partager(("etoile", expression),
+                              lambda numero: Expression(numero, "etoile", (expression,), annulable=True))
+
+    def depuis_arbre(self, noeud: Noeud) -> Expression:
+        """Traduit un arbre syntaxique de Regex en expression partagée."""
+        genre = noeud[0]
+        if genre == "neant":
+            return self.neant
+        if genre == "vide":
+            return self.vide
+        if genre == "symboles":
+            return self.symboles(noeud[1])
+        if genre == "union":
+            return self.union(self.depuis_arbre(branche) for branche in noeud[1])
+        if genre == "concat":
+            resultat = self.vide
+            for facteur in reversed(noeud[1]):
+                resultat = self.concat(self.depuis_arbre(facteur), resultat)
+            return resultat
+        if genre in ("etoile", "plus", "option"):
+            interne = self.depuis_arbre(noeud[1])
+            if genre == "etoile":
+                return self.etoile(interne)
+            if genre == "plus":
+                return self.concat(interne, self.etoile(interne))
+            return self.union([interne, self.vide])
+        raise ValueError(f"Nœud '{genre}' non pris en charge par les dérivées")
+
+    def deriver(self, expression: Expression, symbole: str) -> Expression:
+        """Dérivée de Brzozowski par un symbole, mémorisée dans l'expression."""
+        derivee = expression._derivees.get(symbole)
+        if derivee is not None:
+            return derivee
+        genre = expression.genre
+        if genre == "concat":
+            return self._deriver_chaine(expression, symbole)
+        self.derivations += 1
+        if genre == "symboles":
+            derivee = self.vide if symbole in expression.symboles else self.neant
+        elif genre == "union":
+            derivee = self.union(self.deriver(enfant, symbole) for enfant in expression.enfants)
+        elif genre == "etoile":
+            derivee = self.concat(self.deriver(expression.enfants[0], symbole), expression)
+        else:
+            derivee = self.neant
+        expression._derivees[symbole] = derivee
+        return derivee
+
+    def _deriver_chaine(self, expression: Expression, symbole: str) -> Expression:
+        """
+        Dérivée d'une chaîne de concaténations, sans récursion sur sa longueur :
+        on descend tant que la tête est annulable (et la dérivée inconnue), puis
+        chaque maillon est dérivé de la queue vers la tête et mémorisé.
+        """
+        maillons = []
+        courant = expression
+        while courant.genre == "concat" and symbole not in courant._derivees:
+            maillons.append(courant)
+            if not courant.enfants[0].annulable:
+                break
+            courant = courant.enfants[1]
+        for maillon in reversed(maillons):
+            self.derivations += 1
+            tete, queue = maillon.enfants
+            derivee = self.concat(self.deriver(tete, symbole), queue)
+            if tete.annulable:
+                derivee = self.union([derivee, self.deriver(queue, symbole)])
+            maillon._derivees[symbole] = derivee
+        return expression._derivees[symbole]
+
+
+class AutomateDerivees:
+    """
+    AFD paresseux des dérivées d'une expression régulière : ses états sont
+    des expressions, construites à la première lecture qui les atteint. Il
+    offre l'interface des simulateurs (initial, suivant, accepte) et, par son
+    AFDC explicite, celle des automates utilisée par LangageReconnaissable.
+    """
+
+    def __init__(self, expression: Union[str, Noeud], alphabet: Optional[Set[str]] = None) -> None:
+        """
+        Initialise l'automate des dérivées.
+
+        Args:
+            expression: Expression régulière ou arbre syntaxique
+            alphabet: Symboles à ajouter à ceux de l'expression
+        """
+        arbre = analyser_regex(expression) if isinstance(expression, str) else expression
+        self.fabrique = FabriqueExpressions()
+        self.initial = self.fabrique.depuis_arbre(arbre)
+        self.alphabet = (symboles_regex(arbre) | set(alphabet or ())) - {EPSILON}
+        self._explicite: Optional[AFDC] = None
+
+    def suivant(self, expression: Expression, symbole: str) -> Expression:
+        """Retourne la dérivée par un symbole."""
+        return self.fabrique.deriver(expression, symbole)
+
+    def accepte(self, expression: Expression) -> bool:
+        """Indique si l'expression accepte le mot vide."""
+        return expression.annulable
+
+    def mort(self) -> Expression:
+        """Retourne l'expression ∅, état puits."""
+        return self.fabrique.neant
+
+    def vivant(self, expression: Expression) -> bool:
+        """Indique si l'expression n'est pas ∅ (une expression simplifiée non vide a des mots)."""
+        return expression is not self.fabrique.neant
+
+    def reconnaitre_mot(self, mot: str) -> bool:
+        """Reconnaît un mot en dérivant l'expression symbole par symbole."""
+        deriver = self.fabrique.deriver
+        neant = self.fabrique.neant
+        expression = self.initial
+        for symbole in mot:
+            expression = deriver(expression, symbole)
+            if expression is neant:
+                return False
+        return expression.annulable
+
+    def statistiques(self) -> Dict[str, int]:
+        """Expressions créées et dérivées calculées (les autres sont lues dans le cache)."""
+        return {"expressions": len(self.fabrique), "derivations": self.fabrique.derivations}
+
+    def construire(self) -> AFDC:
+        """Retourne l'AFDC complet de toutes les dérivées accessibles (états r0, r1, ...)."""
+        if self._explicite is None:
+            self._explicite = explorer_deterministe(self, sorted(self.alphabet), "r")
+        return self._explicite
+
+    def explicite(self) -> AFDC:
+        """Retourne l'automate explicite des dérivées."""
+        return self.construire()
+
+    def compiler_bitset(self) -> Any:
+        """
+        Forme compilée de l'automate explicite, donc de toutes les dérivées
+        accessibles ; les produits n'en ont pas besoin et dérivent à la demande.
+        """
+        return self.construire().compiler_bitset()
+
+    def union(self, autre: Any) -> AutomateProduit:
+        """Retourne le produit paresseux reconnaissant l'union des langages."""
+        return AutomateProduit(self, autre, "union")
+
+    def intersection(self, autre: Any) -> AutomateProduit:
+        """Retourne le produit paresseux reconnaissant l'intersection des langages."""
+        return AutomateProduit(self, autre, "intersection")
+
+    def equivalent(self, autre: Any) -> Tuple[bool, Optional[str]]:
+        """Teste l'équivalence avec un automate (voir Automate.equivalent)."""
+        return self.construire().equivalent(autre)
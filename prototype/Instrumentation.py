@@ -0,0 +1,160 @@
+"""
+Module d'instrumentation optionnelle des automates et des langages.
+Désactivée, elle ne coûte qu'un test de booléen à l'entrée des simulations :
+les méthodes chronométrées ne sont enveloppées qu'à l'activation et
+retrouvent leur version d'origine à la désactivation.
+"""
+
+import cProfile
+import functools
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class Instrumentation:
+    """
+    Compteurs (transitions suivies, fermetures...), maxima (taille des
+    ensembles d'états actifs) et durées par opération, plus un profileur
+    cProfile facultatif.
+
+    Tous les moteurs de reconnaissance alimentent « transitions_suivies » et
+    « etats_actifs » : une transition et un état par symbole pour la table
+    d'un AFD, une transition par symbole (vers un ensemble d'états) pour le
+    moteur paresseux, et les successeurs des états actifs pour les moteurs
+    ensembles et bitset (ce dernier compte des cibles déjà ε-fermées).
+    """
+
+    def __init__(self) -> None:
+        self.actif = False
+        self._methodes: List[Tuple[type, str, str]] = []
+        self._originales: Dict[Tuple[type, str], Callable] = {}
+        self._profileur: Any = None
+        self.reinitialiser()
+
+    def reinitialiser(self) -> None:
+        """Remet tous les compteurs à zéro."""
+        self.compteurs: Dict[str, int] = {}
+        self.maxima: Dict[str, int] = {}
+        self.durees: Dict[str, List[float]] = {}
+
+    # --- Collecte ---
+
+    def compter(self, nom: str, quantite: int = 1) -> None:
+        """Ajoute `quantite` au compteur `nom`."""
+        self.compteurs[nom] = self.compteurs.get(nom, 0) + quantite
+
+    def maximum(self, nom: str, valeur: int) -> None:
+        """Retient la plus grande valeur observée pour `nom`."""
+        if valeur > self.maxima.get(nom, -1):
+            self.maxima[nom] = valeur
+
+    def pas_simulation(self, transitions: int, actifs: int) -> None:
+        """Enregistre un pas de simulation d'AFN : transitions suivies et états actifs."""
+        self.compteurs["transitions_suivies"] = self.compteurs.get("transitions_suivies", 0) + transitions
+        if actifs > self.maxima.get("etats_actifs", -1):
+            self.maxima["etats_actifs"] = actifs
+
+    def enregistrer_duree(self, operation: str, duree: float) -> None:
+        """Cumule une durée d'exécution (appels, total, maximum)."""
+        mesure = self.durees.get(operation)
+        if mesure is None:
+            self.durees[operation] = [1, duree, duree]
+        else:
+            mesure[0] += 1
+            mesure[1] += duree
+            mesure[2] = max(mesure[2], duree)
+
+    # --- Activation ---
+
+    def chronometrer(self, classe: type, *noms: str) -> None:
+        """Déclare des méthodes de `classe` à chronométrer lorsque l'instrumentation est active."""
+        for nom in noms:
+            self._methodes.append((classe, nom, f"{classe.__name__}.{nom}"))
+        if self.actif:
+            self._envelopper()
+
+    def _envelopper(self) -> None:
+        for classe, nom, etiquette in self._methodes:
+            if (classe, nom) in self._originales or nom not in classe.__dict__:
+                continue
+            methode = classe.__dict__[nom]
+            self._originales[(classe, nom)] = methode
+            setattr(classe, nom, self._chronometree(etiquette, methode))
+
+    def _chronometree(self, etiquette: str, methode: Callable) -> Callable:
+        instrumentation = self
+
+        @functools.wraps(methode)
+        def enveloppe(*args: Any, **kwargs: Any) -> Any:
+            debut = time.perf_counter()
+            try:
+                return methode(*args, **kwargs)
+            finally:
+                instrumentation.enregistrer_duree(etiquette, time.perf_counter() - debut)
+        return enveloppe
+
+    def activer(self) -> None:
+        """Active la collecte et enveloppe les méthodes chronométrées."""
+        self.actif = True
+        self._envelopper()
+
+    def desactiver(self) -> None:
+        """Arrête la collecte et restaure les méthodes d'origine (les mesures sont conservées)."""
+        self.actif = False
+        for (classe, nom), methode in self._originales.items():
+            setattr(classe, nom, methode)
+        self._originales.clear()
+
+    # --- Profilage ---
+
+    def demarrer_profil(self) -> None:
+        """Démarre (ou reprend) le profilage cProfile."""
+        if self._profileur is None:
+            self._profileur = cProfile.Profile()
+        self._profileur.enable()
+
+    def arreter_profil(self) -> None:
+        """Suspend le profilage cProfile."""
+        if self._profileur is not None:
+            self._profileur.disable()
+
+    # --- Restitution ---
+
+    def vers_dict(self) -> Dict[str, Any]:
+        """Retourne les mesures sous forme sérialisable en JSON."""
+        return {
+            "compteurs": dict(self.compteurs),
+            "maxima": dict(self.maxima),
+            "durees": {operation: {"appels": appels, "total_s": total, "moyenne_s": total / appels,
+                                   "max_s": maximum}
+                       for operation, (appels, total, maximum) in sorted(self.durees.items())},
+        }
+
+    def exporter(self, chemin: str) -> None:
+        """
+        Exporte les mesures : au format cProfile (lisible par pstats) si le
+        chemin finit par .prof ou .pstats, en JSON sinon.
+        """
+        if chemin.endswith((".prof", ".pstats")):
+            if self._profileur is None:
+                raise ValueError("Aucun profil enregistré (stats profil on)")
+            self._profileur.dump_stats(chemin)
+            return
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump(self.vers_dict(), fichier, indent=2, ensure_ascii=False)
+
+    def __str__(self) -> str:
+        lignes = [f"Instrumentation {'active' if self.actif else 'inactive'}"]
+        for nom, valeur in sorted(self.compteurs.items()):
+            lignes.append(f"  {nom}: {valeur}")
+        for nom, valeur in sorted(self.maxima.items()):
+            lignes.append(f"  max {nom}: {valeur}")
+        for operation, (appels, total, maximum) in sorted(self.durees.items()):
+            lignes.append(f"  {operation}: {appels} appels, {total * 1000:.3f} ms "
+                          f"(moyenne {total / appels * 1e6:.1f} µs, max {maximum * 1e6:.1f} µs)")
+        return "\n".join(lignes)
+
+
+# Instance partagée par tous les modules
+INSTRUMENTATION = Instrumentation()
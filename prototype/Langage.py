@@ -3,78 +3,225 @@ Module implémentant la classe Langage et ses opérations.
 Un langage est un ensemble de mots sur un alphabet donné.
 """
 
-from typing import Set, List, Dict, Optional, Union, Any, Tuple
+import random
+from typing import Set, List, Dict, Iterator, Optional, Union, Any, Tuple
 from Mot import Mot
+from Regex import Noeud, arbre_des_mots, compiler_regex, thompson, EPSILON
+from Trie import TrieMots
+from Derivees import AutomateDerivees
+from AhoCorasick import AhoCorasick
+from Instrumentation import INSTRUMENTATION
 
 class Langage:
     """
     Classe représentant un langage (ensemble de mots).
+    Les mots sont stockés soit dans un ensemble de Mot, soit dans un trie
+    (stockage="trie") qui partage les préfixes communs ; dans ce dernier cas
+    `mots` est matérialisé à chaque accès et les opérations de préfixe,
+    suffixe, quotient et concaténation travaillent directement sur le trie.
+
+    Le trie n'est plus compact que l'ensemble que si les mots partagent de
+    longs préfixes (identifiants numérotés, mots d'un même radical) : pour
+    des mots aléatoires, chaque symbole propre à un mot coûte un nœud, bien
+    plus qu'un caractère de chaîne. Il se justifie alors seulement par les
+    requêtes de préfixe ou de suffixe, et l'union, qui recopie les nœuds,
+    reste plus rapide sur des ensembles.
     """
     
-    def __init__(self, mots: Optional[Set[Mot]] = None, alphabet: Optional[Set[str]] = None) -> None:
+    STOCKAGES = ("ensemble", "trie")
+    
+    def __init__(self, mots: Optional[Set[Mot]] = None, alphabet: Optional[Set[str]] = None,
+                 stockage: str = "ensemble") -> None:
         """
         Initialise un langage.
         
         Args:
             mots: Ensemble de mots du langage (peut être None)
             alphabet: Alphabet du langage (peut être None)
+            stockage: "ensemble" (ensemble de Mot) ou "trie" (arbre préfixe)
         """
+        if stockage not in self.STOCKAGES:
+            raise ValueError(f"Stockage inconnu : {stockage} (attendu : {', '.join(self.STOCKAGES)})")
+        self._trie: Optional[TrieMots] = TrieMots() if stockage == "trie" else None
         self.mots = mots if mots else set()
         self.alphabet = alphabet if alphabet else self._calculer_alphabet()
+    
+    @classmethod
+    def depuis_trie(cls, trie: TrieMots, alphabet: Optional[Set[str]] = None) -> 'Langage':
+        """Construit un langage stocké en trie à partir d'un trie existant (non copié)."""
+        langage = cls(alphabet=alphabet, stockage="trie")
+        langage._trie = trie
+        if not alphabet:
+            langage.alphabet = langage._calculer_alphabet()
+        return langage
+    
+    @property
+    def stockage(self) -> str:
+        """Nom du stockage des mots : "ensemble" ou "trie"."""
+        return "ensemble" if self._trie is None else "trie"
+    
+    @property
+    def mots(self) -> Set[Mot]:
+        """Ensemble des mots du langage (recalculé à chaque accès pour un trie)."""
+        if self._trie is None:
+            return self._mots
+        return {Mot(contenu) for contenu in self._trie}
+    
+    @mots.setter
+    def mots(self, mots: Set[Mot]) -> None:
+        if self._trie is None:
+            self._mots = mots
+        else:
+            self._trie = TrieMots(mot.contenu for mot in mots)
+    
+    def trie(self) -> TrieMots:
+        """Retourne le trie des mots (celui du stockage, ou un trie construit pour l'occasion)."""
+        if self._trie is not None:
+            return self._trie
+        return TrieMots(mot.contenu for mot in self.mots)
         
     def _calculer_alphabet(self) -> Set[str]:
         """Calcule l'alphabet à partir des mots du langage."""
         alphabet = set()
+        if self._trie is not None:
+            # Les symboles sont les étiquettes des arcs du trie
+            pile = [self._trie.racine]
+            while pile:
+                noeud = pile.pop()
+                for symbole, fils in noeud.paires():
+                    alphabet.add(symbole)
+                    pile.append(fils)
+            return alphabet
         for mot in self.mots:
             alphabet.update(mot.alphabet())
         return alphabet
     
     def taille_du_langage(self) -> Union[int, float]:
         """Retourne la taille du langage (peut être infinie)."""
+        if self._trie is not None:
+            return len(self._trie)
         return len(self.mots)
     
+    def contient(self, mot: Union[Mot, str]) -> bool:
+        """Teste l'appartenance d'un mot au langage."""
+        contenu = mot.contenu if isinstance(mot, Mot) else mot
+        if self._trie is not None:
+            return contenu in self._trie
+        return Mot(contenu) in self.mots
+    
+    def mots_avec_prefixe(self, prefixe: Union[Mot, str]) -> Iterator[Mot]:
+        """Produit les mots du langage commençant par un préfixe donné."""
+        contenu = prefixe.contenu if isinstance(prefixe, Mot) else prefixe
+        if self._trie is not None:
+            return (Mot(mot) for mot in self._trie.mots_avec_prefixe(contenu))
+        return (mot for mot in self.mots if mot.contenu.startswith(contenu))
+    
+    def mots_avec_suffixe(self, suffixe: Union[Mot, str]) -> Iterator[Mot]:
+        """Produit les mots du langage finissant par un suffixe donné (trie inversé si stockage trie)."""
+        contenu = suffixe.contenu if isinstance(suffixe, Mot) else suffixe
+        if self._trie is not None:
+            return (Mot(mot) for mot in self._trie.mots_avec_suffixe(contenu))
+        return (mot for mot in self.mots if mot.contenu.endswith(contenu))
+    
+    def vers_aho_corasick(self) -> AhoCorasick:
+        """Compile les mots du langage (fini, mot vide exclu) en automate d'Aho-Corasick."""
+        if self._trie is not None:
+            return AhoCorasick(self._trie)
+        if self.taille_du_langage() == float('inf'):
+            raise ValueError("Le langage est infini : pas d'automate d'Aho-Corasick")
+        return AhoCorasick(mot.contenu for mot in self.enumerer())
+    
+    def __contains__(self, mot: Union[Mot, str]) -> bool:
+        """Surcharge de `in` pour l'appartenance."""
+        return self.contient(mot)
+    
+    def enumerer(self, longueur_max: Optional[int] = None,
+                 limite: Optional[int] = None) -> Iterator[Mot]:
+        """Produit les mots par ordre hiérarchique (longueur puis ordre lexicographique)."""
+        if self._trie is not None:
+            for produits, contenu in enumerate(self._trie.iterer_hierarchique()):
+                if (limite is not None and produits >= limite) or \
+                        (longueur_max is not None and len(contenu) > longueur_max):
+                    return
+                yield Mot(contenu)
+            return
+        mots = sorted(self.mots, key=lambda mot: (mot.longueur(), mot.contenu))
+        for produits, mot in enumerate(mots):
+            if limite is not None and produits >= limite:
+                return
+            if longueur_max is not None and mot.longueur() > longueur_max:
+                return
+            yield mot
+    
+    def _est_paresseux(self) -> bool:
+        """Indique si le langage est représenté par un automate plutôt que par ses mots."""
+        return False
+    
+    def _arbre(self) -> Noeud:
+        """Retourne l'arbre d'opérations décrivant le langage."""
+        if self._trie is not None:
+            return arbre_des_mots(self._trie)
+        return arbre_des_mots(mot.contenu for mot in self.mots)
+    
+    def _automate(self) -> Any:
+        """Retourne un automate reconnaissant le langage."""
+        return thompson(self._arbre(), self.alphabet)
+    
     def reunion_finie_des_langages(self, autres_langages: List['Langage']) -> 'Langage':
         """Réunion finie de langages."""
-        nouveaux_mots = set(self.mots)
         nouveau_alphabet = set(self.alphabet)
         for langage in autres_langages:
-            nouveaux_mots.update(langage.mots)
             nouveau_alphabet.update(langage.alphabet)
+        if any(langage._est_paresseux() for langage in [self] + autres_langages):
+            arbre = ("union", [langage._arbre() for langage in [self] + autres_langages])
+            return LangageReconnaissable(alphabet=nouveau_alphabet, automate=thompson(arbre, nouveau_alphabet))
+        if self._trie is not None:
+            # Une seule copie, dans laquelle chaque opérande est fusionné en place
+            trie = self._trie.copier()
+            for langage in autres_langages:
+                trie.fusionner(langage.trie())
+            return Langage.depuis_trie(trie, nouveau_alphabet)
+        nouveaux_mots = set(self.mots)
+        for langage in autres_langages:
+            nouveaux_mots.update(langage.mots)
         return Langage(nouveaux_mots, nouveau_alphabet)
     
     def concatenation_des_langages(self, autre_langage: 'Langage') -> 'Langage':
         """Concaténation de deux langages."""
         nouveaux_mots = set()
         nouveau_alphabet = self.alphabet.union(autre_langage.alphabet)
+        if self._est_paresseux() or autre_langage._est_paresseux():
+            automate = thompson(("concat", [self._arbre(), autre_langage._arbre()]), nouveau_alphabet)
+            return LangageReconnaissable(alphabet=nouveau_alphabet, automate=automate)
+        if self._trie is not None:
+            # Greffe du trie de droite sous chaque fin de mot de gauche
+            return Langage.depuis_trie(self._trie.concatener(autre_langage.trie()), nouveau_alphabet)
         for mot1 in self.mots:
             for mot2 in autre_langage.mots:
                 nouveaux_mots.add(mot1.concatenation(mot2))
         return Langage(nouveaux_mots, nouveau_alphabet)
     
     def iteration_sur_langages(self) -> 'Langage':
-        """Étoile de Kleene du langage."""
-        # Implémentation simplifiée (ne gère pas toutes les puissances)
-        nouveaux_mots = {Mot("", self.alphabet)}  # Mot vide
-        for mot in self.mots:
-            nouveaux_mots.add(mot)
-            nouveaux_mots.add(mot.concatenation(mot))  # Seulement le carré pour l'exemple
-        return Langage(nouveaux_mots, self.alphabet)
+        """Étoile de Kleene du langage, infinie donc représentée par un automate."""
+        automate = thompson(("etoile", self._arbre()), self.alphabet)
+        return LangageReconnaissable(alphabet=set(self.alphabet), automate=automate)
     
     def quotient_de_langages(self, autre_langage: 'Langage') -> 'Langage':
-        """Quotient de langages (simplifié)."""
-        # Implémentation simplifiée
+        """Quotient droit de langages : {u | il existe v dans autre_langage avec uv dans ce langage}."""
+        if self._trie is not None:
+            return Langage.depuis_trie(self._trie.quotient_droit(autre_langage.trie()), self.alphabet)
         nouveaux_mots = set()
         for mot1 in self.mots:
             for mot2 in autre_langage.mots:
                 if mot1.contenu.endswith(mot2.contenu):
-                    nouveaux_mots.add(Mot(mot1.contenu[:-len(mot2.contenu)], self.alphabet))
+                    reste = len(mot1.contenu) - len(mot2.contenu)
+                    nouveaux_mots.add(Mot(mot1.contenu[:reste], self.alphabet))
         return Langage(nouveaux_mots, self.alphabet)
     
     def lemme_darden(self) -> bool:
         """Application simplifiée du lemme d'Arden."""
         # Implémentation simplifiée pour l'exemple
-        mot_vide = Mot("", self.alphabet)
-        return mot_vide in self.mots
+        return self.contient("")
     
     def resolution_partielle_gauss(self, systeme_equations: List[str]) -> Dict[str, 'Langage']:
         """Résolution partielle par méthode de Gauss (simplifiée)."""
@@ -104,12 +251,12 @@ class Langage:
     
     def __sub__(self, autre: 'Langage') -> 'Langage':
         """Surcharge de - pour la différence."""
-        nouveaux_mots = self.mots - autre.mots
+        nouveaux_mots = {mot for mot in self.mots if not autre.contient(mot)}
         return Langage(nouveaux_mots, self.alphabet)
     
     def __and__(self, autre: 'Langage') -> 'Langage':
         """Surcharge de & pour l'intersection."""
-        nouveaux_mots = self.mots & autre.mots
+        nouveaux_mots = {mot for mot in self.mots if autre.contient(mot)}
         return Langage(nouveaux_mots, self.alphabet)
     
     def __or__(self, autre: 'Langage') -> 'Langage':
@@ -126,48 +273,168 @@ class LangageReconnaissable(Langage):
     """
     Langage reconnaissable (régulier).
     Hérite de Langage et implémente les propriétés de clôture.
+    Lorsqu'un automate est fourni, le langage est paresseux : ses mots ne
+    sont jamais matérialisés et `mots` reste vide.
     """
     
+    APERCU = 10
+    
     def __init__(self, mots: Optional[Set[Mot]] = None, alphabet: Optional[Set[str]] = None,
-                 automate: Optional[Any] = None) -> None:
+                 automate: Optional[Any] = None, stockage: str = "ensemble") -> None:
         """Initialise un langage reconnaissable."""
-        super().__init__(mots, alphabet)
+        super().__init__(mots, alphabet, stockage)
         self.automate = automate
+        if automate is not None and not alphabet:
+            self.alphabet = self.alphabet | (automate.alphabet - {EPSILON})
+    
+    def contient(self, mot: Union[Mot, str]) -> bool:
+        """Teste l'appartenance par l'automate s'il existe, sans énumérer de mots."""
+        if self.automate is None:
+            return super().contient(mot)
+        contenu = mot.contenu if isinstance(mot, Mot) else mot
+        return self.automate.reconnaitre_mot(contenu)
+    
+    def _est_paresseux(self) -> bool:
+        """Indique si le langage est représenté par un automate."""
+        return self.automate is not None
+    
+    def _arbre(self) -> Noeud:
+        """Retourne l'arbre d'opérations décrivant le langage."""
+        if self.automate is None:
+            return super()._arbre()
+        return ("automate", self.automate.explicite())
+    
+    def _automate(self) -> Any:
+        """Retourne l'automate du langage, construit depuis ses mots s'il n'en a pas."""
+        if self.automate is None:
+            return super()._automate()
+        return self.automate
+    
+    def taille_du_langage(self) -> Union[int, float]:
+        """Retourne la taille du langage, float('inf') si l'automate reconnaît un langage infini."""
+        if self.automate is None:
+            return super().taille_du_langage()
+        automate = self.automate.explicite()
+        if not automate.est_fini():
+            return float('inf')
+        # Un mot d'un langage fini est plus court que le nombre d'états utiles
+        compteur = automate.compteur_mots()
+        return compteur.compter(len(compteur.successeurs), jusqu_a=True)
+    
+    def nombre_de_mots(self, longueur: int, jusqu_a: bool = False, modulo: Optional[int] = None) -> int:
+        """Compte les mots de longueur donnée (ou au plus donnée si jusqu_a) sans les énumérer."""
+        if self.automate is None:
+            return sum(1 for mot in self.mots
+                       if mot.longueur() == longueur or (jusqu_a and mot.longueur() < longueur))
+        return self.automate.explicite().compter_mots(longueur, jusqu_a, modulo)
+    
+    def mot_aleatoire(self, longueur: int, generateur: Optional[random.Random] = None) -> Optional[Mot]:
+        """Tire uniformément un mot du langage de longueur donnée (None s'il n'en existe pas)."""
+        if self.automate is None:
+            candidats = sorted((mot for mot in self.mots if mot.longueur() == longueur),
+                               key=lambda mot: mot.contenu)
+            return (generateur or random).choice(candidats) if candidats else None
+        contenu = self.automate.explicite().echantillonner_mot(longueur, generateur)
+        return None if contenu is None else Mot(contenu, self.alphabet)
+    
+    def enumerer(self, longueur_max: Optional[int] = None,
+                 limite: Optional[int] = None) -> Iterator[Mot]:
+        """Produit les mots par ordre hiérarchique, par parcours en largeur de l'automate."""
+        if self.automate is None:
+            yield from super().enumerer(longueur_max, limite)
+            return
+        for contenu in self.automate.explicite().enumerer_mots(longueur_max, limite):
+            yield Mot(contenu, self.alphabet)
+    
+    def __str__(self) -> str:
+        """Représentation textuelle : seuls les premiers mots d'un langage paresseux sont listés."""
+        if self.automate is None:
+            return super().__str__()
+        apercu = [str(mot) for mot in self.enumerer(limite=self.APERCU + 1)]
+        suite = ", ..." if len(apercu) > self.APERCU else ""
+        mots_str = ", ".join(repr(mot) for mot in apercu[:self.APERCU])
+        return f"Langage(mots=[{mots_str}{suite}], alphabet={self.alphabet})"
     
     def complementation(self) -> 'LangageReconnaissable':
-        """Clôture par complémentation (simplifiée)."""
-        # Implémentation simplifiée
-        tous_mots_possibles = {Mot("a"), Mot("b")}  # Exemple simplifié
-        nouveaux_mots = tous_mots_possibles - self.mots
-        return LangageReconnaissable(nouveaux_mots, self.alphabet)
+        """Clôture par complémentation, par rapport à Σ* sur l'alphabet du langage."""
+        complement = self._automate().explicite().complement(self.alphabet)
+        return LangageReconnaissable(alphabet=set(self.alphabet), automate=complement)
     
     def union_ensembliste(self, autre: 'LangageReconnaissable') -> 'LangageReconnaissable':
-        """Clôture par union ensembliste."""
-        return LangageReconnaissable(self.mots.union(autre.mots), self.alphabet.union(autre.alphabet))
+        """Clôture par union ensembliste (produit paresseux d'automates si besoin)."""
+        alphabet = self.alphabet.union(autre.alphabet)
+        if not (self._est_paresseux() or autre._est_paresseux()):
+            return LangageReconnaissable(self.mots.union(autre.mots), alphabet)
+        produit = self._automate().union(autre._automate())
+        return LangageReconnaissable(alphabet=alphabet, automate=produit)
     
     def intersection_ensembliste(self, autre: 'LangageReconnaissable') -> 'LangageReconnaissable':
-        """Clôture par intersection ensembliste."""
-        return LangageReconnaissable(self.mots.intersection(autre.mots), self.alphabet)
+        """
+        Clôture par intersection ensembliste : les mots d'un langage fini sont
+        filtrés par l'autre, deux langages paresseux donnent un produit paresseux.
+        """
+        if not self._est_paresseux():
+            return LangageReconnaissable({mot for mot in self.mots if autre.contient(mot)}, self.alphabet)
+        if not autre._est_paresseux():
+            return LangageReconnaissable({mot for mot in autre.mots if self.contient(mot)}, self.alphabet)
+        produit = self._automate().intersection(autre._automate())
+        return LangageReconnaissable(alphabet=self.alphabet.union(autre.alphabet), automate=produit)
+    
+    def __add__(self, autre: 'Langage') -> 'LangageReconnaissable':
+        """Surcharge de + pour l'union."""
+        return self.union_ensembliste(autre)
+    
+    def __and__(self, autre: 'Langage') -> 'LangageReconnaissable':
+        """Surcharge de & pour l'intersection."""
+        return self.intersection_ensembliste(autre)
+    
+    def __sub__(self, autre: 'Langage') -> 'LangageReconnaissable':
+        """Surcharge de - pour la différence : intersection avec le complémentaire."""
+        if not self._est_paresseux():
+            return LangageReconnaissable(super().__sub__(autre).mots, self.alphabet)
+        alphabet = self.alphabet.union(autre.alphabet)
+        complement = autre._automate().explicite().complement(alphabet)
+        return self.intersection_ensembliste(LangageReconnaissable(alphabet=alphabet, automate=complement))
     
     def miroir(self) -> 'LangageReconnaissable':
         """Clôture par miroir."""
+        if self.automate is not None:
+            return LangageReconnaissable(alphabet=set(self.alphabet), automate=self.automate.explicite().miroir())
         nouveaux_mots = {Mot(mot.contenu[::-1], mot.alphabet()) for mot in self.mots}
         return LangageReconnaissable(nouveaux_mots, self.alphabet)
     
     def concatenation(self, autre: 'LangageReconnaissable') -> 'LangageReconnaissable':
         """Clôture par concaténation."""
-        return LangageReconnaissable(super().concatenation_des_langages(autre).mots, self.alphabet.union(autre.alphabet))
+        resultat = self.concatenation_des_langages(autre)
+        if isinstance(resultat, LangageReconnaissable):
+            return resultat
+        if resultat.stockage == "trie":
+            return LangageReconnaissable.depuis_trie(resultat.trie(), resultat.alphabet)
+        return LangageReconnaissable(resultat.mots, self.alphabet.union(autre.alphabet))
     
     def etoile(self) -> 'LangageReconnaissable':
         """Clôture par étoile (étoile de Kleene)."""
-        return LangageReconnaissable(super().iteration_sur_langages().mots, self.alphabet)
+        return self.iteration_sur_langages()
     
-    def regex_vers_langage(self, expression_reguliere: str) -> None:
-        """Construit le langage depuis une expression régulière (simplifié)."""
-        # Implémentation simplifiée
-        if expression_reguliere == "a*":
-            self.mots = {Mot(""), Mot("a"), Mot("aa")}  # Exemple simplifié
-            self.alphabet = {"a"}
+    MOTEURS_REGEX = ("thompson", "derivees")
+    
+    def regex_vers_langage(self, expression_reguliere: str, determiniser: bool = False,
+                           minimiser: bool = False, moteur: str = "thompson") -> None:
+        """
+        Construit le langage depuis une expression régulière. Avec le moteur
+        "thompson", l'expression est compilée en AFNS, éventuellement
+        déterminisé puis minimisé ; avec "derivees", l'appartenance est testée
+        par dérivées de Brzozowski et seuls les états atteints sont construits.
+        """
+        if moteur not in self.MOTEURS_REGEX:
+            raise ValueError(f"Moteur {moteur} inconnu (disponibles: {', '.join(self.MOTEURS_REGEX)})")
+        if moteur == "derivees":
+            self.automate = AutomateDerivees(expression_reguliere)
+        else:
+            self.automate = compiler_regex(expression_reguliere, determiniser=determiniser,
+                                           minimiser=minimiser)
+        self.alphabet = set(self.automate.alphabet) - {EPSILON}
+        self.mots = set()
     
     def langage_vers_regex(self) -> str:
         """Convertit le langage en expression régulière (simplifié)."""
@@ -187,4 +454,12 @@ class LangageReconnaissable(Langage):
     
     def lemme_pompage_application(self) -> bool:
         """Application du lemme de pompage au langage (simplifié)."""
-        return True  # Exemple
\ No newline at end of file
+        return True  # Exemple
+
+
+# Opérations chronométrées lorsque l'instrumentation est active
+INSTRUMENTATION.chronometrer(Langage, "contient", "reunion_finie_des_langages", "concatenation_des_langages",
+                             "iteration_sur_langages", "quotient_de_langages", "taille_du_langage")
+INSTRUMENTATION.chronometrer(LangageReconnaissable, "contient", "taille_du_langage", "nombre_de_mots",
+                             "complementation", "union_ensembliste", "intersection_ensembliste",
+                             "miroir", "regex_vers_langage")
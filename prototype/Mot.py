@@ -3,15 +3,41 @@ Module implémentant la classe Mot et ses opérations.
 Un mot est une séquence de symboles sur un alphabet donné.
 """
 
-from typing import Set, List, Optional, Dict, Any, Tuple
+from array import array
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet, Iterable, Iterator
 from abc import ABC, abstractmethod
 
+# Alphabets internés : tous les mots sur un même alphabet partagent un seul frozenset.
+# Un frozenset n'accepte pas de référence faible : la table est bornée et
+# oublie ses plus anciennes entrées (le partage n'est qu'une économie).
+_ALPHABETS: Dict[FrozenSet[str], FrozenSet[str]] = {}
+TAILLE_MAX_ALPHABETS = 4096
+
+
+def interner_alphabet(symboles: Iterable[str]) -> FrozenSet[str]:
+    """Retourne le frozenset partagé représentant cet alphabet."""
+    alphabet = frozenset(symboles)
+    interne = _ALPHABETS.get(alphabet)
+    if interne is not None:
+        return interne
+    if len(_ALPHABETS) >= TAILLE_MAX_ALPHABETS:
+        del _ALPHABETS[next(iter(_ALPHABETS))]
+    _ALPHABETS[alphabet] = alphabet
+    return alphabet
+
+
 class Mot:
     """
     Classe représentant un mot sur un alphabet.
+    Un mot est une valeur immuable : son hachage est calculé une fois et son
+    alphabet est un frozenset interné, partagé entre les mots. La fonction
+    préfixe et l'ensemble des périodes sont calculés au premier besoin puis
+    conservés.
     """
     
-    def __init__(self, contenu: str = "", alphabet: Optional[Set[str]] = None) -> None:
+    __slots__ = ("contenu", "alphabet_mot", "_hash", "_prefixe", "_periodes")
+    
+    def __init__(self, contenu: str = "", alphabet: Optional[Iterable[str]] = None) -> None:
         """
         Initialise un mot.
         
@@ -19,97 +45,293 @@ class Mot:
             contenu: Chaîne de caractères représentant le mot
             alphabet: Alphabet du mot (peut être None si non spécifié)
         """
-        self.contenu = contenu
-        self.alphabet_mot = alphabet if alphabet else set(contenu)
+        object.__setattr__(self, "contenu", contenu)
+        object.__setattr__(self, "alphabet_mot", interner_alphabet(alphabet if alphabet else contenu))
+        object.__setattr__(self, "_hash", hash(contenu))
+        object.__setattr__(self, "_prefixe", None)
+        object.__setattr__(self, "_periodes", None)
+    
+    @classmethod
+    def _nouveau(cls, contenu: str, alphabet: FrozenSet[str]) -> 'Mot':
+        """Crée un mot sur un alphabet déjà interné, sans le ré-interner."""
+        mot = cls.__new__(cls)
+        object.__setattr__(mot, "contenu", contenu)
+        object.__setattr__(mot, "alphabet_mot", alphabet)
+        object.__setattr__(mot, "_hash", hash(contenu))
+        object.__setattr__(mot, "_prefixe", None)
+        object.__setattr__(mot, "_periodes", None)
+        return mot
+    
+    def __setattr__(self, nom: str, valeur: Any) -> None:
+        raise AttributeError("Un Mot est immuable")
+    
+    def __delattr__(self, nom: str) -> None:
+        raise AttributeError("Un Mot est immuable")
+    
+    def __reduce__(self) -> Tuple[Any, Tuple[str, FrozenSet[str]]]:
+        """Sérialisation (pickle, copy) par reconstruction."""
+        return (Mot, (self.contenu, self.alphabet_mot))
         
     def longueur(self) -> int:
         """Retourne la longueur du mot."""
         return len(self.contenu)
     
     def adjonction_occurrence_droite(self, symbole: str) -> 'Mot':
-        """Ajoute une occurrence d'un symbole à droite."""
-        if symbole not in self.alphabet_mot:
-            self.alphabet_mot.add(symbole)
-        return Mot(self.contenu + symbole, self.alphabet_mot)
+        """Ajoute une occurrence d'un symbole à droite (l'alphabet d'origine n'est pas modifié)."""
+        return Mot(self.contenu + symbole, self.alphabet_mot | {symbole})
     
     def adjonction_occurrence_gauche(self, symbole: str) -> 'Mot':
-        """Ajoute une occurrence d'un symbole à gauche."""
-        if symbole not in self.alphabet_mot:
-            self.alphabet_mot.add(symbole)
-        return Mot(symbole + self.contenu, self.alphabet_mot)
+        """Ajoute une occurrence d'un symbole à gauche (l'alphabet d'origine n'est pas modifié)."""
+        return Mot(symbole + self.contenu, self.alphabet_mot | {symbole})
     
     def concatenation(self, autre_mot: 'Mot') -> 'Mot':
         """Concatène avec un autre mot."""
+        if autre_mot.alphabet_mot is self.alphabet_mot:
+            return Mot._nouveau(self.contenu + autre_mot.contenu, self.alphabet_mot)
         nouvel_alphabet = self.alphabet_mot.union(autre_mot.alphabet())
         return Mot(self.contenu + autre_mot.contenu, nouvel_alphabet)
     
     def liste_sous_mots(self) -> List['Mot']:
         """Retourne la liste de tous les sous-mots."""
-        sous_mots = [Mot("", self.alphabet_mot)]
+        return list(self.iterer_facteurs())
+    
+    def iterer_facteurs(self, distincts: bool = False) -> Iterator['Mot']:
+        """
+        Produit paresseusement les facteurs du mot, mot vide compris : dans
+        l'ordre de liste_sous_mots, ou sans doublon si `distincts` (parcours
+        de l'automate des suffixes).
+        """
+        if distincts:
+            for contenu in self.index_facteurs().iterer_facteurs():
+                yield Mot._nouveau(contenu, self.alphabet_mot)
+            return
+        yield Mot._nouveau("", self.alphabet_mot)
         n = len(self.contenu)
         for i in range(n):
             for j in range(i + 1, n + 1):
-                sous_mots.append(Mot(self.contenu[i:j], self.alphabet_mot))
-        return sous_mots
+                yield Mot._nouveau(self.contenu[i:j], self.alphabet_mot)
+    
+    def index_facteurs(self) -> 'IndexFacteurs':
+        """Construit l'index des facteurs (automate des suffixes) du mot, en O(n)."""
+        return IndexFacteurs(self.contenu)
     
     def facteur_gauche(self, longueur: int) -> 'Mot':
         """Retourne le facteur gauche de longueur donnée."""
         if longueur > len(self.contenu):
-            return Mot(self.contenu, self.alphabet_mot)
-        return Mot(self.contenu[:longueur], self.alphabet_mot)
+            return self
+        return Mot._nouveau(self.contenu[:longueur], self.alphabet_mot)
     
     def facteur_droit(self, longueur: int) -> 'Mot':
         """Retourne le facteur droit de longueur donnée."""
         if longueur > len(self.contenu):
-            return Mot(self.contenu, self.alphabet_mot)
-        return Mot(self.contenu[-longueur:], self.alphabet_mot)
+            return self
+        return Mot._nouveau(self.contenu[-longueur:], self.alphabet_mot)
+    
+    def fonction_prefixe(self) -> array:
+        """
+        Retourne la fonction préfixe (longueur du plus long bord de chaque
+        préfixe), calculée une fois en O(n).
+        """
+        if self._prefixe is None:
+            contenu = self.contenu
+            prefixe = array('i', [0]) * len(contenu)
+            for i in range(1, len(contenu)):
+                bord = prefixe[i - 1]
+                while bord and contenu[i] != contenu[bord]:
+                    bord = prefixe[bord - 1]
+                if contenu[i] == contenu[bord]:
+                    bord += 1
+                prefixe[i] = bord
+            object.__setattr__(self, "_prefixe", prefixe)
+        return self._prefixe
+    
+    def _ensemble_periodes(self) -> FrozenSet[int]:
+        """Périodes du mot : n - b pour chaque bord b du mot entier (mémorisées)."""
+        if self._periodes is None:
+            n = len(self.contenu)
+            periodes = set()
+            if n:
+                prefixe = self.fonction_prefixe()
+                bord = prefixe[n - 1]
+                while bord:
+                    periodes.add(n - bord)
+                    bord = prefixe[bord - 1]
+                periodes.add(n)
+            object.__setattr__(self, "_periodes", frozenset(periodes))
+        return self._periodes
+    
+    def periodes(self) -> List[int]:
+        """Retourne toutes les périodes du mot, par ordre croissant."""
+        return sorted(self._ensemble_periodes())
+    
+    def plus_petite_periode(self) -> int:
+        """Retourne la plus petite période du mot (0 pour le mot vide)."""
+        n = len(self.contenu)
+        return n - self.fonction_prefixe()[n - 1] if n else 0
+    
+    def racine_primitive(self) -> 'Mot':
+        """Retourne le mot primitif u tel que le mot soit une puissance de u."""
+        n = len(self.contenu)
+        periode = self.plus_petite_periode()
+        if n and n % periode == 0:
+            return Mot._nouveau(self.contenu[:periode], self.alphabet_mot)
+        return self
+    
+    def exposant(self) -> int:
+        """Retourne k tel que le mot soit la puissance k-ième de sa racine primitive."""
+        n = len(self.contenu)
+        return n // self.racine_primitive().longueur() if n else 1
     
     def est_periodique(self, periode: int) -> bool:
         """Vérifie si le mot est périodique avec la période donnée."""
-        if periode <= 0 or periode > len(self.contenu):
-            return False
-        for i in range(len(self.contenu) - periode):
-            if self.contenu[i] != self.contenu[i + periode]:
-                return False
-        return True
+        return periode in self._ensemble_periodes()
     
     def est_primitif(self) -> bool:
         """Vérifie si le mot est primitif (non puissance d'un autre mot)."""
-        n = len(self.contenu)
-        for p in range(1, n // 2 + 1):
-            if n % p == 0 and self.est_periodique(p):
-                return False
-        return True
+        return self.exposant() == 1
     
-    def alphabet(self) -> Set[str]:
-        """Retourne l'alphabet du mot."""
+    def alphabet(self) -> FrozenSet[str]:
+        """Retourne l'alphabet du mot (partagé, immuable)."""
         return self.alphabet_mot
     
     def est_reconnaissable(self, automate: Any) -> bool:
-        """Vérifie si le mot est reconnaissable par un automate (à implémenter)."""
-        # Cette méthode nécessite une implémentation d'automate
-        return False
+        """Vérifie si le mot est reconnu par un automate."""
+        return automate.reconnaitre_mot(self.contenu)
     
     def sont_equivalents(self, autre_mot: 'Mot', automate: Any) -> bool:
-        """Vérifie si deux mots sont équivalents relativement à un automate."""
-        # Cette méthode nécessite une implémentation d'automate
-        return False
+        """
+        Vérifie si deux mots sont équivalents au sens de Nerode pour le langage
+        de l'automate : pour tout z, self·z et autre_mot·z sont acceptés ou
+        rejetés ensemble (résiduels égaux).
+        """
+        return automate.mots_equivalents(self.contenu, autre_mot.contenu)[0]
     
     def __str__(self) -> str:
         """Représentation textuelle du mot."""
         return self.contenu
     
-    def __eq__(self, autre: 'Mot') -> bool:
+    def __eq__(self, autre: object) -> bool:
         """Égalité entre mots."""
+        if not isinstance(autre, Mot):
+            return NotImplemented
         return self.contenu == autre.contenu
     
     def __add__(self, autre: 'Mot') -> 'Mot':
         """Surcharge de + pour la concaténation."""
         return self.concatenation(autre)
     def __hash__(self):
-        """Permet d'utiliser Mot comme clé de dictionnaire ou dans des sets."""
-        return hash(self.contenu)
+        """Permet d'utiliser Mot comme clé de dictionnaire ou dans des sets (hachage mémorisé)."""
+        return self._hash
 
     def __repr__(self):
         """Représentation officielle pour le débogage."""
-        return f"Mot('{self.contenu}')"
\ No newline at end of file
+        return f"Mot('{self.contenu}')"
+
+
+class IndexFacteurs:
+    """
+    Index des facteurs d'un mot : automate des suffixes, construit en ligne en
+    temps et place O(n). Il répond sans énumération aux questions « w est-il
+    facteur ? », « combien de facteurs distincts ? » et « où w apparaît-il ? ».
+    """
+    
+    def __init__(self, contenu: str) -> None:
+        """
+        Construit l'automate des suffixes.
+        
+        Args:
+            contenu: Mot à indexer
+        """
+        self.contenu = contenu
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.lien: List[int] = [-1]
+        self.longueur: List[int] = [0]
+        # Position de fin de la première occurrence de chaque état
+        self.premiere_fin: List[int] = [-1]
+        self.est_clone: List[bool] = [False]
+        self._enfants: Optional[List[List[int]]] = None
+        
+        dernier = 0
+        for position, symbole in enumerate(contenu):
+            courant = self._nouvel_etat(self.longueur[dernier] + 1, position, {}, False)
+            p = dernier
+            while p != -1 and symbole not in self.transitions[p]:
+                self.transitions[p][symbole] = courant
+                p = self.lien[p]
+            if p == -1:
+                self.lien[courant] = 0
+            else:
+                q = self.transitions[p][symbole]
+                if self.longueur[p] + 1 == self.longueur[q]:
+                    self.lien[courant] = q
+                else:
+                    clone = self._nouvel_etat(self.longueur[p] + 1, self.premiere_fin[q],
+                                              dict(self.transitions[q]), True)
+                    self.lien[clone] = self.lien[q]
+                    while p != -1 and self.transitions[p].get(symbole) == q:
+                        self.transitions[p][symbole] = clone
+                        p = self.lien[p]
+                    self.lien[q] = self.lien[courant] = clone
+            dernier = courant
+    
+    def _nouvel_etat(self, longueur: int, premiere_fin: int, transitions: Dict[str, int], clone: bool) -> int:
+        self.transitions.append(transitions)
+        self.lien.append(-1)
+        self.longueur.append(longueur)
+        self.premiere_fin.append(premiere_fin)
+        self.est_clone.append(clone)
+        return len(self.transitions) - 1
+    
+    def _etat_de(self, facteur: str) -> Optional[int]:
+        """Retourne l'état atteint en lisant le facteur, None s'il n'en est pas un."""
+        etat = 0
+        for symbole in facteur:
+            etat = self.transitions[etat].get(symbole)
+            if etat is None:
+                return None
+        return etat
+    
+    def contient(self, facteur: str) -> bool:
+        """Indique si `facteur` est un facteur du mot indexé."""
+        return self._etat_de(facteur) is not None
+    
+    def nombre_facteurs_distincts(self) -> int:
+        """Retourne le nombre de facteurs distincts, mot vide compris."""
+        return 1 + sum(self.longueur[etat] - self.longueur[self.lien[etat]]
+                       for etat in range(1, len(self.longueur)))
+    
+    def occurrences(self, facteur: str, triees: bool = True) -> List[int]:
+        """
+        Retourne les positions de début de toutes les occurrences : en
+        O(|facteur| + occ) dans l'ordre du parcours, plus O(occ log occ) pour
+        les trier si `triees`.
+        """
+        etat = self._etat_de(facteur)
+        if etat is None:
+            return []
+        if not facteur:
+            return list(range(len(self.contenu) + 1))
+        if self._enfants is None:
+            self._enfants = [[] for _ in self.lien]
+            for fils in range(1, len(self.lien)):
+                self._enfants[self.lien[fils]].append(fils)
+        # Les fins d'occurrence sont celles des états non clonés du sous-arbre des liens suffixes
+        positions = []
+        pile = [etat]
+        while pile:
+            courant = pile.pop()
+            if not self.est_clone[courant]:
+                positions.append(self.premiere_fin[courant] - len(facteur) + 1)
+            pile.extend(self._enfants[courant])
+        if triees:
+            positions.sort()
+        return positions
+    
+    def iterer_facteurs(self) -> Iterator[str]:
+        """Produit chaque facteur distinct une seule fois (mot vide compris), par ordre lexicographique."""
+        pile = [(0, "")]
+        while pile:
+            etat, facteur = pile.pop()
+            yield facteur
+            for symbole, cible in sorted(self.transitions[etat].items(), reverse=True):
+                pile.append((cible, facteur + symbole))
@@ -0,0 +1,245 @@
+"""
+Module implémentant la compilation des expressions régulières en automates.
+L'expression est analysée en un arbre syntaxique, puis traduite en AFNS par
+la construction de Thompson (taille et temps linéaires).
+
+Syntaxe reconnue : union `|`, concaténation, étoile `*`, `+`, `?`,
+parenthèses, classes `[abc]` / `[a-z]`, mot vide `ε` ou `()`, et `\\`
+pour utiliser littéralement un caractère spécial.
+"""
+
+from typing import Iterable, List, Optional, Set, Tuple
+
+from Automate import AFNS, Automate
+
+EPSILON = 'ε'
+SPECIAUX = set('|*+?()[]\\') | {EPSILON}
+
+# Nœuds de l'arbre syntaxique (tuples) :
+#   ("neant",)                  langage vide
+#   ("vide",)                   mot vide
+#   ("symboles", frozenset)     un symbole parmi un ensemble (littéral ou classe)
+#   ("union", [noeuds])         union n-aire
+#   ("concat", [noeuds])        concaténation n-aire
+#   ("etoile" | "plus" | "option", noeud)
+#   ("automate", automate)      langage d'un automate existant (arbres d'opérations)
+Noeud = Tuple
+
+
+class AnalyseurRegex:
+    """Analyseur descendant (une seule passe) d'expressions régulières."""
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.position = 0
+
+    def _erreur(self, message: str) -> ValueError:
+        return ValueError(f"Expression régulière invalide en position {self.position}: {message}")
+
+    def _courant(self) -> Optional[str]:
+        if self.position < len(self.expression):
+            return self.expression[self.position]
+        return None
+
+    def analyser(self) -> Noeud:
+        """Retourne l'arbre syntaxique de toute l'expression."""
+        noeud = self._union()
+        if self.position != len(self.expression):
+            raise self._erreur(f"'{self._courant()}' inattendu")
+        return noeud
+
+    def _union(self) -> Noeud:
+        branches = [self._concat()]
+        while self._courant() == '|':
+            self.position += 1
+            branches.append(self._concat())
+        return branches[0] if len(branches) == 1 else ("union", branches)
+
+    def _concat(self) -> Noeud:
+        facteurs = []
+        while self._courant() is not None and self._courant() not in '|)':
+            facteurs.append(self._repetition())
+        if not facteurs:
+            return ("vide",)
+        return facteurs[0] if len(facteurs) == 1 else ("concat", facteurs)
+
+    def _repetition(self) -> Noeud:
+        noeud = self._atome()
+        operateurs = {'*': "etoile", '+': "plus", '?': "option"}
+        while self._courant() is not None and self._courant() in operateurs:
+            noeud = (operateurs[self._courant()], noeud)
+            self.position += 1
+        return noeud
+
+    def _atome(self) -> Noeud:
+        caractere = self._courant()
+        if caractere == '(':
+            self.position += 1
+            noeud = self._union()
+            if self._courant() != ')':
+                raise self._erreur("')' attendue")
+            self.position += 1
+            return noeud
+        if caractere == '[':
+            return self._classe()
+        if caractere == EPSILON:
+            self.position += 1
+            return ("vide",)
+        if caractere in ('*', '+', '?'):
+            raise self._erreur(f"'{caractere}' sans opérande")
+        if caractere == ']':
+            raise self._erreur("']' sans '['")
+        return ("symboles", frozenset(self._litteral()))
+
+    def _litteral(self) -> str:
+        caractere = self._courant()
+        if caractere == '\\':
+            self.position += 1
+            caractere = self._courant()
+            if caractere is None:
+                raise self._erreur("'\\' en fin d'expression")
+        self.position += 1
+        return caractere
+
+    def _classe(self) -> Noeud:
+        self.position += 1
+        symboles: Set[str] = set()
+        while self._courant() != ']':
+            if self._courant() is None:
+                raise self._erreur("']' attendu")
+            debut = self._litteral()
+            if self._courant() == '-' and self.position + 1 < len(self.expression) \
+                    and self.expression[self.position + 1] != ']':
+                self.position += 1
+                fin = self._litteral()
+                if ord(fin) < ord(debut):
+                    raise self._erreur(f"intervalle {debut}-{fin} vide")
+                symboles.update(chr(code) for code in range(ord(debut), ord(fin) + 1))
+            else:
+                symboles.add(debut)
+        self.position += 1
+        if not symboles:
+            raise self._erreur("classe vide")
+        return ("symboles", frozenset(symboles))
+
+
+def analyser_regex(expression: str) -> Noeud:
+    """Retourne l'arbre syntaxique d'une expression régulière."""
+    return AnalyseurRegex(expression).analyser()
+
+
+def symboles_regex(noeud: Noeud) -> Set[str]:
+    """Retourne l'ensemble des symboles utilisés par un arbre syntaxique."""
+    symboles: Set[str] = set()
+    pile = [noeud]
+    while pile:
+        courant = pile.pop()
+        if courant[0] == "symboles":
+            symboles |= courant[1]
+        elif courant[0] == "automate":
+            symboles |= courant[1].alphabet - {EPSILON}
+        elif courant[0] in ("union", "concat"):
+            pile.extend(courant[1])
+        elif courant[0] not in ("vide", "neant"):
+            pile.append(courant[1])
+    return symboles
+
+
+def arbre_des_mots(mots: Iterable[str]) -> Noeud:
+    """Retourne l'arbre de l'union finie des mots donnés."""
+    branches = []
+    for mot in mots:
+        if not mot:
+            branches.append(("vide",))
+        elif len(mot) == 1:
+            branches.append(("symboles", frozenset(mot)))
+        else:
+            branches.append(("concat", [("symboles", frozenset(symbole)) for symbole in mot]))
+    if not branches:
+        return ("neant",)
+    return branches[0] if len(branches) == 1 else ("union", branches)
+
+
+def thompson(noeud: Noeud, alphabet: Optional[Set[str]] = None) -> AFNS:
+    """
+    Construit l'AFNS de Thompson d'un arbre syntaxique : chaque fragment a
+    un unique état d'entrée et un unique état de sortie.
+    """
+    aretes: List[Tuple[int, str, int]] = []
+    compteur = [0]
+
+    def nouvel_etat() -> int:
+        compteur[0] += 1
+        return compteur[0] - 1
+
+    def construire(courant: Noeud) -> Tuple[int, int]:
+        genre = courant[0]
+        if genre == "neant":
+            entree, sortie = nouvel_etat(), nouvel_etat()
+        elif genre == "vide":
+            entree, sortie = nouvel_etat(), nouvel_etat()
+            aretes.append((entree, EPSILON, sortie))
+        elif genre == "automate":
+            # Copie de l'automate, ses états finaux menant au nouvel état de sortie
+            automate = courant[1]
+            numeros = {etat: nouvel_etat() for etat in sorted(automate.etats)}
+            for source, ligne in automate.transitions.items():
+                for symbole, cibles in ligne.items():
+                    for cible in cibles:
+                        aretes.append((numeros[source], symbole, numeros[cible]))
+            entree, sortie = numeros[automate.etat_initial], nouvel_etat()
+            for etat in automate.etats_finaux:
+                aretes.append((numeros[etat], EPSILON, sortie))
+        elif genre == "symboles":
+            entree, sortie = nouvel_etat(), nouvel_etat()
+            for symbole in sorted(courant[1]):
+                aretes.append((entree, symbole, sortie))
+        elif genre == "concat":
+            fragments = [construire(facteur) for facteur in courant[1]]
+            for (_, sortie_gauche), (entree_droite, _) in zip(fragments, fragments[1:]):
+                aretes.append((sortie_gauche, EPSILON, entree_droite))
+            entree, sortie = fragments[0][0], fragments[-1][1]
+        elif genre == "union":
+            entree, sortie = nouvel_etat(), nouvel_etat()
+            for branche in courant[1]:
+                debut, fin = construire(branche)
+                aretes.append((entree, EPSILON, debut))
+                aretes.append((fin, EPSILON, sortie))
+        else:
+            debut, fin = construire(courant[1])
+            entree, sortie = nouvel_etat(), nouvel_etat()
+            aretes.append((entree, EPSILON, debut))
+            aretes.append((fin, EPSILON, sortie))
+            if genre in ("etoile", "plus"):
+                aretes.append((fin, EPSILON, debut))
+            if genre in ("etoile", "option"):
+                aretes.append((entree, EPSILON, sortie))
+        return entree, sortie
+
+    entree, sortie = construire(noeud)
+    symboles = symboles_regex(noeud) | set(alphabet or ())
+    symboles.discard(EPSILON)
+    afns = AFNS(symboles, {f"q{i}" for i in range(compteur[0])}, f"q{entree}", {f"q{sortie}"})
+    for source, symbole, cible in aretes:
+        afns.ajouter_transition(f"q{source}", symbole, f"q{cible}")
+    return afns
+
+
+def compiler_regex(expression: str, alphabet: Optional[Set[str]] = None,
+                   determiniser: bool = False, minimiser: bool = False) -> Automate:
+    """
+    Compile une expression régulière en AFNS (Thompson), éventuellement
+    déterminisé puis minimisé.
+
+    Args:
+        expression: Expression régulière
+        alphabet: Symboles à ajouter à ceux de l'expression
+        determiniser: Retourne l'AFDC obtenu par construction des sous-ensembles
+        minimiser: Retourne l'AFDC minimal (implique determiniser)
+    """
+    automate = thompson(analyser_regex(expression), alphabet)
+    if determiniser or minimiser:
+        automate = automate.determiniser()
+    if minimiser:
+        automate = automate.minimiser()
+    return automate
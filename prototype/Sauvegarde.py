@@ -0,0 +1,153 @@
+"""
+Module de sauvegarde binaire des automates compilés.
+Un fichier contient un en-tête versionné, les tables des noms d'états et de
+symboles, un octet par état final puis la table de transitions en entiers
+32 bits petit-boutistes. Au chargement, la table est lue sans copie à
+travers une projection mémoire (mmap) et une vue `memoryview`.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Any, BinaryIO, List
+
+from Automate import AFDC, Automate, TableTransitions
+
+MAGIQUE = b"AUTM"
+VERSION = 1
+SEPARATEUR = "\x00"
+
+# Magique, version, réservé, nb_etats, nb_symboles, initial, octets des noms d'états, octets des symboles
+ENTETE = struct.Struct("<4sHHIIIII")
+
+# La table peut être lue telle quelle si les entiers natifs sont des int32 petit-boutistes
+_ZERO_COPIE = sys.byteorder == "little" and array('i').itemsize == 4
+
+
+def _encoder_noms(noms: List[str], nature: str) -> bytes:
+    """Encode une liste de noms en UTF-8, séparés par un octet nul."""
+    for nom in noms:
+        if SEPARATEUR in nom:
+            raise ValueError(f"Nom d'{nature} invalide (caractère nul) : {nom!r}")
+    return SEPARATEUR.join(noms).encode("utf-8")
+
+
+def _decoder_noms(octets: Any, nombre: int, nature: str) -> List[str]:
+    """Décode une table de noms et vérifie leur nombre."""
+    noms = str(octets, "utf-8").split(SEPARATEUR) if nombre else []
+    if len(noms) != nombre:
+        raise ValueError(f"Table des {nature}s corrompue : {len(noms)} noms au lieu de {nombre}")
+    return noms
+
+
+def _alignement(position: int) -> int:
+    """Nombre d'octets de bourrage pour aligner la table sur 4 octets."""
+    return -position % 4
+
+
+def ecrire_table(table: TableTransitions, fichier: BinaryIO) -> None:
+    """Écrit une table compilée dans un fichier binaire ouvert en écriture."""
+    etats = _encoder_noms(table.etats, "état")
+    symboles = _encoder_noms(table.symboles, "symbole")
+    fichier.write(ENTETE.pack(MAGIQUE, VERSION, 0, len(table.etats), table.nb_symboles,
+                              table.initial, len(etats), len(symboles)))
+    fichier.write(etats)
+    fichier.write(symboles)
+    fichier.write(bytes(table.finaux))
+    position = ENTETE.size + len(etats) + len(symboles) + len(table.finaux)
+    fichier.write(bytes(_alignement(position)))
+    transitions = array('i', table.table)
+    if sys.byteorder != "little":
+        transitions.byteswap()
+    fichier.write(transitions.tobytes())
+
+
+def lire_table(tampon: Any) -> TableTransitions:
+    """
+    Reconstruit une table compilée depuis un tampon (bytes, mmap, ...). La
+    table de transitions et les états finaux restent des vues sur le tampon.
+    """
+    vue = memoryview(tampon)
+    if len(vue) < ENTETE.size:
+        raise ValueError("Fichier d'automate tronqué (en-tête incomplet)")
+    magique, version, _, nb_etats, nb_symboles, initial, taille_etats, taille_symboles = \
+        ENTETE.unpack_from(vue)
+    if magique != MAGIQUE:
+        raise ValueError("Ce fichier n'est pas un automate sauvegardé")
+    if version != VERSION:
+        raise ValueError(f"Version de format non prise en charge : {version}")
+
+    position = ENTETE.size
+    etats = _decoder_noms(vue[position:position + taille_etats], nb_etats, "état")
+    position += taille_etats
+    symboles = _decoder_noms(vue[position:position + taille_symboles], nb_symboles, "symbole")
+    position += taille_symboles
+    finaux = vue[position:position + nb_etats + 1]
+    position += nb_etats + 1
+    position += _alignement(position)
+
+    taille_table = (nb_etats + 1) * nb_symboles
+    if len(vue) != position + 4 * taille_table:
+        raise ValueError("Fichier d'automate tronqué ou de taille inattendue")
+    if initial >= nb_etats:
+        raise ValueError(f"État initial hors limites : {initial}")
+    if bytes(finaux).translate(None, b"\x00\x01"):
+        raise ValueError("Table des états finaux corrompue : octets autres que 0 ou 1")
+    if _ZERO_COPIE:
+        transitions = vue[position:].cast('i')
+    else:
+        transitions = array('i')
+        transitions.frombytes(vue[position:])
+        if sys.byteorder != "little":
+            transitions.byteswap()
+    # Le puits (numéro nb_etats) est la plus grande cible admise
+    if taille_table and (min(transitions) < 0 or max(transitions) > nb_etats):
+        raise ValueError(f"Table de transitions corrompue : cible hors de [0, {nb_etats}]")
+    return TableTransitions(etats, symboles, transitions, initial, finaux)
+
+
+def sauver_automate(automate: Automate, chemin: str) -> TableTransitions:
+    """
+    Sauvegarde un automate sous forme compilée ; un automate non déterministe
+    est d'abord déterminisé. Retourne la table écrite.
+
+    Le fichier est écrit à côté de `chemin` puis renommé : un automate chargé
+    depuis `chemin` (projeté en mémoire) peut ainsi y être sauvegardé sans
+    que sa projection soit tronquée pendant l'écriture.
+    """
+    automate = automate.explicite()
+    deterministe = automate if isinstance(automate, AFDC) else automate.determiniser()
+    table = deterministe.compiler()
+    descripteur, temporaire = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(chemin)),
+                                               prefix=".automate-", suffix=".tmp")
+    try:
+        with os.fdopen(descripteur, "wb") as fichier:
+            ecrire_table(table, fichier)
+        # mkstemp crée le fichier en 0600 : on rend les droits usuels, masqués par l'umask
+        masque = os.umask(0)
+        os.umask(masque)
+        os.chmod(temporaire, 0o666 & ~masque)
+        os.replace(temporaire, chemin)
+    except BaseException:
+        os.unlink(temporaire)
+        raise
+    return table
+
+
+def charger_automate(chemin: str, utiliser_mmap: bool = True) -> AFDC:
+    """
+    Charge un automate sauvegardé. Avec `utiliser_mmap`, le fichier est
+    projeté en mémoire et la table de transitions n'est jamais copiée : les
+    pages sont lues à la demande par le système.
+    """
+    with open(chemin, "rb") as fichier:
+        if utiliser_mmap and fichier.seek(0, 2) > 0:
+            # La projection survit à la fermeture du fichier tant que la table la référence
+            tampon: Any = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            fichier.seek(0)
+            tampon = fichier.read()
+    return AFDC.depuis_table(lire_table(tampon))
@@ -0,0 +1,228 @@
+"""
+Module implémentant un arbre préfixe (trie) de mots.
+Il sert de stockage compact aux langages finis : les préfixes communs ne
+sont stockés qu'une fois, et un trie des mots retournés répond aux
+requêtes par suffixe et au quotient droit.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class NoeudTrie:
+    """
+    Nœud d'un trie : fils indexés par symbole et marque de fin de mot. Un
+    nœud à fils unique le garde dans un couple (symbole, fils) plutôt que
+    dans un dictionnaire : les branches propres à un seul mot, majoritaires
+    dans un dictionnaire peu dense, coûtent ainsi bien moins de mémoire.
+    """
+
+    __slots__ = ("enfants", "terminal")
+
+    def __init__(self) -> None:
+        self.enfants: Union[None, Tuple[str, 'NoeudTrie'], Dict[str, 'NoeudTrie']] = None
+        self.terminal = False
+
+    def fils(self, symbole: str) -> Optional['NoeudTrie']:
+        """Retourne le fils par un symbole, None s'il n'existe pas."""
+        enfants = self.enfants
+        if type(enfants) is tuple:
+            return enfants[1] if enfants[0] == symbole else None
+        return enfants.get(symbole) if enfants else None
+
+    def fils_ou_nouveau(self, symbole: str) -> 'NoeudTrie':
+        """Retourne le fils par un symbole, en le créant si besoin."""
+        enfants = self.enfants
+        if enfants is None:
+            noeud = NoeudTrie()
+            self.enfants = (symbole, noeud)
+            return noeud
+        if type(enfants) is tuple:
+            if enfants[0] == symbole:
+                return enfants[1]
+            enfants = self.enfants = {enfants[0]: enfants[1]}
+        noeud = enfants.get(symbole)
+        if noeud is None:
+            noeud = enfants[symbole] = NoeudTrie()
+        return noeud
+
+    def paires(self) -> Iterable[Tuple[str, 'NoeudTrie']]:
+        """Retourne les couples (symbole, fils), sans ordre particulier."""
+        enfants = self.enfants
+        if type(enfants) is tuple:
+            return (enfants,)
+        return enfants.items() if enfants else ()
+
+    def fils_tries(self) -> List[Tuple[str, 'NoeudTrie']]:
+        """Retourne les fils par ordre de symbole."""
+        enfants = self.enfants
+        if type(enfants) is tuple:
+            return [enfants]
+        return sorted(enfants.items()) if enfants else []
+
+
+class TrieMots:
+    """
+    Ensemble fini de mots stocké en trie. Un trie des mots retournés est
+    maintenu à la demande pour les requêtes par suffixe et le quotient droit.
+    """
+
+    def __init__(self, mots: Iterable[str] = ()) -> None:
+        """
+        Initialise le trie.
+
+        Args:
+            mots: Mots à insérer
+        """
+        self.racine = NoeudTrie()
+        self.taille = 0
+        self._inverse: Optional['TrieMots'] = None
+        for mot in mots:
+            self.ajouter(mot)
+
+    def ajouter(self, mot: str) -> bool:
+        """Insère un mot ; retourne False s'il était déjà présent."""
+        noeud = self.racine
+        for symbole in mot:
+            noeud = noeud.fils_ou_nouveau(symbole)
+        if noeud.terminal:
+            return False
+        noeud.terminal = True
+        self.taille += 1
+        if self._inverse is not None:
+            self._inverse.ajouter(mot[::-1])
+        return True
+
+    def noeud(self, prefixe: str) -> Optional[NoeudTrie]:
+        """Retourne le nœud atteint en lisant le préfixe, None s'il n'existe pas."""
+        noeud = self.racine
+        for symbole in prefixe:
+            noeud = noeud.fils(symbole)
+            if noeud is None:
+                return None
+        return noeud
+
+    def __contains__(self, mot: str) -> bool:
+        noeud = self.noeud(mot)
+        return noeud is not None and noeud.terminal
+
+    def __len__(self) -> int:
+        return self.taille
+
+    def __iter__(self) -> Iterator[str]:
+        """Itère sur les mots par ordre lexicographique."""
+        return self._sous_mots(self.racine, "")
+
+    @staticmethod
+    def _sous_mots(depart: NoeudTrie, prefixe: str) -> Iterator[str]:
+        """Produit, par ordre lexicographique, les mots du sous-arbre d'un nœud."""
+        pile = [(depart, prefixe)]
+        while pile:
+            noeud, mot = pile.pop()
+            if noeud.terminal:
+                yield mot
+            for symbole, fils in reversed(noeud.fils_tries()):
+                pile.append((fils, mot + symbole))
+
+    def iterer_hierarchique(self) -> Iterator[str]:
+        """Itère sur les mots par ordre hiérarchique (parcours en largeur)."""
+        niveau = [(self.racine, "")]
+        while niveau:
+            suivant = []
+            for noeud, mot in niveau:
+                if noeud.terminal:
+                    yield mot
+                for symbole, fils in noeud.fils_tries():
+                    suivant.append((fils, mot + symbole))
+            niveau = suivant
+
+    def inverse(self) -> 'TrieMots':
+        """Retourne le trie des mots retournés, construit une fois puis tenu à jour."""
+        if self._inverse is None:
+            self._inverse = TrieMots(mot[::-1] for mot in self)
+        return self._inverse
+
+    def mots_avec_prefixe(self, prefixe: str) -> Iterator[str]:
+        """Produit les mots commençant par `prefixe`."""
+        noeud = self.noeud(prefixe)
+        return self._sous_mots(noeud, prefixe) if noeud is not None else iter(())
+
+    def mots_avec_suffixe(self, suffixe: str) -> Iterator[str]:
+        """Produit les mots finissant par `suffixe`, via le trie inversé."""
+        for mot in self.inverse().mots_avec_prefixe(suffixe[::-1]):
+            yield mot[::-1]
+
+    def copier(self) -> 'TrieMots':
+        """Retourne une copie indépendante du trie."""
+        copie = TrieMots()
+        copie.taille = self._fusionner(copie.racine, self.racine, True)
+        return copie
+
+    @staticmethod
+    def _fusionner(cible: NoeudTrie, source: NoeudTrie, avec_racine: bool) -> int:
+        """
+        Recopie le sous-arbre `source` dans `cible` ; retourne le nombre de
+        mots ajoutés. La marque terminale de la racine source n'est reportée
+        que si `avec_racine`.
+        """
+        ajoutes = 0
+        pile = [(cible, source, avec_racine)]
+        while pile:
+            vers, depuis, marquer = pile.pop()
+            if marquer and depuis.terminal and not vers.terminal:
+                vers.terminal = True
+                ajoutes += 1
+            for symbole, fils in depuis.paires():
+                pile.append((vers.fils_ou_nouveau(symbole), fils, True))
+        return ajoutes
+
+    def concatener(self, autre: 'TrieMots') -> 'TrieMots':
+        """
+        Retourne le trie du produit de concaténation : le trie `autre` est
+        greffé sous chaque fin de mot, sans construire de chaîne intermédiaire.
+        """
+        resultat = TrieMots()
+        pile = [(resultat.racine, self.racine)]
+        while pile:
+            vers, depuis = pile.pop()
+            if depuis.terminal:
+                # Fins de mot de self : la racine d'autre est terminale si ε ∈ autre
+                if autre.racine.terminal and not vers.terminal:
+                    vers.terminal = True
+                    resultat.taille += 1
+                resultat.taille += TrieMots._fusionner(vers, autre.racine, False)
+            for symbole, fils in depuis.paires():
+                pile.append((vers.fils_ou_nouveau(symbole), fils))
+        return resultat
+
+    def quotient_droit(self, autre: 'TrieMots') -> 'TrieMots':
+        """
+        Retourne le quotient droit {u | il existe v dans autre avec uv dans self},
+        par parcours synchrone des deux tries inversés.
+        """
+        resultat = TrieMots()
+        pile = [(self.inverse().racine, autre.inverse().racine)]
+        while pile:
+            noeud, noeud_autre = pile.pop()
+            if noeud_autre.terminal:
+                for reste in self._sous_mots(noeud, ""):
+                    resultat.ajouter(reste[::-1])
+            for symbole, fils_autre in noeud_autre.paires():
+                fils = noeud.fils(symbole)
+                if fils is not None:
+                    pile.append((fils, fils_autre))
+        return resultat
+
+    def fusionner(self, autre: 'TrieMots') -> int:
+        """Ajoute en place les mots d'un autre trie ; retourne le nombre de mots ajoutés."""
+        ajoutes = self._fusionner(self.racine, autre.racine, True)
+        self.taille += ajoutes
+        if ajoutes:
+            # Le trie inversé sera reconstruit à la demande
+            self._inverse = None
+        return ajoutes
+
+    def union(self, autre: 'TrieMots') -> 'TrieMots':
+        """Retourne le trie de l'union des deux ensembles."""
+        resultat = self.copier()
+        resultat.fusionner(autre)
+        return resultat
@@ -3,9 +3,14 @@ Module implémentant une interface simple pour tester les classes Mot et Langage
 """
 
 import cmd
+import time
 from Mot import Mot
 from Langage import Langage, LangageReconnaissable
 from Automate import AFND, AFDC, AFNS
+from Corpus import RapportCorpus, reconnaitre_corpus
+from Sauvegarde import charger_automate, sauver_automate
+from Chargement import FORMATS, TYPES, importer_automate
+from Instrumentation import INSTRUMENTATION
 
 class InterfaceMotLangage(cmd.Cmd):
     """Interface en ligne de commande pour tester les classes Mot et Langage."""
@@ -18,6 +23,23 @@ class InterfaceMotLangage(cmd.Cmd):
         self.mots = {}
         self.langages = {}
         self.automates = {}
+        self.chronometre = False
+        self._debut_commande = 0.0
+    
+    def precmd(self, line):
+        """Démarre le chronomètre de la commande (utilisé si le mode chronométré est actif)."""
+        self._debut_commande = time.perf_counter()
+        return line
+    
+    def postcmd(self, stop, line):
+        """Affiche (et enregistre si l'instrumentation est active) la durée de la commande."""
+        if self.chronometre and line.strip():
+            duree = time.perf_counter() - self._debut_commande
+            commande = line.split()[0]
+            if INSTRUMENTATION.actif:
+                INSTRUMENTATION.enregistrer_duree(f"commande.{commande}", duree)
+            print(f"[{commande}: {duree * 1000:.3f} ms]")
+        return stop
     
     def do_creer_mot(self, arg):
         """Crée un mot: creer_mot <nom> <contenu> [alphabet]"""
@@ -72,15 +94,16 @@ class InterfaceMotLangage(cmd.Cmd):
         print(f"Longueur de '{arg}': {self.mots[arg].longueur()}")
     
     def do_creer_langage(self, arg):
-        """Crée un langage: creer_langage <nom> <mot1> <mot2> ... [--alphabet a b c]"""
+        """Crée un langage: creer_langage <nom> <mot1> <mot2> ... [--trie] [--alphabet a b c]"""
         args = arg.split()
         if not args:
-            print("Usage: creer_langage <nom> <mot1> <mot2> ... [--alphabet a b c]")
+            print("Usage: creer_langage <nom> <mot1> <mot2> ... [--trie] [--alphabet a b c]")
             return
         
         nom = args[0]
         mots_args = []
         alphabet = None
+        stockage = "ensemble"
         i = 1
         
         # Traitement des arguments optionnels
@@ -88,7 +111,10 @@ class InterfaceMotLangage(cmd.Cmd):
             if args[i] == "--alphabet":
                 alphabet = set(args[i+1:])
                 break
-            mots_args.append(args[i])
+            if args[i] == "--trie":
+                stockage = "trie"
+            else:
+                mots_args.append(args[i])
             i += 1
         
         # Création des mots
@@ -103,7 +129,7 @@ class InterfaceMotLangage(cmd.Cmd):
                 self.mots[mot_str] = new_mot  # Stocke le mot pour réutilisation
                 mots.add(new_mot)
         
-        self.langages[nom] = Langage(mots, alphabet)
+        self.langages[nom] = Langage(mots, alphabet, stockage)
         print(f"Langage '{nom}' créé avec {len(mots)} mots.")
     
     def do_afficher_langage(self, arg):
@@ -142,7 +168,31 @@ class InterfaceMotLangage(cmd.Cmd):
         
         self.langages[resultat] = self.langages[nom1] + self.langages[nom2]
         print(f"Résultat de l'union enregistré dans '{resultat}'")
-    
+
+    def do_rechercher(self, arg):
+        """Cherche les mots d'un langage fini dans un fichier (Aho-Corasick): rechercher <langage> <fichier> [limite]"""
+        args = arg.split()
+        if len(args) not in (2, 3):
+            print("Usage: rechercher <langage> <fichier> [limite]")
+            return
+
+        nom, chemin = args[0], args[1]
+        if nom not in self.langages:
+            print(f"Langage '{nom}' non trouvé.")
+            return
+
+        try:
+            limite = int(args[2]) if len(args) == 3 else 20
+            nombre = 0
+            for position, mot in self.langages[nom].vers_aho_corasick().rechercher_fichier(chemin):
+                if nombre < limite:
+                    print(f"  {position}: {mot}")
+                nombre += 1
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            return
+        print(f"{nombre} occurrence(s) des mots de '{nom}' dans '{chemin}'")
+
     def do_quitter(self, arg):
         """Quitte l'interface: quitter"""
         print("Au revoir!")
@@ -234,6 +284,25 @@ class InterfaceMotLangage(cmd.Cmd):
         
         self.automates[nom].ajouter_transition(source, symbole, cible)
         print(f"Transition ajoutée: {source} --{symbole}--> {cible}")
+
+    def do_importer_automate(self, arg):
+        """Importe un automate depuis un fichier de transitions: importer_automate <nom> <type> <initial> <finaux> <fichier|-> [texte|csv]"""
+        args = arg.split()
+        if len(args) not in (5, 6):
+            print(f"Usage: importer_automate <nom> <type> <initial> <finaux> <fichier|-> [{'|'.join(FORMATS)}]")
+            print(f"Types disponibles: {', '.join(TYPES)}")
+            return
+        
+        nom, type_auto, initial, finaux, chemin = args[:5]
+        format_fichier = args[5] if len(args) == 6 else None
+        try:
+            automate = importer_automate(chemin, type_auto, initial, finaux.split(','), format_fichier=format_fichier)
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            return
+        self.automates[nom] = automate
+        nb_transitions = sum(len(cibles) for ligne in automate.transitions.values() for cibles in ligne.values())
+        print(f"Automate {type_auto.upper()} '{nom}' importé: {len(automate.etats)} états, {nb_transitions} transitions")
         
         
    
@@ -281,6 +350,75 @@ class InterfaceMotLangage(cmd.Cmd):
         else:
             print(f"Automate '{arg}' non trouvé")
 
+    def do_minimiser(self, arg):
+        """Minimise un automate déterministe: minimiser <source> <resultat>"""
+        args = arg.split()
+        if len(args) != 2:
+            print("Usage: minimiser <source> <resultat>")
+            return
+        
+        source, resultat = args
+        if source not in self.automates:
+            print(f"Automate '{source}' non trouvé")
+            return
+        if not isinstance(self.automates[source], AFDC):
+            print("Erreur: seul un AFD peut être minimisé")
+            return
+        
+        minimal = self.automates[source].minimiser()
+        self.automates[resultat] = minimal
+        print(f"Automate minimal enregistré dans '{resultat}' "
+              f"({len(self.automates[source].etats)} -> {len(minimal.etats)} états)")
+
+    def do_equivalents(self, arg):
+        """Teste si deux automates reconnaissent le même langage: equivalents <automate1> <automate2>"""
+        args = arg.split()
+        if len(args) != 2:
+            print("Usage: equivalents <automate1> <automate2>")
+            return
+        
+        nom1, nom2 = args
+        if nom1 not in self.automates or nom2 not in self.automates:
+            print("Un des automates n'existe pas.")
+            return
+        
+        egaux, mot = self.automates[nom1].equivalent(self.automates[nom2])
+        if egaux:
+            print(f"Les automates '{nom1}' et '{nom2}' sont équivalents")
+        else:
+            print(f"Les automates '{nom1}' et '{nom2}' diffèrent, par exemple sur le mot '{mot or 'ε'}'")
+
+    def do_moteur(self, arg):
+        """Choisit le moteur de simulation d'un automate: moteur <automate> <ensembles|bitset|paresseux> [budget_octets]"""
+        args = arg.split()
+        if len(args) not in (2, 3):
+            print(f"Usage: moteur <automate> <{'|'.join(AFND.MOTEURS)}> [budget_octets]")
+            return
+        
+        nom, moteur = args[0], args[1]
+        if nom not in self.automates:
+            print(f"Automate '{nom}' non trouvé")
+            return
+        
+        try:
+            budget = int(args[2]) if len(args) == 3 else None
+            self.automates[nom].choisir_moteur(moteur, budget)
+        except ValueError as e:
+            print(f"Erreur: {e}")
+            return
+        print(f"Automate '{nom}' simulé avec le moteur '{moteur}'")
+
+    def do_cache(self, arg):
+        """Affiche les compteurs du cache de déterminisation paresseuse: cache <automate>"""
+        if arg not in self.automates:
+            print(f"Automate '{arg}' non trouvé")
+            return
+        
+        stats = self.automates[arg].determinisation_paresseuse().statistiques()
+        print(f"Cache de l'automate '{arg}':")
+        for cle, valeur in stats.items():
+            print(f"  {cle}: {valeur}")
+
     def do_chemin_mot(self, arg):
         """Affiche le chemin pour un mot: chemin_mot <automate> <mot>"""
         args = arg.split()
@@ -296,7 +434,13 @@ class InterfaceMotLangage(cmd.Cmd):
             return
         
         accepte, chemin = self.automates[nom].reconnaitre_mot_avec_chemin(mot)
-        print(f"Chemin pour '{mot}':")
+        if accepte:
+            print(f"Calcul acceptant pour '{mot}':")
+        elif chemin or self.automates[nom].etat_initial in self.automates[nom].etats_finaux:
+            prefixe = ''.join(symbole for _, symbole, _ in chemin if symbole != 'ε')
+            print(f"Plus long préfixe reconnu de '{mot}': '{prefixe}'")
+        else:
+            print(f"Aucun préfixe de '{mot}' n'est reconnu")
         for step in chemin:
             print(f"{step[0]} --{step[1]}--> {step[2]}")
         print(f"Le mot est {'accepté' if accepte else 'rejeté'}")
@@ -320,6 +464,100 @@ class InterfaceMotLangage(cmd.Cmd):
         print(f"Le mot '{mot}' est {'reconnu' if resultat else 'non reconnu'} par l'automate '{nom}'")
      
         
+    def do_reconnaitre_fichier(self, arg):
+        """Reconnaît un fichier de mots (un par ligne) en parallèle: reconnaitre_fichier <automate> <chemin> [workers]"""
+        args = arg.split()
+        if len(args) not in (2, 3):
+            print("Usage: reconnaitre_fichier <automate> <chemin> [workers]")
+            return
+        
+        nom, chemin = args[0], args[1]
+        if nom not in self.automates:
+            print(f"Automate '{nom}' non trouvé")
+            return
+        
+        try:
+            workers = int(args[2]) if len(args) == 3 else None
+            rapport = RapportCorpus()
+            for _ in reconnaitre_corpus(self.automates[nom], chemin, workers, rapport=rapport):
+                pass
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            return
+        print(f"Fichier '{chemin}': {rapport}")
+
+    def do_sauver_automate(self, arg):
+        """Sauvegarde un automate au format binaire compilé: sauver_automate <automate> <chemin>"""
+        args = arg.split()
+        if len(args) != 2:
+            print("Usage: sauver_automate <automate> <chemin>")
+            return
+        
+        nom, chemin = args
+        if nom not in self.automates:
+            print(f"Automate '{nom}' non trouvé")
+            return
+        
+        try:
+            table = sauver_automate(self.automates[nom], chemin)
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            return
+        print(f"Automate '{nom}' sauvegardé dans '{chemin}' "
+              f"({len(table.etats)} états, {len(table.table)} entrées de table)")
+
+    def do_charger_automate(self, arg):
+        """Charge un automate sauvegardé (projection mémoire): charger_automate <nom> <chemin>"""
+        args = arg.split()
+        if len(args) != 2:
+            print("Usage: charger_automate <nom> <chemin>")
+            return
+        
+        nom, chemin = args
+        try:
+            self.automates[nom] = charger_automate(chemin)
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            return
+        print(f"Automate '{nom}' chargé depuis '{chemin}' ({len(self.automates[nom].etats)} états)")
+     
+        
+    def do_stats(self, arg):
+        """Instrumentation: stats [on|off|chrono on|off|profil on|off|reinitialiser|exporter <chemin>]"""
+        args = arg.split()
+        if not args:
+            print(INSTRUMENTATION)
+            return
+        
+        action = args[0]
+        if action in ("on", "off") and len(args) == 1:
+            if action == "on":
+                INSTRUMENTATION.activer()
+            else:
+                INSTRUMENTATION.desactiver()
+            print(f"Instrumentation {'activée' if action == 'on' else 'désactivée'}")
+        elif action == "chrono" and len(args) == 2 and args[1] in ("on", "off"):
+            self.chronometre = args[1] == "on"
+            print(f"Chronométrage des commandes {'activé' if self.chronometre else 'désactivé'}")
+        elif action == "profil" and len(args) == 2 and args[1] in ("on", "off"):
+            if args[1] == "on":
+                INSTRUMENTATION.demarrer_profil()
+            else:
+                INSTRUMENTATION.arreter_profil()
+            print(f"Profilage cProfile {'démarré' if args[1] == 'on' else 'suspendu'}")
+        elif action == "reinitialiser" and len(args) == 1:
+            INSTRUMENTATION.reinitialiser()
+            print("Mesures remises à zéro")
+        elif action == "exporter" and len(args) == 2:
+            try:
+                INSTRUMENTATION.exporter(args[1])
+            except (OSError, ValueError) as e:
+                print(f"Erreur: {e}")
+                return
+            print(f"Mesures exportées dans '{args[1]}'")
+        else:
+            print("Usage: stats [on|off|chrono on|off|profil on|off|reinitialiser|exporter <chemin.json|chemin.prof>]")
+        
     def do_help(self, arg):
         """Affiche l'aide: help [commande]"""
         if arg:
@@ -332,19 +570,32 @@ class InterfaceMotLangage(cmd.Cmd):
             print("  longueur_mot <nom> - Affiche la longueur d'un mot")
             
             print("\n=== Opérations sur les langages ===")
-            print("  creer_langage <nom> <mot1> <mot2> ... [--alphabet a b c] - Crée un langage")
+            print("  creer_langage <nom> <mot1> <mot2> ... [--trie] [--alphabet a b c] - Crée un langage")
             print("  afficher_langage <nom> - Affiche un langage")
             print("  taille <nom> - Affiche la taille du langage")
             print("  iteration <source> <resultat> - Étoile de Kleene d'un langage")
             print("  concatenation <nom1> <nom2> <resultat> - Concatène deux langages")
             print("  union <nom1> <nom2> <resultat> - Union de deux langages")
+            print("  rechercher <nom> <fichier> [limite] - Cherche les mots d'un langage fini dans un fichier (Aho-Corasick)")
             
             print("\n=== Commandes Automates ===")
             print("  creer_automate <nom> <type> <a,b> <q0,q1> <q0> <q1> <nombre de transistion> - Crée un automate")
             print("  reconnaitre_mot <nom> <mot> - Teste un mot")
             print("  chemin_mot <nom> <mot> - Affiche le chemin d'un mot")
+            print("  reconnaitre_fichier <nom> <chemin> [workers] - Reconnaît un fichier de mots en parallèle")
+            print("  minimiser <source> <resultat> - Minimise un AFD (Hopcroft)")
+            print("  equivalents <nom1> <nom2> - Teste l'équivalence de deux automates (Hopcroft-Karp)")
+            print("  moteur <nom> <ensembles|bitset|paresseux> [budget] - Choisit le moteur de simulation")
+            print("  cache <nom> - Affiche les succès/échecs du cache paresseux")
+            print("  importer_automate <nom> <type> <initial> <finaux> <fichier|-> [texte|csv] - Importe des transitions en masse")
+            print("  sauver_automate <nom> <chemin> - Sauvegarde un automate au format binaire")
+            print("  charger_automate <nom> <chemin> - Charge un automate sauvegardé")
             
             print("\n=== Général ===")
+            print("  stats [on|off] - Affiche ou active l'instrumentation")
+            print("  stats chrono <on|off> - Affiche la durée de chaque commande")
+            print("  stats profil <on|off> - Démarre ou suspend le profilage cProfile")
+            print("  stats exporter <chemin.json|chemin.prof> - Exporte les mesures")
             print("  quitter - Quitte l'interface")
             print("\nTapez 'help <commande>' pour plus d'informations sur une commande.")
             
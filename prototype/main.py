@@ -1,17 +1,51 @@
 """
 Programme principal pour tester les classes Mot et Langage.
+Sans argument, lance l'interface interactive ; avec --script <fichier>
+(ou "-" pour l'entrée standard), exécute les commandes du fichier.
 """
 
+import argparse
+import sys
+from typing import Iterable
+
 from interface import InterfaceMotLangage
 
+
+def executer_script(interface: InterfaceMotLangage, lignes: Iterable[str]) -> None:
+    """Exécute des commandes ligne par ligne, sans invite (# pour les commentaires)."""
+    interface.preloop()
+    for ligne in lignes:
+        ligne = ligne.strip()
+        if not ligne or ligne.startswith("#"):
+            continue
+        ligne = interface.precmd(ligne)
+        arret = interface.onecmd(ligne)
+        if interface.postcmd(arret, ligne):
+            break
+    interface.postloop()
+
+
 def main():
     """Fonction principale."""
+    parseur = argparse.ArgumentParser(description="Test des classes Mot et Langage")
+    parseur.add_argument("--script", metavar="FICHIER",
+                         help="exécute les commandes du fichier (- pour l'entrée standard)")
+    arguments = parseur.parse_args()
+    
+    interface = InterfaceMotLangage()
+    if arguments.script:
+        if arguments.script == "-":
+            executer_script(interface, sys.stdin)
+        else:
+            with open(arguments.script, encoding="utf-8") as fichier:
+                executer_script(interface, fichier)
+        return
+    
     print("Bienvenue dans le programme de test des classes Mot et Langage!")
     print("Lancement de l'interface en ligne de commande...\n")
     
     # Création et lancement de l'interface
-    interface = InterfaceMotLangage()
     interface.cmdloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()